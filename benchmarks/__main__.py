@@ -0,0 +1,46 @@
+import argparse
+import sys
+
+from .runner import DEFAULT_THRESHOLD, _format_time, compare, load, report, run, save
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Origametry micro-benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the benchmarks")
+    run_parser.add_argument("pattern", nargs="?", default="", help="regular expression to select cases")
+    run_parser.add_argument("--output", "-o", help="save the results to this JSON file")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--budget", type=float, default=0.2, help="seconds per repeat")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="relative slowdown counted as a regression (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.pattern, args.repeat, args.budget)
+
+        for name, seconds in results.items():
+            print(f"{name}  {_format_time(seconds)}")
+
+        if args.output:
+            save(results, args.output)
+
+        return 0
+
+    comparisons = compare(load(args.baseline), load(args.current), args.threshold)
+    print(report(comparisons))
+
+    # a non-zero exit code lets CI fail on regressions
+    return 1 if any(comparison.regression for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
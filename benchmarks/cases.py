@@ -0,0 +1,186 @@
+import subprocess
+import sys
+from functools import partial
+from math import inf
+from random import Random
+
+from src.origametry.fold import fold
+from src.origametry.helpers import projection
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.reflect import reflect
+from src.origametry.show import _find_bounding_box, _segments
+from src.origametry.transform import Transform
+
+# every benchmark by name, as a function that prepares its inputs and
+# returns the zero-argument callable to be timed
+CASES = {}
+
+
+def case(name, sizes=None):
+    """ register a setup function, once for each input size if there are any """
+
+    def register(setup):
+        if sizes is None:
+            CASES[name] = setup
+        else:
+            for size in sizes:
+                CASES[f"{name}[{size}]"] = partial(setup, size)
+
+        return setup
+
+    return register
+
+
+def _random_points(count, seed=0):
+    rng = Random(seed)
+
+    return [Point(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(count)]
+
+
+def _random_lines(count, seed=1):
+    points = _random_points(2 * count, seed)
+
+    return [Line(points[2 * i], points[2 * i + 1]) for i in range(count)]
+
+
+""" axioms """
+
+@case("fold.axiom_1")
+def _axiom_1():
+    p1, p2 = Point(0, 0), Point(3, 4)
+    return lambda: fold(p1, p1, p2, p2)
+
+@case("fold.axiom_2")
+def _axiom_2():
+    p1, p2 = Point(0, 1), Point(3, 5)
+    return lambda: fold(p1, p2)
+
+@case("fold.axiom_3")
+def _axiom_3():
+    line_1, line_2 = Line(1, 2, 3), Line(-2, 1, 1)
+    return lambda: fold(line_1, line_2)
+
+@case("fold.axiom_3_parallel")
+def _axiom_3_parallel():
+    line_1, line_2 = Line(1, 2, 3), Line(1, 2, -3)
+    return lambda: fold(line_1, line_2)
+
+@case("fold.axiom_4")
+def _axiom_4():
+    p, line = Point(1, 2), Line(1, -1, 3)
+    return lambda: fold(p, p, line, line)
+
+@case("fold.axiom_5")
+def _axiom_5():
+    p1, p2, line = Point(0, 0), Point(0, 2), Line(1, 0, -1)
+    return lambda: fold(p1, line, p2, p2)
+
+@case("fold.axiom_6")
+def _axiom_6():
+    p1, line_1 = Point(0, 0), Line(0, 1, 1)
+    p2, line_2 = Point(3, 1), Line(1, 0, -2)
+    return lambda: fold(p1, line_1, p2, line_2)
+
+@case("fold.axiom_7")
+def _axiom_7():
+    p, line_1, line_2 = Point(1, 3), Line(0, 1, 1), Line(1, 1, 0)
+    return lambda: fold(p, line_1, line_2, line_2)
+
+""" undocumented multi-condition cases """
+
+@case("fold.point_onto_point_through_point")
+def _point_onto_point_through_point():
+    p1, p2, p3 = Point(0, 0), Point(0, 2), Point(4, 1)
+    return lambda: fold(p1, p2, p3, p3)
+
+@case("fold.point_onto_point_and_point_onto_point")
+def _point_onto_point_and_point_onto_point():
+    p1, p2, p3, p4 = Point(0, 0), Point(0, 2), Point(5, 0), Point(5, 2)
+    return lambda: fold(p1, p2, p3, p4)
+
+@case("fold.point_onto_point_perpendicular_to_line")
+def _point_onto_point_perpendicular_to_line():
+    p1, p2, line = Point(1, 0), Point(3, 2), Line(1)
+    return lambda: fold(p1, p2, line, line)
+
+@case("fold.line_onto_line_through_point")
+def _line_onto_line_through_point():
+    line_1, line_2, p = Line(0), Line(inf), Point(1, 1)
+    return lambda: fold(line_1, line_2, p, p)
+
+@case("fold.point_onto_point_and_line_onto_line")
+def _point_onto_point_and_line_onto_line():
+    p1, p2, line_1, line_2 = Point(0, 2), Point(2, 0), Line(0), Line(inf)
+    return lambda: fold(p1, p2, line_1, line_2)
+
+@case("fold.point_onto_line_and_point_onto_point")
+def _point_onto_line_and_point_onto_point():
+    p1, line, p2, p3 = Point(0, 1), Line(0, 1, 1), Point(2, 0), Point(4, 0)
+    return lambda: fold(p1, line, p2, p3)
+
+@case("fold.point_onto_line_and_line_onto_line")
+def _point_onto_line_and_line_onto_line():
+    p, line_1, line_2, line_3 = Point(2, 0), Line(inf), Line(0), Line(1)
+    return lambda: fold(p, line_1, line_2, line_3)
+
+""" reflections, projections and intersections """
+
+@case("reflect.point")
+def _reflect_point():
+    p, crease = Point(1, 2), Line(1, -1, 3)
+    return lambda: reflect(p, crease)
+
+@case("reflect.line")
+def _reflect_line():
+    line, crease = Line(1, 2, 3), Line(1, -1, 3)
+    return lambda: reflect(line, crease)
+
+@case("helpers.projection")
+def _projection():
+    p, line = Point(1, 2), Line(1, -1, 3)
+    return lambda: projection(p, line)
+
+@case("line.intersection")
+def _intersection():
+    line_1, line_2 = Line(1, 2, 3), Line(-2, 1, 1)
+    return lambda: line_1.intersection(line_2)
+
+""" transforms """
+
+@case("transform.fold_points", sizes=(1, 1000, 100000))
+def _fold_points(size):
+    from src.origametry.point_array import PointArray
+
+    points = PointArray(_random_points(size))
+    creases = _random_lines(10, seed=2)
+
+    def run():
+        transform = Transform.identity()
+
+        for crease in creases:
+            transform = Transform.reflection(crease) @ transform
+
+        return transform.apply(points)
+
+    return run
+
+""" plotting """
+
+@case("show.find_bounding_box", sizes=(10, 50, 200))
+def _find_bounding_box_case(size):
+    points, lines = _random_points(size), _random_lines(size)
+    return lambda: _find_bounding_box(points, lines)
+
+@case("show.trim_to_box", sizes=(1, 100, 1000))
+def _trim_to_box_case(size):
+    lines = _random_lines(size)
+    return lambda: _segments(lines, (-10, -10, 10, 10))
+
+""" imports """
+
+@case("import.origametry")
+def _import_origametry():
+    # a fresh interpreter each time, so this includes its start-up as well
+    command = [sys.executable, "-c", "import src.origametry"]
+    return lambda: subprocess.run(command, check=True)
@@ -0,0 +1,103 @@
+import json
+import platform
+import re
+import timeit
+from typing import Dict, List, NamedTuple, Optional
+
+from .cases import CASES
+
+# relative slowdown above which a case counts as a regression
+DEFAULT_THRESHOLD = 0.1
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    regression: bool
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if self.baseline is None or self.current is None:
+            return None
+        return self.current / self.baseline
+
+
+def time_case(name: str, repeat: int = 5, budget: float = 0.2) -> float:
+    """
+    get the fastest time per call of a benchmark in seconds, taking the best of
+    `repeat` runs that each last roughly `budget` seconds
+    """
+
+    timer = timeit.Timer(CASES[name]())
+    number, elapsed = timer.autorange()
+
+    # scale the number of calls in each run to fill the time budget
+    number = max(1, int(number * budget / max(elapsed, 1e-9)))
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(pattern: str = "", repeat: int = 5, budget: float = 0.2) -> Dict[str, float]:
+    """ time every benchmark whose name matches a regular expression """
+
+    return {
+        name: time_case(name, repeat, budget)
+        for name in CASES
+        if re.search(pattern, name)
+    }
+
+
+def save(results: Dict[str, float], path: str):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"python": platform.python_version(), "results": results}, file, indent=2)
+
+
+def load(path: str) -> Dict[str, float]:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float = DEFAULT_THRESHOLD
+) -> List[Comparison]:
+    """ pair up the results of two runs, flagging cases that slowed down by more than `threshold` """
+
+    return [
+        Comparison(
+            name,
+            baseline.get(name),
+            current.get(name),
+            name in baseline and name in current and current[name] > baseline[name] * (1 + threshold),
+        )
+        for name in sorted(set(baseline) | set(current))
+    ]
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def report(comparisons: List[Comparison]) -> str:
+    """ a table of compared results, one case per line """
+
+    width = max((len(comparison.name) for comparison in comparisons), default=0)
+    lines = []
+
+    for comparison in comparisons:
+        ratio = "-" if comparison.ratio is None else f"{comparison.ratio:.2f}x"
+        flag = "  REGRESSION" if comparison.regression else ""
+
+        lines.append(
+            f"{comparison.name:<{width}}  {_format_time(comparison.baseline):>10}  "
+            f"{_format_time(comparison.current):>10}  {ratio:>7}{flag}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,48 @@
+from origametry import Construction, Point
+from origametry.helpers import distance
+
+
+def build_addition(a, b):
+
+    """ the construction of `origami_add` in `addition.py`, recorded step by step """
+
+    construction = Construction()
+
+    # setup
+    construction.input("a1", Point(0, 0))
+    construction.input("a2", Point(0, a))
+    construction.input("b1", Point(1, 0))
+    construction.input("b2", Point(1, b))
+
+    # connect end-to-end and mark reflected points
+    construction.fold("crease_1", "a1", "b2")
+    construction.reflect("c1", "a1", "crease_1")
+    construction.reflect("c2", "a2", "crease_1")
+
+    # fold line `c` onto line `b`, using axiom 5: c2 onto line_b and through c1
+    construction.fold("line_b", "b1", "b1", "b2", "b2")
+    construction.fold("creases", "c2", "line_b", "c1", "c1")
+    construction.item("crease_2", "creases", 0)
+    construction.item("crease_3", "creases", 1)
+
+    # one of d, e is addition and the other is subtraction
+    construction.reflect("d2", "c2", "crease_2")
+    construction.reflect("e2", "c2", "crease_3")
+
+    return construction
+
+
+def result(construction):
+    return max(
+        distance(construction["b1"], construction["d2"]),
+        distance(construction["b1"], construction["e2"]),
+    )
+
+
+if __name__ == "__main__":
+    construction = build_addition(2, 3)
+    print(result(construction))
+
+    # only the steps that depend on `a2` are folded again
+    print(construction.update(a2=Point(0, 4)))
+    print(result(construction))
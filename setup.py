@@ -17,7 +17,6 @@ setup(
         "matplotlib>=3.9.0",
         "multimethod>=1.11.2",
         "numpy>=1.26.4",
-        "sympy>=1.12",
     ],
     project_urls={
         "Documentation": "https://origametry.readthedocs.io/",
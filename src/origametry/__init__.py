@@ -1,5 +1,45 @@
+from .cache import FoldCache, caching, cache_info, clear_cache, disable_cache, enable_cache
+from .construction import Construction
 from .fold import fold
 from .line import Line
+from .metrics import MetricsRegistry, disable_metrics, enable_metrics, measuring
+from .parallel import fold_parallel
 from .point import Point
 from .reflect import reflect
-from .show import show
+from .show import render, render_many, show
+from .spatial import SpatialIndex
+from .svg import write_svg
+from .transform import Transform
+
+__all__ = [
+    "Closure", "Construction", "FoldCache", "caching", "cache_info", "clear_cache", "disable_cache", "enable_cache",
+    "fold", "fold_many", "fold_parallel", "Line", "LineArray", "MetricsRegistry", "disable_metrics", "enable_metrics",
+    "measuring", "Point", "PointArray", "reflect", "render", "render_many", "show", "SpatialIndex",
+    "Transform", "write_svg",
+]
+
+# names whose modules import NumPy, which are only loaded on first access
+_LAZY = {
+    "Closure": ".closure",
+    "fold_many": ".batch",
+    "LineArray": ".line_array",
+    "PointArray": ".point_array",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(_LAZY[name], __name__), name)
+
+    # cache the value, so that this is only called once per name
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
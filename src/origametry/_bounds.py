@@ -0,0 +1,266 @@
+import numpy as np
+from itertools import chain
+from typing import Optional
+
+from .line_array import _are_parallel, _gradients, _normal_forms
+from .point_array import is_close_array
+
+# Extents of the "points of interest" used to pick a bounding box for `show`,
+# each as an array `(min_x, min_y, max_x, max_y)`, or `None` if there are none.
+# None of these build the points themselves: they find the extremes directly.
+
+# number of pairs of points and lines (or of lines) to work on at once
+_BLOCK_SIZE = 1 << 20
+
+# largest difference between the unit normals of lines (in either component)
+# which puts them in the same cluster in `intersection_extent`, which is far
+# more than rounding can move them, and more than the tolerance of `are_parallel`
+_CLUSTER_GAP = 1e-8
+
+
+def _extent(x: np.ndarray, y: np.ndarray) -> Optional[np.ndarray]:
+    """ the extent of points, leaving out any that are not finite """
+
+    finite = np.isfinite(x) & np.isfinite(y)
+
+    if not finite.any():
+        return None
+
+    x, y = x[finite], y[finite]
+
+    return np.array([x.min(), y.min(), x.max(), y.max()])
+
+
+def combine(*extents: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """ the extent of several extents together """
+
+    extents = [extent for extent in extents if extent is not None]
+
+    if not extents:
+        return None
+
+    stacked = np.array(extents)
+
+    return np.concatenate((stacked[:, :2].min(axis=0), stacked[:, 2:].max(axis=0)))
+
+
+def point_extent(coordinates: np.ndarray) -> Optional[np.ndarray]:
+    return _extent(coordinates[:, 0], coordinates[:, 1]) if len(coordinates) else None
+
+
+def _intersect(coefficients: np.ndarray, first: np.ndarray, second: np.ndarray):
+    """
+    the intersections of the lines with indices `first` and `second`, worked
+    out in the same way as `Line.intersection`, with `nan` for parallel lines
+    """
+
+    nx, ny, offset = _normal_forms(coefficients).T
+
+    nx_1, ny_1, offset_1 = nx[first], ny[first], offset[first]
+    nx_2, ny_2, offset_2 = nx[second], ny[second], offset[second]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        determinant = nx_1 * ny_2 - nx_2 * ny_1
+
+        x = (ny_1 * offset_2 - ny_2 * offset_1) / determinant
+        y = (nx_2 * offset_1 - nx_1 * offset_2) / determinant
+
+    columns = (*coefficients.T, _gradients(coefficients))
+    parallel = _are_parallel(
+        tuple(column[first] for column in columns), tuple(column[second] for column in columns)
+    ) | (determinant == 0)
+
+    return np.where(parallel, np.nan, x), np.where(parallel, np.nan, y)
+
+
+def _normal_gaps(normals_1: np.ndarray, normals_2: np.ndarray) -> np.ndarray:
+    """ the largest difference between pairs of unit normals, pointing either way """
+
+    return np.minimum(np.abs(normals_1 - normals_2).max(axis=1), np.abs(normals_1 + normals_2).max(axis=1))
+
+
+def _cluster_pairs(ends: np.ndarray):
+    """
+    every pair of positions `i < j` in the same cluster or in neighbouring
+    clusters, for clusters of consecutive positions ending (exclusively) at
+    `ends`, as arrays of first and second positions a block at a time
+    """
+
+    n = ends[-1]
+    cluster = np.repeat(np.arange(len(ends)), np.diff(ends, prepend=0))
+
+    # each position goes with the rest of its own cluster and all of the next
+    limits = np.append(ends[1:], n)[cluster]
+    counts = limits - np.arange(n) - 1
+    totals = np.concatenate(([0], np.cumsum(counts)))
+
+    start = 0
+
+    while start < n:
+        stop = max(int(np.searchsorted(totals, totals[start] + _BLOCK_SIZE, side="right")) - 1, start + 1)
+
+        first = np.repeat(np.arange(start, stop), counts[start:stop])
+        offsets = np.arange(len(first)) - np.repeat(totals[start:stop] - totals[start], counts[start:stop])
+
+        yield first, first + 1 + offsets
+
+        start = stop
+
+
+def _product_pairs(first: np.ndarray, second: np.ndarray):
+    """ every pair of a position in `first` with one in `second`, a block at a time """
+
+    rows = max(1, _BLOCK_SIZE // len(second))
+
+    for start in range(0, len(first), rows):
+        block = first[start:start + rows]
+
+        yield np.repeat(block, len(second)), np.tile(second, len(block))
+
+
+def intersection_extent(coefficients: np.ndarray) -> Optional[np.ndarray]:
+    """
+    the extent of the intersections of every pair of lines
+
+    Left of the leftmost intersection, the lines never cross, so they are in the
+    same order as they are far to the left, i.e. in order of slope. The lines
+    which cross there are then next to each other in that order (or cross other
+    lines at the same point), so only neighbours need intersecting. The same
+    goes for the right, and for the bottom and top with the coordinates swapped.
+
+    Rounding can put lines with nearly equal slopes in the wrong order, and
+    `are_parallel` leaves out pairs which cross far away, so lines whose normals
+    are within `_CLUSTER_GAP` of the next are grouped into clusters, and every
+    pair within a cluster or neighbouring clusters is intersected. That is
+    `O(N log N)` unless many lines are nearly parallel. Vertical (or horizontal)
+    lines cross every other line at their own `x` (or `y`).
+    """
+
+    a, b, c = coefficients.T
+    normals = _normal_forms(coefficients)[:, :2]
+    extents = []
+
+    # left and right, then bottom and top, with the coordinates swapped
+    for axis, (along, across, offset) in enumerate(((a, b, c), (b, a, c))):
+        steep = across == 0
+        lines = np.flatnonzero(~steep)
+
+        if len(lines) > 1:
+            # as functions of this axis, the lines are `slope * t + intercept`
+            slope = -along[lines] / across[lines]
+            intercept = -offset[lines] / across[lines]
+
+            order = lines[np.lexsort((intercept, slope))]
+
+            gaps = _normal_gaps(normals[order[:-1]], normals[order[1:]])
+            ends = np.append(np.flatnonzero(gaps > _CLUSTER_GAP) + 1, len(order))
+
+            pairs = _cluster_pairs(ends)
+
+            # the steepest lines either way are close to each other, and may cross
+            if len(ends) > 2 and _normal_gaps(normals[order[:1]], normals[order[-1:]])[0] <= _CLUSTER_GAP:
+                pairs = chain(pairs, _product_pairs(np.arange(ends[0]), np.arange(ends[-2], ends[-1])))
+
+            for first, second in pairs:
+                extents.append(_extent(*_intersect(coefficients, order[first], order[second])))
+
+        # lines across this axis meet every line which is not parallel to them,
+        # which says nothing about the other coordinate
+        if steep.any() and not steep.all():
+            normal = normals[steep][:1]
+            others = normals[lines]
+
+            parallel = is_close_array(others, normal).all(axis=1) | is_close_array(others, -normal).all(axis=1)
+
+            if not parallel.all():
+                values = -offset[steep] / along[steep]
+                low, high = values.min(), values.max()
+
+                extents.append(np.array([low, np.inf, high, -np.inf] if axis == 0 else [np.inf, low, -np.inf, high]))
+
+    return combine(*extents)
+
+
+def intersection_quantiles(coefficients: np.ndarray, quantile: float) -> Optional[np.ndarray]:
+    """
+    the extent of the intersections of pairs of lines, leaving out the fraction
+    `quantile` of them beyond each side, from a fixed sample of pairs when
+    there are too many to intersect them all
+    """
+
+    n = len(coefficients)
+
+    if n * (n - 1) // 2 <= _BLOCK_SIZE:
+        first, second = np.triu_indices(n, k=1)
+    else:
+        # a line paired with itself is parallel, so is left out
+        first, second = np.random.default_rng(0).integers(n, size=(2, _BLOCK_SIZE))
+
+    x, y = _intersect(coefficients, first, second)
+
+    finite = np.isfinite(x) & np.isfinite(y)
+
+    if not finite.any():
+        return None
+
+    (min_x, max_x), (min_y, max_y) = np.quantile((x[finite], y[finite]), (quantile, 1 - quantile), axis=1).T
+
+    return np.array([min_x, min_y, max_x, max_y])
+
+
+def _hull(coordinates: np.ndarray) -> np.ndarray:
+    """ the corners of the convex hull of some points, by Andrew's monotone chain """
+
+    order = np.lexsort((coordinates[:, 1], coordinates[:, 0]))
+    points = coordinates[order].tolist()
+
+    if len(points) < 3:
+        return coordinates[order]
+
+    def chain(points):
+        corners = []
+
+        for x, y in points:
+            while len(corners) >= 2:
+                (x1, y1), (x2, y2) = corners[-2], corners[-1]
+
+                # drop the last corner unless the chain turns anticlockwise there
+                if (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1) > 0:
+                    break
+
+                corners.pop()
+
+            corners.append((x, y))
+
+        return corners[:-1]
+
+    return np.array(chain(points) + chain(reversed(points)), dtype=float).reshape(-1, 2)
+
+
+def projection_extent(coordinates: np.ndarray, coefficients: np.ndarray) -> Optional[np.ndarray]:
+    """
+    the extent of the projections of every point onto every line
+
+    A projection is linear in the point, so the extremes for each line are the
+    projections of corners of the convex hull of the points, and only those
+    are projected.
+    """
+
+    finite = np.isfinite(coordinates).all(axis=1)
+    corners = _hull(coordinates[finite])
+
+    if len(corners) == 0 or len(coefficients) == 0:
+        return None
+
+    nx, ny, offset = _normal_forms(coefficients).T
+    extents = []
+
+    rows = max(1, _BLOCK_SIZE // len(coefficients))
+
+    for start in range(0, len(corners), rows):
+        x, y = corners[start:start + rows, :1], corners[start:start + rows, 1:]
+
+        gap = nx * x + ny * y + offset
+        extents.append(_extent(x - gap * nx, y - gap * ny))
+
+    return combine(*extents)
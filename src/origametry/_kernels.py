@@ -0,0 +1,107 @@
+from math import hypot
+from typing import Optional, Tuple
+
+# Plain floating point geometry underneath `Point`, `Line`, `reflect` and `fold`.
+# Points are given as separate `x` and `y` values, and lines as tuples in the
+# normal form of `Line`, i.e. `nx x + ny y + offset = 0` with `(nx, ny)` a unit
+# vector. Nothing here creates a `Point` or `Line`, so the public classes can do
+# all of the arithmetic for an operation before building a single result.
+Form = Tuple[float, float, float]
+
+
+def normal_form(a: float, b: float, c: float) -> Form:
+    """
+    the coefficients scaled so that `(a, b)` is a unit vector, which points
+    along positive `x` (or positive `y` for a horizontal line)
+    """
+
+    norm = hypot(a, b)
+    nx, ny, offset = a / norm, b / norm, c / norm
+
+    if nx < 0 or (nx == 0 and ny < 0):
+        nx, ny, offset = -nx, -ny, -offset
+
+    # `+ 0.0` turns `-0.0` into `0.0`
+    return nx + 0.0, ny + 0.0, offset + 0.0
+
+
+def project(x: float, y: float, line: Form) -> Tuple[float, float]:
+    """ the closest point on a line to `(x, y)` """
+
+    nx, ny, offset = line
+
+    # move back along the unit normal by the signed distance from the line
+    gap = nx * x + ny * y + offset
+
+    return x - gap * nx, y - gap * ny
+
+
+def reflect_point(x: float, y: float, crease: Form) -> Tuple[float, float]:
+    """ the reflection of `(x, y)` across a crease """
+
+    nx, ny, offset = crease
+
+    gap = nx * x + ny * y + offset
+
+    return x - 2 * gap * nx, y - 2 * gap * ny
+
+
+def reflect_line(line: Form, crease: Form) -> Form:
+    """
+    the coefficients (with a unit normal, but not in normal form) of the
+    reflection of a line across a crease
+
+    A point `q` is on the reflected line when its own reflection is on the line,
+    i.e. `n.(q - 2 (u.q + e) u) + d = 0` for the line `n.p + d = 0` and the
+    crease `u.p + e = 0`, which is itself linear in `q`.
+    """
+
+    nx, ny, offset = line
+    ux, uy, crease_offset = crease
+
+    cosine = nx * ux + ny * uy
+
+    return nx - 2 * cosine * ux, ny - 2 * cosine * uy, offset - 2 * cosine * crease_offset
+
+
+def intersect(line_1: Form, line_2: Form) -> Optional[Tuple[float, float]]:
+    """ the point where two lines cross, or `None` if they are exactly parallel """
+
+    nx_1, ny_1, offset_1 = line_1
+    nx_2, ny_2, offset_2 = line_2
+
+    # Cramer's rule, which needs no special case for vertical lines
+    determinant = nx_1 * ny_2 - nx_2 * ny_1
+
+    if determinant == 0:
+        return None
+
+    return (
+        (ny_1 * offset_2 - ny_2 * offset_1) / determinant,
+        (nx_2 * offset_1 - nx_1 * offset_2) / determinant,
+    )
+
+
+def perpendicular(line: Form, x: float, y: float) -> Form:
+    """ the coefficients of the line through `(x, y)` perpendicular to a line """
+
+    nx, ny, _ = line
+
+    # the direction of the line, a quarter turn from its normal, is the new normal
+    dx, dy = -ny, nx
+
+    return dx, dy, -(dx * x + dy * y)
+
+
+def point_distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    """ the Euclidean distance between two points """
+
+    return hypot(x1 - x2, y1 - y2)
+
+
+def line_distance(x: float, y: float, line: Form) -> float:
+    """ the shortest distance from `(x, y)` to a line """
+
+    nx, ny, offset = line
+
+    return abs(nx * x + ny * y + offset)
@@ -0,0 +1,349 @@
+import numpy as np
+from typing import NamedTuple
+
+from .line_array import LineArray, _are_parallel, _normal_forms
+from .point_array import PointArray, is_close_array
+from .helpers import ABS_TOL
+
+
+class FoldResult(NamedTuple):
+
+    """
+    Creases found by `fold_many` for N rows of inputs.
+
+    lines: every crease, grouped by input row in order
+    counts: number of creases for each input row, shape (N,)
+    index: input row of each crease, shape (len(lines),)
+    degenerate: rows that define infinitely many creases (where `fold`
+        would raise a `ValueError`), shape (N,)
+    """
+
+    lines: LineArray
+    counts: np.ndarray
+    index: np.ndarray
+    degenerate: np.ndarray
+
+
+def _unit_normals(lines: LineArray):
+    """ coefficients of every line in the normal form of `Line.normal` and `Line.offset` """
+
+    return tuple(_normal_forms(lines.coefficients).T)
+
+
+def _points_equal(x1, y1, x2, y2) -> np.ndarray:
+    return is_close_array(x1, x2) & is_close_array(y1, y2)
+
+
+def _on_lines(x, y, nx, ny, e) -> np.ndarray:
+    """ row-wise version of `Point.isOn` for lines with unit normals """
+
+    offset = nx * x + ny * y + e
+
+    return _points_equal(x, y, x - offset * nx, y - offset * ny)
+
+
+def _crease(nx, ny, x, y) -> np.ndarray:
+    """ coefficients of the creases with normals `(nx, ny)` through the points `(x, y)` """
+
+    return np.stack((nx, ny, -(nx * x + ny * y)), axis=-1)
+
+
+def _bisector(x1, y1, x2, y2) -> np.ndarray:
+    """ coefficients of the creases placing `(x1, y1)` onto `(x2, y2)` """
+
+    dx, dy = x2 - x1, y2 - y1
+    norm = np.hypot(dx, dy)
+
+    return _crease(dx / norm, dy / norm, (x1 + x2) / 2, (y1 + y2) / 2)
+
+
+def _axiom_1(points1: PointArray, points2: PointArray):
+    """ crease through two points """
+
+    degenerate = _points_equal(points1.x, points1.y, points2.x, points2.y)
+
+    dx, dy = points2.x - points1.x, points2.y - points1.y
+    norm = np.hypot(dx, dy)
+
+    coefficients = _crease(-dy / norm, dx / norm, points1.x, points1.y)
+
+    return coefficients[:, np.newaxis], np.ones((len(points1), 1), dtype=bool), degenerate
+
+
+def _axiom_2(points1: PointArray, points2: PointArray):
+    """ point onto point """
+
+    degenerate = _points_equal(points1.x, points1.y, points2.x, points2.y)
+
+    coefficients = _bisector(points1.x, points1.y, points2.x, points2.y)
+
+    return coefficients[:, np.newaxis], np.ones((len(points1), 1), dtype=bool), degenerate
+
+
+def _axiom_3(lines1: LineArray, lines2: LineArray):
+    """ line onto line """
+
+    degenerate = lines1 == lines2
+    parallel = _are_parallel(lines1._columns(), lines2._columns())
+
+    nx1, ny1, e1 = _unit_normals(lines1)
+    nx2, ny2, e2 = _unit_normals(lines2)
+
+    # parallel lines: the crease is midway between them, once both normals face the same way
+    sign = np.where(nx1 * nx2 + ny1 * ny2 < 0, -1, 1)
+    midline = np.stack((nx1, ny1, (e1 + sign * e2) / 2), axis=-1)
+
+    # otherwise there are two creases along the angle bisectors, given by
+    # (n1.x + e1) = ± (n2.x + e2) in the same order as `fold`
+    bisectors = np.stack((
+        np.stack((nx1 - nx2, ny1 - ny2, e1 - e2), axis=-1),
+        np.stack((nx1 + nx2, ny1 + ny2, e1 + e2), axis=-1),
+    ), axis=1)
+
+    norm = np.hypot(bisectors[..., 0], bisectors[..., 1])[..., np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bisectors /= norm
+
+    coefficients = np.where(
+        parallel[:, np.newaxis, np.newaxis],
+        np.stack((midline, midline), axis=1),
+        bisectors,
+    )
+    exists = np.stack((np.ones_like(parallel), ~parallel), axis=-1)
+
+    return coefficients, exists, degenerate
+
+
+def _axiom_4(points1: PointArray, lines1: LineArray):
+    """ through point and perpendicular to line """
+
+    nx, ny, _ = _unit_normals(lines1)
+
+    # the normal of the crease is the direction of the line
+    coefficients = _crease(-ny, nx, points1.x, points1.y)
+
+    return (
+        coefficients[:, np.newaxis],
+        np.ones((len(points1), 1), dtype=bool),
+        np.zeros(len(points1), dtype=bool),
+    )
+
+
+def _axiom_5(points1: PointArray, lines1: LineArray, points2: PointArray):
+    """ point onto line and through point """
+
+    nx, ny, e = _unit_normals(lines1)
+    x1, y1, x2, y2 = points1.x, points1.y, points2.x, points2.y
+
+    degenerate = _on_lines(x1, y1, nx, ny, e)
+    trivial = _points_equal(x1, y1, x2, y2)
+
+    # `p1` lands where the line meets the circle centred on `p2` through `p1`
+    radius = np.hypot(x1 - x2, y1 - y2)
+    offset = nx * x2 + ny * y2 + e
+
+    # foot of the perpendicular from `p2` to the line
+    foot_x = x2 - offset * nx
+    foot_y = y2 - offset * ny
+
+    tangent = is_close_array(radius, np.abs(offset))
+    half_chord = np.sqrt(np.maximum(radius ** 2 - offset ** 2, 0))
+    half_chord[tangent] = 0
+
+    # two landing points either side of the foot, along the direction of the line
+    landing_x = foot_x[:, np.newaxis] + np.outer(half_chord, (-1, 1)) * -ny[:, np.newaxis]
+    landing_y = foot_y[:, np.newaxis] + np.outer(half_chord, (-1, 1)) * nx[:, np.newaxis]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coefficients = _bisector(x1[:, np.newaxis], y1[:, np.newaxis], landing_x, landing_y)
+
+    crosses = ~trivial & (tangent | (radius > np.abs(offset)))
+    exists = np.stack((crosses, crosses & ~tangent), axis=-1)
+
+    return coefficients, exists, degenerate
+
+
+# directions tried as the point at infinity of the parametrisation in `_axiom_6`
+_ANGLES = np.arange(4) * np.pi / 4
+
+# sample parameters and the matrix that recovers cubic coefficients from them
+_SAMPLES = np.array([-1., 0., 1., 2.])
+_INVERSE_VANDERMONDE = np.linalg.inv(np.vander(_SAMPLES, 4))
+
+
+def _axiom_6(points1: PointArray, lines1: LineArray, points2: PointArray, lines2: LineArray):
+    """ point onto line and point onto line """
+
+    nx1, ny1, e1 = _unit_normals(lines1)
+    nx2, ny2, e2 = _unit_normals(lines2)
+    x1, y1, x2, y2 = points1.x, points1.y, points2.x, points2.y
+
+    degenerate = (
+        _on_lines(x1, y1, nx1, ny1, e1) |
+        _on_lines(x2, y2, nx2, ny2, e2) |
+        (_points_equal(x1, y1, x2, y2) & (lines1 == lines2))
+    )
+
+    # see `fold` for the derivation: a crease with normal `u` is a common tangent when
+    # |u|^2 * (d2 * (n1.u) - d1 * (n2.u)) - 2 * ((p2 - p1).u) * (n1.u) * (n2.u) = 0
+    d1 = nx1 * x1 + ny1 * y1 + e1
+    d2 = nx2 * x2 + ny2 * y2 + e2
+    dx, dy = x2 - x1, y2 - y1
+
+    def cubic(ux, uy):
+        k1 = nx1 * ux + ny1 * uy
+        k2 = nx2 * ux + ny2 * uy
+        return (ux ** 2 + uy ** 2) * (d2 * k1 - d1 * k2) - 2 * (dx * ux + dy * uy) * k1 * k2
+
+    # parametrise `u = t * v + v'` (with `v'` perpendicular to `v`) where the direction
+    # `v` is chosen per row so that it is furthest from being a root, i.e. the cubic
+    # in `t` has the largest leading coefficient and no roots at infinity
+    leading = np.stack([cubic(np.cos(angle), np.sin(angle)) for angle in _ANGLES], axis=-1)
+    angle = _ANGLES[np.argmax(np.abs(leading), axis=-1)]
+    vx, vy = np.cos(angle), np.sin(angle)
+
+    # recover the coefficients of the cubic in `t` from its values at a few samples
+    samples = np.stack([cubic(t * vx - vy, t * vy + vx) for t in _SAMPLES], axis=-1)
+    coefficients = samples @ _INVERSE_VANDERMONDE.T
+
+    # find the roots of every cubic at once as eigenvalues of its companion matrix
+    solvable = ~degenerate & (coefficients[:, 0] != 0)
+    monic = coefficients[:, 1:] / np.where(solvable, coefficients[:, 0], 1)[:, np.newaxis]
+
+    companion = np.zeros((len(monic), 3, 3))
+    companion[:, 0, :] = -monic
+    companion[:, 1, 0] = companion[:, 2, 1] = 1
+    companion[~solvable] = 0
+
+    roots = np.linalg.eigvals(companion)
+
+    # keep the (nearly) real roots and merge any repeated roots split by floating-point error
+    tolerance = 1e-6 * (1 + np.abs(roots))
+    real = np.sort(np.where(np.abs(roots.imag) <= tolerance, roots.real, np.inf), axis=-1)
+
+    with np.errstate(invalid="ignore"):
+        gap = np.abs(np.diff(real, axis=-1)) <= 1e-6 * (1 + np.abs(real[:, 1:]))
+
+    gap &= np.isfinite(real[:, 1:])
+
+    triple = gap[:, 0] & gap[:, 1]
+    real[:, 0] = np.where(triple, real.mean(axis=-1), np.where(gap[:, 0], real[:, :2].mean(axis=-1), real[:, 0]))
+    real[:, 1] = np.where(gap[:, 1] & ~gap[:, 0], real[:, 1:].mean(axis=-1), real[:, 1])
+    real[:, 1][gap[:, 0]] = np.inf
+    real[:, 2][gap[:, 1]] = np.inf
+
+    exists = solvable[:, np.newaxis] & np.isfinite(real)
+    t = np.where(exists, real, 0)
+
+    ux = t * vx[:, np.newaxis] - vy[:, np.newaxis]
+    uy = t * vy[:, np.newaxis] + vx[:, np.newaxis]
+    norm = np.hypot(ux, uy)
+    ux, uy = ux / norm, uy / norm
+
+    # recover the offset from whichever condition is better conditioned
+    k1 = nx1[:, np.newaxis] * ux + ny1[:, np.newaxis] * uy
+    k2 = nx2[:, np.newaxis] * ux + ny2[:, np.newaxis] * uy
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(
+            np.abs(k1) >= np.abs(k2),
+            d1[:, np.newaxis] / (2 * k1) - (ux * x1[:, np.newaxis] + uy * y1[:, np.newaxis]),
+            d2[:, np.newaxis] / (2 * k2) - (ux * x2[:, np.newaxis] + uy * y2[:, np.newaxis]),
+        )
+
+    # with parallel directrices the cubic has a spurious root perpendicular to both
+    exists &= (np.abs(k1) > ABS_TOL) | (np.abs(k2) > ABS_TOL)
+
+    return np.stack((ux, uy, offset), axis=-1), exists, degenerate
+
+
+def _axiom_7(points1: PointArray, lines1: LineArray, lines2: LineArray):
+    """ point onto line and perpendicular to line """
+
+    nx1, ny1, e1 = _unit_normals(lines1)
+    nx2, ny2, _ = _unit_normals(lines2)
+    x, y = points1.x, points1.y
+
+    degenerate = _on_lines(x, y, nx1, ny1, e1)
+    parallel = _are_parallel(lines1._columns(), lines2._columns())
+
+    # the crease is perpendicular to `lines2`, so its normal `m` is the direction of `lines2`
+    mx, my = -ny2, nx2
+
+    # reflecting `p` moves it along `m` until it reaches `lines1`:
+    # n1.p + e1 = 2 * (m.p + w) * (n1.m)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = (nx1 * x + ny1 * y + e1) / (2 * (nx1 * mx + ny1 * my)) - (mx * x + my * y)
+
+    coefficients = np.stack((mx, my, offset), axis=-1)
+
+    return coefficients[:, np.newaxis], ~parallel[:, np.newaxis], degenerate
+
+
+_AXIOMS = {
+    1: (_axiom_1, ("points1", "points2")),
+    2: (_axiom_2, ("points1", "points2")),
+    3: (_axiom_3, ("lines1", "lines2")),
+    4: (_axiom_4, ("points1", "lines1")),
+    5: (_axiom_5, ("points1", "lines1", "points2")),
+    6: (_axiom_6, ("points1", "lines1", "points2", "lines2")),
+    7: (_axiom_7, ("points1", "lines1", "lines2")),
+}
+
+
+def fold_many(axiom: int, **arrays) -> FoldResult:
+    """
+    solve many instances of a single axiom at once
+
+    Each keyword is a column of inputs, given as a `PointArray` or `LineArray`,
+    a list of `Point` or `Line` objects, or an `(N, 2)` or `(N, 3)` array:
+
+    1. points1, points2 - crease through both points
+    2. points1, points2 - fold `points1` onto `points2`
+    3. lines1, lines2 - fold `lines1` onto `lines2`
+    4. points1, lines1 - crease through `points1` perpendicular to `lines1`
+    5. points1, lines1, points2 - fold `points1` onto `lines1` through `points2`
+    6. points1, lines1, points2, lines2 - fold `points1` onto `lines1` and `points2` onto `lines2`
+    7. points1, lines1, lines2 - fold `points1` onto `lines1` perpendicular to `lines2`
+
+    Only the standard form of each axiom is supported, not the additional
+    combinations of conditions accepted by `fold`.
+    """
+
+    try:
+        kernel, names = _AXIOMS[axiom]
+    except KeyError:
+        raise ValueError(f"There is no axiom {axiom!r}, expected one of 1 to 7") from None
+
+    if set(arrays) != set(names):
+        raise TypeError(f"Axiom {axiom} takes the arguments {names}, not {tuple(arrays)}")
+
+    inputs = [
+        PointArray(arrays[name]) if name.startswith("points") else LineArray(arrays[name])
+        for name in names
+    ]
+
+    if len({len(column) for column in inputs}) > 1:
+        raise ValueError("All input arrays must have the same length")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coefficients, exists, degenerate = kernel(*inputs)
+
+    # round any floating point errors to zero before scaling in the same way as `Line`
+    coefficients[np.abs(coefficients) <= ABS_TOL] = 0
+
+    # nearly parallel inputs can give creases which are not finite or have no direction
+    valid = np.isfinite(coefficients).all(axis=2) & (coefficients[..., :2] != 0).any(axis=2)
+
+    exists = exists & valid & ~degenerate[:, np.newaxis]
+    creases = coefficients[exists]
+
+    index, _ = np.nonzero(exists)
+
+    return FoldResult(
+        lines=LineArray(creases),
+        counts=exists.sum(axis=1),
+        index=index,
+        degenerate=degenerate,
+    )
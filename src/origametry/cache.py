@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Optional
+
+from .metrics import count
+
+# exceptions which are a result of folding (e.g. "infinitely many creases")
+# rather than a misuse of it, so they are cached like any other outcome
+_CACHED_EXCEPTIONS = (ValueError,)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Raised:
+
+    """ marks a cached exception, so that it is raised again on every hit """
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class FoldCache:
+
+    """
+    A bounded store of results for `fold` and `reflect`, which evicts the least
+    recently used result once `maxsize` is reached.
+
+    Keys hold the `Point` and `Line` arguments themselves (in the canonical order
+    of their axiom), so lookups use their tolerance-aware hashing and equality
+    and a result is shared between arguments that compare equal.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("The maximum size of a cache must be at least 1")
+
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def call(self, key, function, *args):
+        """ get the cached outcome for `key`, calling `function(*args)` on a miss """
+
+        try:
+            outcome = self._entries[key]
+
+        except KeyError:
+            self._misses += 1
+            count("origametry_cache_lookups_total", result="miss")
+
+            try:
+                outcome = function(*args)
+            except _CACHED_EXCEPTIONS as exception:
+                outcome = _Raised(exception)
+
+            self._entries[key] = outcome
+
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        else:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            count("origametry_cache_lookups_total", result="hit")
+
+        if isinstance(outcome, _Raised):
+            raise outcome.exception.with_traceback(None)
+
+        # lists of creases are mutable, so every caller gets a copy of their own
+        return list(outcome) if isinstance(outcome, list) else outcome
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self):
+        """ remove every result and reset the statistics """
+
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# the cache used by `fold` and `reflect`, if any (caching is opt-in)
+_active: Optional[FoldCache] = None
+
+
+def active_cache() -> Optional[FoldCache]:
+    return _active
+
+
+def enable_cache(maxsize: int = 1024) -> FoldCache:
+    """ start caching every call to `fold` and `reflect` in a new cache """
+
+    global _active
+    _active = FoldCache(maxsize)
+
+    return _active
+
+
+def disable_cache():
+    global _active
+    _active = None
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """ statistics of the active cache, or `None` when caching is disabled """
+
+    return None if _active is None else _active.info()
+
+
+def clear_cache():
+    if _active is not None:
+        _active.clear()
+
+
+@contextmanager
+def caching(maxsize: int = 1024, cache: Optional[FoldCache] = None) -> Iterator[FoldCache]:
+    """
+    cache calls to `fold` and `reflect` within a `with` block, using either the
+    given cache or a new one, and restore the previous cache (if any) on exit
+    """
+
+    global _active
+    previous = _active
+    _active = cache if cache is not None else FoldCache(maxsize)
+
+    try:
+        yield _active
+    finally:
+        _active = previous
@@ -0,0 +1,364 @@
+import numpy as np
+from math import prod
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .batch import fold_many
+from .line import Line
+from .line_array import LineArray, _intersect, _normal_forms
+from .point import Point
+from .point_array import PointArray, unique_indices
+
+# number of combinations passed to `fold_many` at once, to bound the memory use
+_CHUNK_SIZE = 1 << 16
+
+# the kind of each argument of every axiom, in the order of `fold_many`
+_ROLES = {
+    1: ("point", "point"),
+    2: ("point", "point"),
+    3: ("line", "line"),
+    4: ("point", "line"),
+    5: ("point", "line", "point"),
+    6: ("point", "line", "point", "line"),
+    7: ("point", "line", "line"),
+}
+
+
+def _is_canonical(axiom: int, combinations: np.ndarray) -> np.ndarray:
+    """
+    mask of the combinations to keep, dropping one of each symmetric pair (e.g.
+    the crease through points `i` and `j` is the same as through `j` and `i`)
+    and combinations which repeat an element where that can never give a crease
+    """
+
+    columns = combinations.T
+
+    if axiom in (1, 2, 3):
+        return columns[0] < columns[1]
+    if axiom == 5:
+        return columns[0] != columns[2]
+    if axiom == 6:
+        p1, l1, p2, l2 = columns
+        return (p1 < p2) | ((p1 == p2) & (l1 < l2))
+    if axiom == 7:
+        return columns[1] != columns[2]
+
+    return np.ones(len(combinations), dtype=bool)
+
+
+def _blocks(roles: Tuple[str, ...], old: dict, total: dict) -> List[Tuple[np.ndarray, Tuple[int, ...]]]:
+    """
+    split the combinations that use at least one new element into disjoint
+    blocks of the form `(starts, lengths)`, one for each position of the
+    first new element: earlier positions take old elements only, and later
+    positions take any element
+    """
+
+    blocks = []
+
+    for first_new, kind in enumerate(roles):
+        starts, lengths = [], []
+
+        for position, other in enumerate(roles):
+            if position < first_new:
+                starts.append(0)
+                lengths.append(old[other])
+            elif position == first_new:
+                starts.append(old[kind])
+                lengths.append(total[kind] - old[kind])
+            else:
+                starts.append(0)
+                lengths.append(total[other])
+
+        if prod(lengths) > 0:
+            blocks.append((np.array(starts), tuple(lengths)))
+
+    return blocks
+
+
+def _combinations(blocks, limit: Optional[int]) -> Iterator[np.ndarray]:
+    """ generate index arrays for up to `limit` combinations from `_blocks`, in chunks """
+
+    remaining = limit
+
+    for starts, lengths in blocks:
+        count = prod(lengths) if remaining is None else min(prod(lengths), remaining)
+
+        for start in range(0, count, _CHUNK_SIZE):
+            flat = np.arange(start, min(start + _CHUNK_SIZE, count))
+
+            yield np.column_stack(np.unravel_index(flat, lengths)) + starts
+
+        if remaining is not None:
+            remaining -= count
+
+
+class Origin(NamedTuple):
+
+    """
+    How an element of a `Closure` was found.
+
+    level: 0 for the seed elements, otherwise the level of the closure
+    axiom: the axiom which gave a line, or `None` for seeds and intersections
+    points: indices of the points used, in the order of `fold_many`
+    lines: indices of the lines used (the two intersecting lines for a point)
+    """
+
+    level: int
+    axiom: Optional[int]
+    points: Tuple[int, ...]
+    lines: Tuple[int, ...]
+
+
+class Level(NamedTuple):
+
+    """
+    The result of one level of a `Closure`.
+
+    points, lines: indices of the new elements in `Closure.points` and `Closure.lines`
+    truncated: whether the budget ran out before every combination was tried
+    """
+
+    number: int
+    points: np.ndarray
+    lines: np.ndarray
+    truncated: bool
+
+
+class Closure:
+
+    """
+    Every point and line that can be reached from a set of seeds by folding.
+
+    Each call to `expand` adds one level: the creases from every axiom applied
+    to every combination of the known points and lines which uses at least one
+    element from the previous level, followed by the intersections of the new
+    lines with every line. New elements are de-duplicated against all known
+    elements within the usual tolerance, and the origin of each is recorded so
+    that its sequence of folds can be recovered with `history`.
+    """
+
+    def __init__(self, points: Iterable[Point] = (), lines: Iterable[Line] = ()):
+        points = PointArray(list(points)).unique()
+        lines = LineArray(list(lines)).unique()
+
+        self._points = points.coordinates
+        self._lines = lines.coefficients
+        self._level = 0
+
+        # the origin of every element, where -1 pads unused indices
+        self._point_level = np.zeros(len(points), dtype=np.int64)
+        self._point_lines = np.full((len(points), 2), -1, dtype=np.int64)
+
+        self._line_level = np.zeros(len(lines), dtype=np.int64)
+        self._line_axiom = np.zeros(len(lines), dtype=np.int64)
+        self._line_points = np.full((len(lines), 2), -1, dtype=np.int64)
+        self._line_lines = np.full((len(lines), 2), -1, dtype=np.int64)
+
+        # elements from before the previous level, whose combinations are all done,
+        # and the number of lines whose intersections with each other are done
+        self._old = {"point": 0, "line": 0}
+        self._intersected = 0
+
+    @property
+    def points(self) -> PointArray:
+        return PointArray(self._points)
+
+    @property
+    def lines(self) -> LineArray:
+        return LineArray(self._lines)
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    def expand(self, fold_budget: Optional[int] = None, intersection_budget: Optional[int] = None) -> Level:
+        """
+        add one level to the closure, trying at most `fold_budget` combinations
+        of elements with the axioms and `intersection_budget` pairs of lines
+        """
+
+        start = {"point": len(self._points), "line": len(self._lines)}
+        self._level += 1
+
+        new_lines, folds_truncated = self._fold(self._old, start, fold_budget)
+
+        # intersect the new lines (and any seed lines) with every line, including each other
+        new_points, intersections_truncated = self._intersect(
+            {"line": self._intersected}, {"line": len(self._lines)}, intersection_budget
+        )
+
+        self._old = start
+        self._intersected = len(self._lines)
+
+        return Level(self._level, new_points, new_lines, folds_truncated or intersections_truncated)
+
+    def run(self, levels: int, **budgets) -> List[Level]:
+        """ add several levels, with the same budgets as `expand` for each """
+
+        return [self.expand(**budgets) for _ in range(levels)]
+
+    def origin(self, kind: str, index: int) -> Origin:
+        """ how the point or line (`kind` is "point" or "line") with this index was found """
+
+        if kind == "point":
+            lines = tuple(int(i) for i in self._point_lines[index] if i >= 0)
+            return Origin(int(self._point_level[index]), None, (), lines)
+
+        if kind == "line":
+            axiom = int(self._line_axiom[index]) or None
+            points = tuple(int(i) for i in self._line_points[index] if i >= 0)
+            lines = tuple(int(i) for i in self._line_lines[index] if i >= 0)
+            return Origin(int(self._line_level[index]), axiom, points, lines)
+
+        raise ValueError(f'Expected "point" or "line", not {kind!r}')
+
+    def history(self, kind: str, index: int) -> List[Tuple[str, int, Origin]]:
+        """
+        every element needed to construct the given point or line, as tuples of
+        `(kind, index, origin)` where each element comes after those it uses
+        """
+
+        steps = []
+        visited = set()
+
+        def visit(kind, index):
+            if (kind, index) in visited:
+                return
+
+            visited.add((kind, index))
+            origin = self.origin(kind, index)
+
+            for point in origin.points:
+                visit("point", point)
+            for line in origin.lines:
+                visit("line", line)
+
+            steps.append((kind, index, origin))
+
+        visit(kind, index)
+
+        return steps
+
+    def _fold(self, old: dict, total: dict, budget: Optional[int]) -> Tuple[np.ndarray, bool]:
+        """ apply every axiom to the new combinations, and store the new lines """
+
+        creases, axioms, points, lines = [], [], [], []
+        remaining = budget
+        truncated = False
+
+        for axiom, roles in _ROLES.items():
+            blocks = _blocks(roles, old, total)
+            available = sum(prod(lengths) for _, lengths in blocks)
+
+            if remaining is not None:
+                truncated |= available > remaining
+
+            point_columns = [i for i, kind in enumerate(roles) if kind == "point"]
+            line_columns = [i for i, kind in enumerate(roles) if kind == "line"]
+
+            for combinations in _combinations(blocks, remaining):
+                combinations = combinations[_is_canonical(axiom, combinations)]
+
+                # arguments are named `points1`, `lines1`, `points2`, ... in order of their role
+                arguments = {}
+                for number, column in enumerate(point_columns, 1):
+                    arguments[f"points{number}"] = self._points[combinations[:, column]]
+                for number, column in enumerate(line_columns, 1):
+                    arguments[f"lines{number}"] = self._lines[combinations[:, column]]
+
+                result = fold_many(axiom, **arguments)
+
+                # many combinations give the same crease, so repeats are dropped
+                # from each chunk to bound the memory used before the final pass
+                first = unique_indices(_normal_forms(result.lines.coefficients), symmetric=True)
+                rows = combinations[result.index[first]]
+
+                creases.append(result.lines.coefficients[first])
+                axioms.append(np.full(len(rows), axiom))
+                points.append(_pad(rows[:, point_columns]))
+                lines.append(_pad(rows[:, line_columns]))
+
+            if remaining is not None:
+                remaining -= min(available, remaining)
+
+        if not creases:
+            return np.arange(0), truncated
+
+        keep = self._add_unique("line", np.concatenate(creases))
+
+        self._line_level = np.concatenate((self._line_level, np.full(len(keep), self._level)))
+        self._line_axiom = np.concatenate((self._line_axiom, np.concatenate(axioms)[keep]))
+        self._line_points = np.concatenate((self._line_points, np.concatenate(points)[keep]))
+        self._line_lines = np.concatenate((self._line_lines, np.concatenate(lines)[keep]))
+
+        return np.arange(len(self._lines) - len(keep), len(self._lines)), truncated
+
+    def _intersect(self, old: dict, total: dict, budget: Optional[int]) -> Tuple[np.ndarray, bool]:
+        """ intersect the new pairs of lines, and store the new points """
+
+        blocks = _blocks(("line", "line"), old, total)
+        truncated = budget is not None and sum(prod(lengths) for _, lengths in blocks) > budget
+
+        coordinates, pairs = [], []
+        lines = LineArray(self._lines)
+
+        for combinations in _combinations(blocks, budget):
+            combinations = combinations[_is_canonical(3, combinations)]
+
+            first = tuple(column[combinations[:, 0]] for column in lines._columns())
+            second = tuple(column[combinations[:, 1]] for column in lines._columns())
+
+            x, y, valid = _intersect(first, second)
+
+            # `_intersect` leaves out lines which are parallel within the tolerance
+            # of `are_parallel`, which would otherwise meet far away, so this only
+            # drops crossings that overflow
+            valid &= np.isfinite(x) & np.isfinite(y)
+
+            found = np.column_stack((x[valid], y[valid]))
+            first = unique_indices(found)
+
+            coordinates.append(found[first])
+            pairs.append(combinations[valid][first])
+
+        if not coordinates:
+            return np.arange(0), truncated
+
+        keep = self._add_unique("point", np.concatenate(coordinates))
+
+        self._point_level = np.concatenate((self._point_level, np.full(len(keep), self._level)))
+        self._point_lines = np.concatenate((self._point_lines, np.concatenate(pairs)[keep]))
+
+        return np.arange(len(self._points) - len(keep), len(self._points)), truncated
+
+    def _add_unique(self, kind: str, candidates: np.ndarray) -> np.ndarray:
+        """
+        append the candidates that are new (keeping the first of any repeats) to
+        the points or lines, and return their indices among the candidates
+        """
+
+        known = self._points if kind == "point" else self._lines
+        values = np.concatenate((known, candidates))
+
+        # lines are equal by their normal forms, as for `LineArray.unique`
+        if kind == "point":
+            unique = unique_indices(values)
+        else:
+            unique = unique_indices(_normal_forms(values), symmetric=True)
+        keep = unique[unique >= len(known)] - len(known)
+
+        if kind == "point":
+            self._points = np.concatenate((known, candidates[keep]))
+        else:
+            self._lines = np.concatenate((known, candidates[keep]))
+
+        return keep
+
+
+def _pad(columns: np.ndarray) -> np.ndarray:
+    """ pad an `(N, k)` array of indices to `(N, 2)` with -1 """
+
+    padded = np.full((len(columns), 2), -1, dtype=np.int64)
+    padded[:, :columns.shape[1]] = columns
+
+    return padded
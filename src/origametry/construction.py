@@ -0,0 +1,203 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .fold import fold
+from .line import Line
+from .reflect import reflect
+
+# exceptions which are an outcome of a step (e.g. "infinitely many creases")
+# rather than a mistake in the construction, as for `FoldCache`
+_STORED_EXCEPTIONS = (ValueError,)
+
+
+class _Failed:
+
+    """ marks a step whose evaluation raised an exception """
+
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class _Node:
+
+    __slots__ = ("name", "function", "arguments", "value")
+
+    def __init__(self, name: str, function: Optional[Callable], arguments: tuple, value: Any):
+        self.name = name
+        self.function = function
+        self.arguments = arguments
+        self.value = value
+
+    @property
+    def is_input(self) -> bool:
+        return self.function is None
+
+
+def _same(old, new) -> bool:
+    """ whether a value has not moved, within the tolerance of `Point` and `Line` equality """
+
+    if isinstance(old, _Failed) or isinstance(new, _Failed):
+        return (
+            isinstance(old, _Failed) and isinstance(new, _Failed) and
+            type(old.exception) is type(new.exception) and
+            old.exception.args == new.exception.args
+        )
+
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        return len(old) == len(new) and all(map(_same, old, new))
+
+    return type(old) is type(new) and old == new
+
+
+class Construction:
+
+    """
+    A sequence of named folding steps, recorded as a dependency graph.
+
+    Inputs are points or lines given with `input`. Each step (`fold`, `reflect`,
+    `intersection`, `item` or any function with `step`) refers to earlier inputs
+    and steps by name, and is evaluated as soon as it is added. Changing inputs
+    with `update` then re-evaluates only the steps downstream of values which
+    actually moved, beyond the tolerance of `Point` and `Line` equality.
+
+    A step that raises a `ValueError` (e.g. for infinitely many creases) stores
+    the exception as its outcome, which is raised again when the value is read.
+    """
+
+    def __init__(self):
+        # insertion order is always a topological order of the graph
+        self._nodes: Dict[str, _Node] = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._nodes)
+
+    def __contains__(self, name) -> bool:
+        return name in self._nodes
+
+    def __getitem__(self, name: str):
+        value = self._nodes[name].value
+
+        if isinstance(value, _Failed):
+            raise value.exception.with_traceback(None)
+
+        return value
+
+    def input(self, name: str, value) -> str:
+        """ add an input point or line, which may be changed later with `update` """
+
+        self._check_name(name)
+        self._nodes[name] = _Node(name, None, (), value)
+
+        return name
+
+    def step(self, name: str, function: Callable, *arguments) -> str:
+        """
+        add a step which calls `function` with the values of earlier inputs and
+        steps (given by name) or with constant `Point`s and `Line`s
+        """
+
+        self._check_name(name)
+
+        for argument in arguments:
+            if isinstance(argument, str) and argument not in self._nodes:
+                raise KeyError(f"Step {name!r} refers to unknown name {argument!r}")
+
+        node = _Node(name, function, arguments, None)
+        node.value = self._evaluate(node)
+        self._nodes[name] = node
+
+        return name
+
+    def fold(self, name: str, *arguments) -> str:
+        return self.step(name, fold, *arguments)
+
+    def reflect(self, name: str, element, crease) -> str:
+        return self.step(name, reflect, element, crease)
+
+    def intersection(self, name: str, line_1, line_2) -> str:
+        return self.step(name, Line.intersection, line_1, line_2)
+
+    def item(self, name: str, creases, index: int) -> str:
+        """ pick one crease from a step which found several """
+
+        return self.step(name, _item, creases, index)
+
+    def values(self) -> Dict[str, Any]:
+        """ the value of every input and step (including stored exceptions) """
+
+        return {
+            name: node.value.exception if isinstance(node.value, _Failed) else node.value
+            for name, node in self._nodes.items()
+        }
+
+    def update(self, **inputs) -> List[str]:
+        """
+        change the values of inputs, re-evaluating every step that depends on
+        one which moved, and return the names of the re-evaluated steps
+        """
+
+        moved = set()
+
+        for name, value in inputs.items():
+            node = self._nodes[name]
+
+            if not node.is_input:
+                raise ValueError(f"{name!r} is a step, so only its inputs can be changed")
+
+            if not _same(node.value, value):
+                moved.add(name)
+
+            node.value = value
+
+        evaluated = []
+
+        for node in self._nodes.values():
+            if node.is_input or not any(
+                isinstance(argument, str) and argument in moved for argument in node.arguments
+            ):
+                continue
+
+            value = self._evaluate(node)
+            evaluated.append(node.name)
+
+            # steps further down only need evaluating if this one really changed
+            if not _same(node.value, value):
+                moved.add(node.name)
+
+            node.value = value
+
+        return evaluated
+
+    def _check_name(self, name: str):
+        if name in self._nodes:
+            raise ValueError(f"The name {name!r} is already in use")
+
+    def _evaluate(self, node: _Node):
+        arguments = []
+
+        for argument in node.arguments:
+            if isinstance(argument, str):
+                argument = self._nodes[argument].value
+
+                # a failure upstream is passed on to every step that depends on it
+                if isinstance(argument, _Failed):
+                    return argument
+
+            arguments.append(argument)
+
+        try:
+            return node.function(*arguments)
+        except _STORED_EXCEPTIONS as exception:
+            return _Failed(exception)
+
+
+def _item(creases, index: int):
+    # the number of creases can change with the inputs, so this is an outcome too
+    if not isinstance(creases, (list, tuple)) or not -len(creases) <= index < len(creases):
+        raise ValueError(f"There is no crease with index {index}")
+
+    return creases[index]
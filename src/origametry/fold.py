@@ -1,132 +1,143 @@
-import numpy as np
-import sympy
-from math import inf, sqrt
-from typing import Union, Optional, List
-from multimethod import multimethod, DispatchError
+from math import sqrt
+from operator import itemgetter
+from typing import Union, Optional, List, Tuple
 
 from .line import Line
 from .point import Point
-from .reflect import reflect
+from .reflect import _reflect
+from .cache import active_cache
+from .metrics import active_registry, branch, timing
+from ._kernels import perpendicular
+from .predicates import are_parallel, are_perpendicular, tangency
 from .helpers import (
-    cast_to_real, remove_duplicates, midpoint, inverse, projection, distance,
+    real_roots, remove_duplicates, midpoint, inverse, projection, distance,
     points_on_line, is_close
 )
 
 Creases = Optional[Union[Line, List[Line]]]
 
 
-@multimethod
-def _fold(p1: Point, q1: Point, p2: Point, q2: Point) -> Creases:
+def _perpendicular(line: Line, point: Point) -> Line:
+    """ get the line through a point perpendicular to the given line """
+
+    return Line(*perpendicular(line._form, point.x, point.y))
+
+
+def _axiom_1(p1: Point, q1: Point, p2: Point, q2: Point) -> Creases:
     """ axiom 1: crease through two points """
 
     # special case: all define the same point
     if p1 == q1 == p2 == q2:
+        branch("infinite")
         raise ValueError("Folding through a single point defines infinitely many creases")
 
     # expected case: two distinct points
     if p1 == q1 and p2 == q2:
+        branch("expected")
         return Line(p1, p2)
 
     # undocumented case: point onto point with crease passing through a third point;
     # in certain cases this does define a line, so let's try
     if p1 == q1:
+        branch("through_point")
+
         # first get the crease that puts `p2` onto `q2`
-        crease = _fold(p2, q2)
+        crease = _axiom_2(p2, q2)
 
         # then check whether that line also goes through `p1`
         return crease if p1.isOn(crease) else None
 
     # ... and the mirror image
     if p2 == q2:
-        crease = _fold(p1, q1)
+        branch("through_point")
+        crease = _axiom_2(p1, q1)
 
         return crease if p2.isOn(crease) else None
 
     # undocumented case: 2 pairs of distinct points
-    crease_1 = fold(p1, q1)
-    crease_2 = fold(p2, q2)
+    branch("two_pairs")
+    crease_1 = _axiom_2(p1, q1)
+    crease_2 = _axiom_2(p2, q2)
 
     if crease_1 == crease_2:
         return crease_1
 
 
-@multimethod
-def _fold(p1: Point, p2: Point) -> Creases:
+def _axiom_2(p1: Point, p2: Point) -> Creases:
     """ axiom 2: point onto point """
 
     if p1 == p2:
+        branch("infinite")
         raise ValueError("Folding a point onto itself defines infinitely may creases")
 
+    branch("expected")
+
     # the crease will be perpendicular to the line through `p1` and `p2`
     gradient = inverse(Line(p1, p2).gradient)
 
     return Line(midpoint(p1, p2), gradient)
 
 
-@multimethod
-def _fold(line_1: Line, line_2: Line) -> Creases:
+def _axiom_3(line_1: Line, line_2: Line) -> Creases:
     """ axiom 3: line onto line """
 
     # special case: line onto itself
     if line_1 == line_2:
+        branch("infinite")
         raise ValueError("Folding a line onto itself defines infinitely may creases")
 
-    # special case: parallel lines
-    if line_1.gradient == line_2.gradient:
-        # find an arbitrary point on each of the lines
-        p1 = next(points_on_line(line_1))
-        p2 = next(points_on_line(line_2))
-
-        # their midpoint will lie on the crease
-        return Line(midpoint(p1, p2), line_1.gradient)
-
-    # general case
-    intersection = line_1.intersection(line_2)
+    (nx_1, ny_1), offset_1 = line_1.normal, line_1.offset
+    (nx_2, ny_2), offset_2 = line_2.normal, line_2.offset
 
-    # there are two creases (perpendicular to each other) that satisfy the conditions
-    # and they are given by the equation:
-    # (a1.x + b1.y + c1) / sqrt(a1^2 + b1^2) = ± (a2.x + b2.y + c2) / sqrt(a2^2 + b2^2)
+    # the creases are the angle bisectors of the lines, given by the equation:
+    # n1.x + e1 = ± (n2.x + e2)
+    # where `n1` and `n2` are the unit normals and `e1` and `e2` the offsets
+    difference = (nx_1 - nx_2, ny_1 - ny_2, offset_1 - offset_2)
+    total = (nx_1 + nx_2, ny_1 + ny_2, offset_1 + offset_2)
 
-    # first take the positive case
-    denominator_1 = sqrt(line_1.a ** 2 + line_1.b ** 2)
-    denominator_2 = sqrt(line_2.a ** 2 + line_2.b ** 2)
+    # special case: parallel lines, where one of the bisectors has no direction
+    if are_parallel(line_1, line_2) or difference[:2] == (0, 0) or total[:2] == (0, 0):
+        branch("parallel")
 
-    a = line_1.a * denominator_2 - line_2.a * denominator_1
-    b = line_1.b * denominator_2 - line_2.b * denominator_1
+        # the crease is midway between the lines, once both normals face the same way
+        sign = -1 if nx_1 * nx_2 + ny_1 * ny_2 < 0 else 1
 
-    gradient = inf if b == 0 else -a / b
+        return Line(nx_1, ny_1, (offset_1 + sign * offset_2) / 2)
 
-    # the negative case will be the perpendicular line through the `intersection`
+    # general case: two creases, perpendicular to each other
+    branch("expected")
     return (
-        Line(intersection, gradient),
-        Line(intersection, inverse(gradient))
+        Line(*difference),
+        Line(*total)
     )
 
 
-@multimethod
-def _fold(p1: Point, p2: Point, line_1: Line, line_2: Line) -> Creases:
+def _axiom_4(p1: Point, p2: Point, line_1: Line, line_2: Line) -> Creases:
     """ axiom 4: through point and perpendicular to line """
 
     # expected case
     if p1 == p2 and line_1 == line_2:
-        return Line(p1, inverse(line_1.gradient))
+        branch("expected")
+        return _perpendicular(line_1, p1)
 
     # first undocumented case: point onto point with crease perpendicular to a line;
     # in certain cases this does define a line, so let's try
     if line_1 == line_2:
+        branch("points_perpendicular")
+
         # point onto a different point uniquely defines a crease
-        crease: Line = _fold(p1, p2)
+        crease: Line = _axiom_2(p1, p2)
 
         # check whether that line also satisfies perpendicularity
-        is_perpendicular = crease.gradient == inverse(line_1.gradient)
-
-        return crease if is_perpendicular else None
+        return crease if are_perpendicular(crease, line_1) else None
 
     # second undocumented case: line onto line with crease through a point;
     # in certain cases this also defines one or more lines, so let's try
     if p1 == p2:
+        branch("lines_through_point")
+
         # line onto a different line defines one or more creases
-        creases: Union[Line, List[Line]] = _fold(line_1, line_2)
+        creases: Union[Line, List[Line]] = _axiom_3(line_1, line_2)
 
         # convert to a list of lines
         candidates: List[Line] = [creases] if isinstance(creases, Line) else creases
@@ -142,12 +153,13 @@ def _fold(p1: Point, p2: Point, line_1: Line, line_2: Line) -> Creases:
 
     # final undocumented case: point onto point and line onto line;
     # even this could define a line, so let's try
+    branch("points_and_lines")
 
     # get the crease defined by the two points
-    crease: Line = _fold(p1, p2)
+    crease: Line = _axiom_2(p1, p2)
 
     # get the crease(s) defined by the two lines
-    creases: Union[Line, List[Line]] = _fold(line_1, line_2)
+    creases: Union[Line, List[Line]] = _axiom_3(line_1, line_2)
 
     candidates: List[Line] = [creases] if isinstance(creases, Line) else creases
 
@@ -157,22 +169,17 @@ def _fold(p1: Point, p2: Point, line_1: Line, line_2: Line) -> Creases:
             return crease
 
 
-@multimethod
-def _fold(line_1: Line, line_2: Line, p1: Point, p2: Point) -> Creases:
-    """ alternative signature for axiom 4 """
-    return _fold(p1, p2, line_1, line_2)
-
-
-@multimethod
-def _fold(p1: Point, line: Line, p2: Point, p3: Point) -> Creases:
+def _axiom_5(p1: Point, line: Line, p2: Point, p3: Point) -> Creases:
     """ axiom 5: point onto line and through point """
 
     # trivial case
     if p1.isOn(line) and p2 == p3:
+        branch("infinite")
         raise ValueError("Point is already on the line, giving infinitely many creases")
 
     # trivial case
     if p1 == p2 == p3:
+        branch("single_point")
         return None
 
     # expected case
@@ -181,16 +188,20 @@ def _fold(p1: Point, line: Line, p2: Point, p3: Point) -> Creases:
         # so consider a circle centred on p2 with the required radius
         radius = distance(p1, p2)
 
-        # check that the circle actually does intersect the line
-        p2_distance = distance(p2, line)
+        # check that the circle actually does intersect the line, exactly
+        position = tangency(p2, p1, line)
 
-        if radius < p2_distance:
+        if position < 0:
             # the fulcrum p2 is too far away from the line
+            branch("too_far")
             return None
 
-        if radius == p2_distance:
+        if position == 0:
             #  the line is tangent to the circle
-            return fold(p1, projection(p2, line))
+            branch("tangent")
+            return _axiom_2(p1, projection(p2, line))
+
+        branch("expected")
 
         # follow https://mathworld.wolfram.com/Circle-LineIntersection.html
         # we will assume the circle is centred on (0, 0) and then translate the
@@ -211,7 +222,8 @@ def _fold(p1: Point, line: Line, p2: Point, p3: Point) -> Creases:
         sgn = -1 if dy < 0 else 1
 
         # root of the "discriminant"
-        disc_root = sqrt(radius ** 2 * dr ** 2 - D ** 2)
+        # the circle does cross the line, even if rounding makes this slightly negative
+        disc_root = sqrt(max(radius ** 2 * dr ** 2 - D ** 2, 0))
 
         # solutions are given by
         x1 = (D * dy + sgn * dx * disc_root) / dr ** 2
@@ -221,187 +233,160 @@ def _fold(p1: Point, line: Line, p2: Point, p3: Point) -> Creases:
         y2 = (-D * dx - abs(dy) * disc_root) / dr ** 2
 
         return [
-            fold(p1, Point(x1 + p2.x, y1 + p2.y)),
-            fold(p1, Point(x2 + p2.x, y2 + p2.y))
+            _axiom_2(p1, Point(x1 + p2.x, y1 + p2.y)),
+            _axiom_2(p1, Point(x2 + p2.x, y2 + p2.y))
         ]
 
     # undocumented case: point onto line and point onto point;
     # in certain cases this does define a line, so let's try
     if p2 != p3:
+        branch("point_onto_point")
+
         # get the line putting p2 onto p3
-        crease = fold(p2, p3)
+        crease = _axiom_2(p2, p3)
 
         # check whether it also puts p1 onto the line
-        if p1.isOn(line) or reflect(p1, crease).isOn(line):
+        if p1.isOn(line) or _reflect(p1, crease).isOn(line):
             return crease
 
 
-@multimethod
-def _fold(line: Line, p1: Point, p2: Point, p3: Point) -> Creases:
-    """ alternative signature for axiom 5 """
-    return _fold(p1, line, p2, p3)
-
-
-@multimethod
-def _fold(p2: Point, p3: Point, p1: Point, line: Line) -> Creases:
-    """ alternative signature for axiom 5 """
-    return _fold(p1, line, p2, p3)
-
-
-@multimethod
-def _fold(p2: Point, p3: Point, line: Line, p1: Point) -> Creases:
-    """ alternative signature for axiom 5 """
-    return _fold(p1, line, p2, p3)
-
-
-@multimethod
-def _fold(p1: Point, line_1: Line, p2: Point, line_2: Line) -> Creases:
+def _axiom_6(p1: Point, line_1: Line, p2: Point, line_2: Line) -> Creases:
     """ axiom 6: point onto line and point onto line """
 
     # trivial cases
     if p1.isOn(line_1):
+        branch("infinite")
         raise ValueError("First point is already on its line, giving infinitely many creases")
 
     if p2.isOn(line_2):
+        branch("infinite")
         raise ValueError("Second point is already on its line, giving infinitely many creases")
 
     if p1 == p2 and line_1 == line_2:
+        branch("infinite")
         raise ValueError("Points and lines are identical, giving infinitely many creases")
 
     # expected case
+    branch("expected")
+
     # each point-line pair are the focus and directrix of a unique parabola
     # solution folds are all lines which are tangent to both parabolas
-    a, b, c = line_1.a, line_1.b, line_1.c
-
-    # equation of parabola:
-    # distance to point (p, q) == distance to line ax + by + c = 0 (both sides squared)
-    # (x - p)^2 + (y - q)^2 = (a*x + b*y + c)^2 / (a^2 + b^2)
-    # multiply out:
-    # x^2 - 2*x*p + p^2 + y^2 - 2*y*q + q^2 = (a^2*x^2 + b^2*y^2 + c^2 + 2*a*x*b*y + 2*a*x*c + 2*b*y*c) / (a^2 + b^2)
-    # let d = a^2 + b^2 and simplify:
-    d = a ** 2 + b ** 2
-    # b^2*x^2 + a^2*y^2 - 2*a*b*x*y - 2*(p*d + a*c)*x - 2*(q*d + b*c)*y + (p^2 + q^2)*d - c^2 = 0
-
-    # write in general conic form:
-    #             (   b^2      -a*b        -p*d-a*c    )   (x)
-    # (x, y, 1) . (  -a*b       a^2        -q*d-b*c    ) . (y) = 0
-    #             (-p*d-a*c  -q*d-b*c   d*p^2+d*q^2-c^2)   (1)
-    M1 = np.array([
-        [b ** 2, -a * b, -p1.x * d - a * c],
-        [-a * b, a ** 2, -p1.y * d - b * c],
-        [-p1.x * d - a * c, -p1.y * d - b * c, d * (p1.x ** 2 + p1.y ** 2) - c ** 2],
-    ])
-
-    # repeat for the second parabola
-    a, b, c = line_2.a, line_2.b, line_2.c
-    d = a ** 2 + b ** 2
-
-    M2 = np.array([
-        [b ** 2, -a * b, -p2.x * d - a * c],
-        [-a * b, a ** 2, -p2.y * d - b * c],
-        [-p2.x * d - a * c, -p2.y * d - b * c, d * (p2.x ** 2 + p2.y ** 2) - c ** 2],
-    ])
-
-    # we now find the "dual conics" of the two parabolas by taking the inverse matrices
-    A1 = np.linalg.inv(M1)
-    A2 = np.linalg.inv(M2)
-
-    # round any floating point errors to zero
-    A1 /= np.amax(A1)
-    A2 /= np.amax(A2)
-
-    for A in (A1, A2):
-        for iy, ix in np.ndindex(A.shape):
-            if is_close(A[iy, ix], 0):
-                A[iy, ix] = 0
-
-    # and then multiplying out the general conic form to get equations for the duals
-    a, b, c = sympy.symbols("a b c", real=True)
-    vec = np.array([a, b, c])
-
-    dual_conic_1 = sympy.Eq(vec.dot(A1).dot(vec), 0)
-    dual_conic_2 = sympy.Eq(vec.dot(A2).dot(vec), 0)
-
-    # points of a dual conic correspond to tangent lines of the original and vice versa,
-    # so common tangents to the parabolas correspond to intersections of the dual conics
-
-    # use SymPy to solve the dual equations for these intersections:
-    dual_intersections = sympy.solve([dual_conic_1, dual_conic_2], [a, b, c])
-
-    solutions = cast_to_real([
-        # solutions are correct to some scalar multiple; set remaining variables to 1
-        tuple(x.subs({a: 1, b: 1, c: 1}) for x in s)
-        for s in dual_intersections
-    ])
-
-    # the special case c = 0 may give more solutions for tangents through the origin
-    special_vec = np.array([a, b, 0])
-
-    special_dual_intersections = sympy.solve([
-        sympy.Eq(special_vec.dot(A1).dot(special_vec), 0),
-        sympy.Eq(special_vec.dot(A2).dot(special_vec), 0),
-    ], [a, b])
-
-    solutions += cast_to_real([
-        tuple(x.subs({a: 1, b: 1}) for x in s) + (0,)
-        for s in special_dual_intersections
-    ])
-
-    return remove_duplicates([
-        Line(a, b, c)
-        for a, b, c in solutions
-        # ignore the solution (0, 0, 1), which represents the tangent at infinity
-        if not is_close(a, 0) or not is_close(b, 0)
-    ])
-
-
-@multimethod
-def _fold(p1: Point, line_1: Line, line_2: Line, p2: Point) -> Creases:
-    """ alternative signature for axiom 6 """
-    return _fold(p1, line_1, p2, line_2)
-
-
-@multimethod
-def _fold(line_1: Line, p1: Point, p2: Point, line_2: Line) -> Creases:
-    """ alternative signature for axiom 6 """
-    return _fold(p1, line_1, p2, line_2)
-
-
-@multimethod
-def _fold(line_1: Line, p1: Point, line_2: Line, p2: Point) -> Creases:
-    """ alternative signature for axiom 6 """
-    return _fold(p1, line_1, p2, line_2)
-
-
-@multimethod
-def _fold(p: Point, line_1: Line, line_2: Line, line_3: Line) -> Creases:
+
+    # a crease `u.x + w = 0` (with `u` a unit vector) reflects a focus `p` onto a directrix
+    # `n.x + e = 0` (with `n` a unit vector) exactly when
+    # n.p + e = 2 * (u.p + w) * (n.u)
+    # i.e. the distance from the focus to the directrix is twice its distance to the crease,
+    # scaled by the cosine of the angle between the two lines
+    n1, e1 = line_1.normal, line_1.offset
+    n2, e2 = line_2.normal, line_2.offset
+
+    # signed distances from each focus to its directrix (both non-zero from the checks above)
+    d1 = n1[0] * p1.x + n1[1] * p1.y + e1
+    d2 = n2[0] * p2.x + n2[1] * p2.y + e2
+
+    # both conditions are linear in `w`, so eliminating it leaves a homogeneous cubic
+    # in the components of `u` (before it is scaled to unit length):
+    # |u|^2 * (d2 * (n1.u) - d1 * (n2.u)) - 2 * ((p2 - p1).u) * (n1.u) * (n2.u) = 0
+
+    # substitute `u = (t, 1)` to get an ordinary cubic in `t`, where
+    # d2 * (n1.u) - d1 * (n2.u) = alpha * t + beta
+    # (n1.u) * (n2.u)           = q2 * t^2 + q1 * t + q0
+    alpha = d2 * n1[0] - d1 * n2[0]
+    beta = d2 * n1[1] - d1 * n2[1]
+
+    q2 = n1[0] * n2[0]
+    q1 = n1[0] * n2[1] + n1[1] * n2[0]
+    q0 = n1[1] * n2[1]
+
+    dx = p2.x - p1.x
+    dy = p2.y - p1.y
+
+    cubic = [
+        alpha - 2 * dx * q2,
+        beta - 2 * (dx * q1 + dy * q2),
+        alpha - 2 * (dx * q0 + dy * q1),
+        beta - 2 * dy * q0,
+    ]
+
+    # a vanishing leading coefficient means that `u = (1, 0)` (i.e. `t = inf`) is a root
+    directions = []
+    scale = max(abs(coefficient) for coefficient in cubic)
+
+    while len(cubic) > 1 and is_close(cubic[0] / scale, 0):
+        directions.append((1, 0))
+        cubic = cubic[1:]
+
+    # NumPy is only needed here, so it is not loaded until axiom 6 is first used
+    import numpy as np
+
+    with timing("origametry_roots_seconds"):
+        roots = np.roots(cubic)
+
+    for t in real_roots(roots):
+        norm = sqrt(t ** 2 + 1)
+        directions.append((t / norm, 1 / norm))
+
+    creases = []
+
+    for u in directions:
+        # recover `w` from whichever condition is better conditioned
+        k1 = n1[0] * u[0] + n1[1] * u[1]
+        k2 = n2[0] * u[0] + n2[1] * u[1]
+
+        # with parallel directrices the cubic has a spurious root perpendicular to both
+        if is_close(k1, 0) and is_close(k2, 0):
+            continue
+
+        if abs(k1) >= abs(k2):
+            w = d1 / (2 * k1) - (u[0] * p1.x + u[1] * p1.y)
+        else:
+            w = d2 / (2 * k2) - (u[0] * p2.x + u[1] * p2.y)
+
+        # tangents through the origin must have `c = 0` exactly to be normalised correctly
+        if is_close(w, 0):
+            w = 0
+
+        creases.append(Line(u[0], u[1], w))
+
+    return remove_duplicates(creases)
+
+
+def _axiom_7(p: Point, line_1: Line, line_2: Line, line_3: Line) -> Creases:
     """ axiom 7: point onto line and perpendicular to line """
 
     # expected case
     if line_2 == line_3:
         # trivial case
         if p.isOn(line_1):
+            branch("infinite")
             raise ValueError("Point is already on the line, giving infinitely many creases")
 
+        (nx, ny), offset = line_1.normal, line_1.offset
+        dx, dy = line_2.direction
+
+        # `p` moves along `line_2`, so find where that path meets `line_1`
+        along = nx * dx + ny * dy
+
         # trivial case
-        if line_1.gradient == line_2.gradient:
+        if are_parallel(line_1, line_2) or along == 0:
+            branch("parallel")
             return None
 
         # general case
-        # first get the line through `p` that is parallel to `line_2`
-        parallel = Line(p, line_2.gradient)
+        branch("expected")
 
-        # get the new line's intersection with line_1
-        p2 = parallel.intersection(line_1)
+        # `p + t (dx, dy)` is on `line_1`, and the fold is perpendicular through the midpoint
+        t = -(nx * p.x + ny * p.y + offset) / along
 
-        # the fold will be perpendicular through the midpoint
-        return Line(midpoint(p, p2), inverse(line_2.gradient))
+        return _perpendicular(line_2, Point(p.x + t / 2 * dx, p.y + t / 2 * dy))
 
     # undocumented case: point onto line and line onto line;
     # in certain cases this does define a line, so let's try
     if line_2 != line_3:
+        branch("line_onto_line")
+
         # get the line(s) putting line_2 onto line_3
-        creases = fold(line_2, line_3)
+        creases = _axiom_3(line_2, line_3)
 
         # convert to a list of lines
         candidates: List[Line] = [creases] if isinstance(creases, Line) else creases
@@ -410,7 +395,7 @@ def _fold(p: Point, line_1: Line, line_2: Line, line_3: Line) -> Creases:
         solutions = [
             crease
             for crease in candidates
-            if p.isOn(line_1) or reflect(p, crease).isOn(line_1)
+            if p.isOn(line_1) or _reflect(p, crease).isOn(line_1)
         ]
 
         if len(solutions) == 1:
@@ -420,30 +405,75 @@ def _fold(p: Point, line_1: Line, line_2: Line, line_3: Line) -> Creases:
         return None
 
 
-@multimethod
-def _fold(line_1: Line, p: Point, line_2: Line, line_3: Line) -> Creases:
-    """ alternative signature for axiom 7 """
-    return _fold(p, line_1, line_2, line_3)
+# canonical implementation of each signature, with a getter that puts the
+# arguments in the order it expects, or `None` when they are already in order
+_SIGNATURES = {
+    (Point, Point, Point, Point): (_axiom_1, None),
+    (Point, Point): (_axiom_2, None),
+    (Line, Line): (_axiom_3, None),
+    (Point, Point, Line, Line): (_axiom_4, None),
+    (Line, Line, Point, Point): (_axiom_4, itemgetter(2, 3, 0, 1)),
+    (Point, Line, Point, Point): (_axiom_5, None),
+    (Line, Point, Point, Point): (_axiom_5, itemgetter(1, 0, 2, 3)),
+    (Point, Point, Point, Line): (_axiom_5, itemgetter(2, 3, 0, 1)),
+    (Point, Point, Line, Point): (_axiom_5, itemgetter(3, 2, 0, 1)),
+    (Point, Line, Point, Line): (_axiom_6, None),
+    (Point, Line, Line, Point): (_axiom_6, itemgetter(0, 1, 3, 2)),
+    (Line, Point, Point, Line): (_axiom_6, itemgetter(1, 0, 2, 3)),
+    (Line, Point, Line, Point): (_axiom_6, itemgetter(1, 0, 3, 2)),
+    (Point, Line, Line, Line): (_axiom_7, None),
+    (Line, Point, Line, Line): (_axiom_7, itemgetter(1, 0, 2, 3)),
+    (Line, Line, Point, Line): (_axiom_7, itemgetter(2, 3, 0, 1)),
+    (Line, Line, Line, Point): (_axiom_7, itemgetter(3, 2, 0, 1)),
+}
+
 
+def _resolve(signature: Tuple[type, ...]):
+    """ find the entry of `_SIGNATURES` for the types of arguments, allowing subclasses """
 
-@multimethod
-def _fold(line_2: Line, line_3: Line, p: Point, line_1: Line) -> Creases:
-    """ alternative signature for axiom 7 """
-    return _fold(p, line_1, line_2, line_3)
+    for types, entry in _SIGNATURES.items():
+        if len(types) == len(signature) and all(map(issubclass, signature, types)):
+            # remember the match, so that the next call is a single lookup
+            _SIGNATURES[signature] = entry
+            return entry
 
+    names = tuple(t.__name__ for t in signature)
 
-@multimethod
-def _fold(line_2: Line, line_3: Line, line_1: Line, p: Point) -> Creases:
-    """ alternative signature for axiom 7 """
-    return _fold(p, line_1, line_2, line_3)
+    raise TypeError(f"'fold' cannot be applied with arguments {names}")
 
 
 def fold(*args):
-    """ wrapper function for custom error handling """
+    """
+    find the crease(s) that place each argument onto the next, in pairs
+
+    The types of the arguments pick an axiom from a precomputed table, which
+    also gives the order in which to pass them to its implementation. Results
+    are looked up in the active cache (see `caching`) when there is one, and
+    recorded in the active registry (see `measuring`) when there is one.
+    """
+
+    signature = tuple(map(type, args))
 
     try:
-        return _fold(*args)
-    except DispatchError:
-        types = tuple(type(arg).__name__ for arg in args)
+        axiom, reorder = _SIGNATURES[signature]
+    except KeyError:
+        axiom, reorder = _resolve(signature)
+
+    if reorder is not None:
+        args = reorder(args)
+
+    registry = active_registry()
+
+    if registry is None:
+        return _solve(axiom, args)
+
+    return registry.measure(axiom.__name__[1:], _solve, axiom, args)
+
+
+def _solve(axiom, args: tuple):
+    cache = active_cache()
+
+    if cache is None:
+        return axiom(*args)
 
-        raise TypeError(f"'fold' cannot be applied with arguments {types}")
+    return cache.call((axiom, *args), axiom, *args)
@@ -1,4 +1,12 @@
-from math import sqrt, inf, isclose
+from math import inf, isclose, log, floor, copysign, isfinite
+from itertools import product
+
+from ._kernels import line_distance, point_distance, project
+from .metrics import observe
+
+# tolerances used for every fuzzy comparison of coordinates and coefficients
+REL_TOL = 1e-9
+ABS_TOL = 1e-10
 
 
 def is_close(a, b):
@@ -6,39 +14,171 @@ def is_close(a, b):
     check whether the values of `a` and `b` are close enough to be considered equal
     """
 
-    return isclose(a, b, abs_tol=1e-10)
+    return isclose(a, b, rel_tol=REL_TOL, abs_tol=ABS_TOL)
+
+
+def grid_coordinate(value: float) -> float:
+    """
+    map a value onto a scale where the tolerance of `is_close` is always one unit
+
+    The tolerance is absolute close to zero and relative further away, so the
+    scale is linear up to `ABS_TOL / REL_TOL` and logarithmic beyond it. Any two
+    values that are close to each other differ by at most one unit on this scale.
+    """
+
+    magnitude = abs(value)
+
+    if magnitude <= ABS_TOL / REL_TOL:
+        scaled = magnitude / ABS_TOL
+    else:
+        scaled = (1 + log(magnitude * REL_TOL / ABS_TOL)) / REL_TOL
+
+    return copysign(scaled, value)
+
+
+def grid_cell(values) -> tuple:
+    """
+    get the cell of a tolerance grid containing a tuple of values
+
+    Cells are two units wide on the scale of `grid_coordinate`, so values that
+    are close to each other always fall in the same or neighbouring cells.
+    """
+
+    return tuple(
+        floor(grid_coordinate(value) / 2) if isfinite(value) else value
+        for value in values
+    )
+
+
+# width of the cells used by `hash_cell`, in units of `grid_coordinate`
+HASH_CELL_WIDTH = 2 ** 20
+
+
+def hash_cell(values) -> tuple:
+    """
+    snap a tuple of values onto a coarse grid, for hashing fuzzily equal objects
+
+    Cells are much wider than the tolerance and centred on zero, so values that
+    are close to each other fall in the same cell except in the rare case that
+    they sit either side of a boundary, which is never near zero.
+    """
+
+    return tuple(
+        floor(grid_coordinate(value) / HASH_CELL_WIDTH + 0.5) if isfinite(value) else value
+        for value in values
+    )
+
+
+def real_roots(roots, tolerance=1e-6):
+    """
+    get the distinct real values from a list of (possibly complex) polynomial roots
+
+    floating-point error splits a repeated root into a complex-conjugate pair or a
+    pair of nearby real roots, so these are merged back into a single root
+    """
 
+    real = sorted(
+        complex(r).real
+        for r in roots
+        if abs(complex(r).imag) <= tolerance * (1 + abs(complex(r)))
+    )
 
-def cast_to_real(solutions):
-    """ remove imaginary floating-point errors and cast to floats """
+    clusters = []
 
-    real_solutions = []
+    for r in real:
+        if clusters and abs(r - clusters[-1][-1]) <= tolerance * (1 + abs(r)):
+            clusters[-1].append(r)
+        else:
+            clusters.append([r])
 
-    for s in solutions:
-        # cast expressions to built-in `complex` type
-        complex_solution = tuple(complex(x) for x in s)
+    # the mean of a split root is much closer to the true value than either half
+    return [sum(cluster) / len(cluster) for cluster in clusters]
 
-        # throw out any solutions with non-negligible imaginary components
-        if all(is_close(x.imag, 0) for x in complex_solution):
-            real_solutions.append(tuple(x.real for x in complex_solution))
 
-    return real_solutions
+# number of chunks given to each worker of a process pool by default, so that
+# the work is shared out evenly when some items take longer than others
+_CHUNKS_PER_WORKER = 4
+
+
+def default_chunksize(items: int, workers: int) -> int:
+    """
+    the number of items sent to a worker at a time, when `fold_parallel` or
+    `render_many` are given no chunk size
+    """
+
+    return max(items // (_CHUNKS_PER_WORKER * workers), 1)
+
+
+# lists at least this long are de-duplicated with NumPy in `remove_duplicates`
+_ARRAY_THRESHOLD = 1000
 
 
 def remove_duplicates(elements):
-    """ works with unhashable types """
+    """
+    remove repeated elements (keeping the first of each) using fuzzy equality
+
+    `Point` and `Line` objects are indexed in a grid of cells the size of the
+    comparison tolerance, so each element is only compared against the unique
+    elements in its own and neighbouring cells, giving expected O(n) time.
+    Long lists are handled by the vectorised `unique_indices` instead. Other
+    types (including unhashable ones) are compared against every unique element
+    found so far.
+    """
+
+    from .line import Line
+    from .point import Point
+
+    elements = list(elements)
+    observe("origametry_remove_duplicates_size", len(elements))
+
+    # the values which determine the equality of each element
+    if all(isinstance(e, Point) for e in elements):
+        keys = [(e.x, e.y) for e in elements]
+    elif all(isinstance(e, Line) for e in elements):
+        keys = [(*e.normal, e.offset) for e in elements]
+    else:
+        return _remove_duplicates_by_comparison(elements)
+
+    # lines are equal with their normals pointing either way
+    symmetric = isinstance(elements[0], Line) if elements else False
+
+    if len(elements) >= _ARRAY_THRESHOLD:
+        from .point_array import unique_indices
+        return [elements[i] for i in unique_indices(keys, symmetric).tolist()]
 
     unique_elements = []
+    grid = {}
 
-    for e in elements:
-        is_unique = True
+    # offsets to the neighbouring cells in every dimension
+    offsets = list(product((-1, 0, 1), repeat=len(keys[0]))) if keys else []
+
+    for e, key in zip(elements, keys):
+        cell = grid_cell(key)
 
-        for u in unique_elements:
-            if e == u:
-                is_unique = False
+        is_unique = not any(
+            e == u
+            for offset in offsets
+            for u in grid.get(tuple(c + o for c, o in zip(cell, offset)), ())
+        )
 
         if is_unique:
             unique_elements.append(e)
+            grid.setdefault(cell, []).append(e)
+
+            if symmetric:
+                grid.setdefault(grid_cell(tuple(-value for value in key)), []).append(e)
+
+    return unique_elements
+
+
+def _remove_duplicates_by_comparison(elements):
+    """ works with unhashable types """
+
+    unique_elements = []
+
+    for e in elements:
+        if not any(e == u for u in unique_elements):
+            unique_elements.append(e)
 
     return unique_elements
 
@@ -67,25 +207,21 @@ def inverse(gradient: float) -> float:
 
 def projection(point, line):
     """ get the closest point on a line to the given point """
-    from .line import Line
-
-    # get the perpendicular line through the given point
-    perpendicular = Line(point, inverse(line.gradient))
 
-    # find the intersection of both lines, which is the desired point
-    return perpendicular.intersection(line)
+    # built with the type of the given point, which saves importing `Point` on every call
+    return type(point)(*project(point.x, point.y, line._form))
 
 
 def _distance_point_to_point(p1, p2) -> float:
     """ get the Euclidean straight-line distance between two points """
 
-    return sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2)
+    return point_distance(p1.x, p1.y, p2.x, p2.y)
 
 
 def _distance_point_to_line(p, line) -> float:
     """ get the shortest straight-line distance between a point and a line """
 
-    return distance(p, projection(p, line))
+    return line_distance(p.x, p.y, line._form)
 
 
 def distance(thing_1, thing_2) -> float:
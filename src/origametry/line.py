@@ -1,9 +1,11 @@
 from math import inf
-from typing import Union, Optional
+from typing import Union, Optional, Tuple
 from multimethod import multimethod
 
 from .point import Point
-from .helpers import is_close
+from .helpers import is_close, hash_cell
+from ._kernels import intersect, normal_form
+from .predicates import are_parallel
 
 Number = Union[int, float]
 
@@ -29,8 +31,20 @@ class Line:
 
     4. Just the gradient through the origin
         gradient: int|float
+
+    Lines are immutable and hashable in the same way as `Point`.
+
+    Scaling to `c = 1` gives huge coefficients for lines close to the origin,
+    so lines are compared and hashed by their normal form instead: the unit
+    `normal` to the line and its signed `offset` from the origin, which keep a
+    meaningful tolerance wherever the line is.
+
+    The gradient and normal form are worked out once, when the line is made,
+    and the `anchor` point and hash on first use.
     """
 
+    __slots__ = ("_a", "_b", "_c", "_gradient", "_form", "_anchor", "_hash")
+
     @multimethod
     def __init__(self, a: Number, b: Number, c: Number = 0):
         """ Method 1: coefficients passed in directly """
@@ -39,21 +53,15 @@ class Line:
             raise ValueError('One of "a" or "b" must be non-zero')
 
         if c:
-            self._a = a / c
-            self._b = b / c
-            self._c = 1
+            self._set(a / c, b / c, 1)
 
         # if `c == 0`, we may scale coefficients to get `b = 1` or `b = 0`
         elif b:
-            self._a = a / b
-            self._b = 1
-            self._c = 0
+            self._set(a / b, 1, 0)
 
         # if `b == c == 0`, the line is vertical through the origin
         else:
-            self._a = 1
-            self._b = 0
-            self._c = 0
+            self._set(1, 0, 0)
 
     @multimethod
     def __init__(self, p1: Point, p2: Point):
@@ -83,30 +91,22 @@ class Line:
 
             # special case: vertical through the origin
             if p.x == 0:
-                self._a = 1
-                self._b = 0
-                self._c = 0
+                self._set(1, 0, 0)
 
             # general vertical case
             else:
-                self._a = -1 / p.x
-                self._b = 0
-                self._c = 1
+                self._set(-1 / p.x, 0, 1)
 
         else:
             y_intercept = p.y - gradient * p.x
 
             # special case: line crosses the origin
             if y_intercept == 0:
-                self._a = -gradient
-                self._b = 1
-                self._c = 0
+                self._set(-gradient, 1, 0)
 
             # general case
             else:
-                self._a = gradient / y_intercept
-                self._b = -1 / y_intercept
-                self._c = 1
+                self._set(gradient / y_intercept, -1 / y_intercept, 1)
 
     @multimethod
     def __init__(self, gradient: Number):
@@ -114,31 +114,98 @@ class Line:
 
         return self.__init__(Point(0, 0), gradient)
 
+    def _set(self, a: Number, b: Number, c: Number):
+        """
+        store the coefficients and the values derived from them, bypassing
+        immutability during initialisation
+        """
+
+        object.__setattr__(self, "_a", a)
+        object.__setattr__(self, "_b", b)
+        object.__setattr__(self, "_c", c)
+
+        # check whether the line is vertical
+        object.__setattr__(self, "_gradient", inf if b == 0 else -a / b)
+
+        object.__setattr__(self, "_form", normal_form(a, b, c))
+
+        object.__setattr__(self, "_anchor", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot set {name!r}: 'Line' objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete {name!r}: 'Line' objects are immutable")
+
     def __copy__(self):
-        return Line(self._a, self._b, self._c)
+        return self
 
-    def __eq__(self, other):
-        """
-        By the nature of infinite lines, a small error locally will generally
-        result in arbitrarily large errors elsewhere, so matching "within a
-        given tolerance" is not a well-defined operation.
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # the stored coefficients are already scaled, so they can be restored as they are
+        return (_restore, (type(self), self._a, self._b, self._c))
 
-        This error can manifest as exaggerated scaling of the coefficients
-        `a`, `b` and `c`, making fuzzy comparison impractical in some cases.
+    def __hash__(self):
+        if self._hash is None:
+            # the same for either orientation of the normal, as for equality
+            flipped = tuple(-value for value in self._form)
+            object.__setattr__(self, "_hash", hash(max(hash_cell(self._form), hash_cell(flipped))))
 
-        In practice, though, most lines can still be compared in this way since
-        the lines will be "close enough" within the sensible folding area.
+        return self._hash
+
+    def __eq__(self, other):
+        """
+        Lines are equal when their normal forms are close, with the normal
+        pointing either way. Unlike the scaled coefficients `a`, `b` and `c`,
+        the unit normal and offset have a sensible size for every line, so the
+        usual tolerance means the same thing near and far from the origin.
         """
 
         if not isinstance(other, Line):
             return False
 
+        nx, ny, offset = self._form
+        other_nx, other_ny, other_offset = other._form
+
         return (
-            is_close(self._a, other.a) and
-            is_close(self._b, other.b) and
-            is_close(self._c, other.c)
+            is_close(nx, other_nx) and is_close(ny, other_ny) and is_close(offset, other_offset)
+        ) or (
+            is_close(nx, -other_nx) and is_close(ny, -other_ny) and is_close(offset, -other_offset)
         )
 
+    @property
+    def normal(self) -> Tuple[float, float]:
+        """ the unit normal `(a, b)` of the line, with `a > 0`, or `b > 0` if `a = 0` """
+
+        return self._form[:2]
+
+    @property
+    def offset(self) -> float:
+        """ the signed distance of the origin from the line, along the `normal` """
+
+        return self._form[2]
+
+    @property
+    def direction(self) -> Tuple[float, float]:
+        """ the unit vector along the line, a quarter turn anticlockwise from the `normal` """
+
+        nx, ny, _ = self._form
+
+        return -ny, nx
+
+    @property
+    def anchor(self) -> Point:
+        """ the point on the line closest to the origin """
+
+        if self._anchor is None:
+            nx, ny, offset = self._form
+            object.__setattr__(self, "_anchor", Point(-offset * nx + 0.0, -offset * ny + 0.0))
+
+        return self._anchor
+
     @property
     def a(self) -> Number:
         return self._a
@@ -154,38 +221,27 @@ class Line:
     @property
     def gradient(self):
 
-        """ calculate the gradient of the line, i.e. "rise over run" """
-
-        # check whether the line is vertical
-        if self._b == 0:
-            return inf
+        """ the gradient of the line, i.e. "rise over run" """
 
-        return -self._a / self._b
+        return self._gradient
 
     def intersection(self, other) -> Optional[Point]:
 
         """ get the intersection point of two lines if it exists """
 
         # check whether the lines are parallel i.e. no solutions
-        if self.gradient == other.gradient:
+        if are_parallel(self, other):
             return None
 
-        x = y = None
+        point = intersect(self._form, other._form)
 
-        # check whether this line is vertical
-        if self._b == 0:
-            x = -self._c / self._a
-            y = (other.a * self._c - self._a * other.c) / (self._a * other.b)
+        return None if point is None else Point(*point)
 
-        # check whether the other line is vertical
-        elif other.b == 0:
-            x = -other.c / other.a
-            y = (self._a * other.c - other.a * self._c) / (other.a * self._b)
 
-        else:
-            divisor = (other.gradient - self.gradient) * self._b * other.b
+def _restore(cls, a: Number, b: Number, c: Number) -> Line:
+    """ rebuild a pickled line from its stored coefficients, without dispatching on them """
 
-            x = (self._b * other.c - other.b * self._c) / divisor
-            y = (other.a * self._c - self._a * other.c) / divisor
+    line = cls.__new__(cls)
+    line._set(a, b, c)
 
-        return Point(x, y)
+    return line
@@ -0,0 +1,326 @@
+import numpy as np
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from .line import Line
+from .point_array import PointArray, is_close_array, unique_indices
+
+# number of candidate pairs to intersect at once in `pairwise_intersections`
+_BLOCK_SIZE = 1 << 20
+
+
+def _normalise(coefficients: np.ndarray) -> np.ndarray:
+    """ scale every row to `c = 1`, `b = 1` or `a = 1` in the same way as `Line` """
+
+    a, b, c = coefficients.T
+
+    if np.any((a == 0) & (b == 0)):
+        raise ValueError('One of "a" or "b" must be non-zero')
+
+    # divide through by `c` where possible, then by `b`, then by `a`
+    divisor = np.where(c != 0, c, np.where(b != 0, b, a))
+
+    return coefficients / divisor[:, np.newaxis]
+
+
+def _normal_forms(coefficients: np.ndarray) -> np.ndarray:
+    """ every row scaled to a unit normal with the same sign convention as `Line.normal` """
+
+    forms = coefficients / np.hypot(coefficients[:, 0], coefficients[:, 1])[:, np.newaxis]
+
+    flip = (forms[:, 0] < 0) | ((forms[:, 0] == 0) & (forms[:, 1] < 0))
+    forms[flip] = -forms[flip]
+
+    # `+ 0.0` turns `-0.0` into `0.0`
+    return forms + 0.0
+
+
+def _gradients(coefficients: np.ndarray) -> np.ndarray:
+    """ gradient of every row of coefficients, with `inf` for vertical lines """
+
+    a, b = coefficients[..., 0], coefficients[..., 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(b == 0, np.inf, -a / b)
+
+
+def _are_parallel(first, second) -> np.ndarray:
+    """
+    element-wise version of `are_parallel` for lines given as `(a, b, c, gradient)`
+    tuples of broadcastable arrays
+    """
+
+    a1, b1, _, gradient_1 = first
+    a2, b2, _, gradient_2 = second
+
+    # unit normals, whose sign does not matter as both orientations are compared
+    norm_1, norm_2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    nx_1, ny_1, nx_2, ny_2 = a1 / norm_1, b1 / norm_1, a2 / norm_2, b2 / norm_2
+
+    return (
+        (gradient_1 == gradient_2) |
+        (is_close_array(nx_1, nx_2) & is_close_array(ny_1, ny_2)) |
+        (is_close_array(nx_1, -nx_2) & is_close_array(ny_1, -ny_2))
+    )
+
+
+def _intersect(first, second) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    intersect lines given as `(a, b, c, gradient)` tuples of broadcastable arrays,
+    returning the `x` and `y` coordinates and a mask of the non-parallel pairs
+    """
+
+    a1, b1, c1, _ = first
+    a2, b2, c2, _ = second
+
+    # parallel lines are detected the same way as in `Line.intersection`
+    valid = ~_are_parallel(first, second)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Cramer's rule, which needs no special case for vertical lines
+        determinant = a1 * b2 - a2 * b1
+
+        x = (b1 * c2 - b2 * c1) / determinant
+        y = (a2 * c1 - a1 * c2) / determinant
+
+    x[~valid] = np.nan
+    y[~valid] = np.nan
+
+    return x, y, valid
+
+
+class LineArray:
+
+    """
+    A contiguous `(N, 3)` array holding the coefficients `(a, b, c)` of the
+    general-form equations `ax + by + c = 0` of many lines, one line per row.
+
+    Coefficients are scaled in the same way as for a single `Line`.
+    Initialisation supports:
+
+    1. A sequence of `Line` objects
+        lines: Iterable[Line]
+
+    2. Anything that NumPy can convert to an `(N, 3)` array of floats
+        coefficients: array_like
+    """
+
+    def __init__(self, lines: Union[Iterable[Line], np.ndarray, "LineArray"]):
+        if isinstance(lines, LineArray):
+            coefficients = lines.coefficients.copy()
+
+        elif isinstance(lines, np.ndarray):
+            coefficients = _normalise(np.array(lines, dtype=float).reshape(-1, 3))
+
+        else:
+            lines = list(lines)
+
+            if lines and all(isinstance(line, Line) for line in lines):
+                # `Line` coefficients are already normalised
+                coefficients = np.array([(line.a, line.b, line.c) for line in lines], dtype=float)
+            else:
+                coefficients = _normalise(np.array(lines, dtype=float).reshape(-1, 3))
+
+        self._coefficients = np.ascontiguousarray(coefficients)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Line]) -> "LineArray":
+        return cls(list(lines))
+
+    def to_lines(self) -> List[Line]:
+        return [Line(a, b, c) for a, b, c in self._coefficients.tolist()]
+
+    def __repr__(self):
+        return f"LineArray({self._coefficients.tolist()})"
+
+    def __len__(self):
+        return len(self._coefficients)
+
+    def __iter__(self) -> Iterator[Line]:
+        return iter(self.to_lines())
+
+    def __getitem__(self, index):
+        """ integers give a single `Line`; slices, masks and index arrays give a `LineArray` """
+
+        if isinstance(index, (int, np.integer)):
+            a, b, c = self._coefficients[index].tolist()
+            return Line(a, b, c)
+
+        return LineArray(self._coefficients[index])
+
+    def __eq__(self, other) -> np.ndarray:
+        """ element-wise fuzzy comparison against a `Line` or a `LineArray` of the same length """
+
+        if isinstance(other, Line):
+            other_forms = np.array([*other.normal, other.offset], dtype=float)
+        elif isinstance(other, LineArray):
+            other_forms = _normal_forms(other.coefficients)
+        else:
+            return NotImplemented
+
+        # compared in the same way as `Line`, with the normal pointing either way
+        forms = _normal_forms(self._coefficients)
+
+        return (
+            is_close_array(forms, other_forms).all(axis=1) |
+            is_close_array(forms, -other_forms).all(axis=1)
+        )
+
+    def __ne__(self, other) -> np.ndarray:
+        equal = self.__eq__(other)
+
+        if equal is NotImplemented:
+            return equal
+
+        return ~equal
+
+    # arrays are mutable containers, so they cannot be hashed
+    __hash__ = None
+
+    def unique(self) -> "LineArray":
+        """ remove repeated lines, keeping the first of each in the same way as `remove_duplicates` """
+
+        return self[unique_indices(_normal_forms(self._coefficients), symmetric=True)]
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        return self._coefficients
+
+    @property
+    def a(self) -> np.ndarray:
+        return self._coefficients[:, 0]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self._coefficients[:, 1]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self._coefficients[:, 2]
+
+    @property
+    def gradient(self) -> np.ndarray:
+        """ gradients of every line, with `inf` for vertical lines """
+
+        return _gradients(self._coefficients)
+
+    def _columns(self):
+        """ coefficients and gradients as a tuple of 1-D arrays """
+        return self.a, self.b, self.c, self.gradient
+
+    def intersections(self, other: Union[Line, "LineArray"]) -> Tuple[PointArray, np.ndarray]:
+        """
+        intersect every line with a single `Line`, or with every line of
+        another `LineArray`
+
+        For a `LineArray` of length M, the result holds N * M intersections
+        in row-major order, i.e. row `i * M + j` is the intersection of line
+        `i` of this array with line `j` of `other`. Parallel pairs are marked
+        `False` in the returned mask and have `nan` coordinates.
+        """
+
+        if isinstance(other, Line):
+            other = LineArray([other])
+
+        # broadcast an `(N, 1)` column against a `(1, M)` row
+        first = tuple(column[:, np.newaxis] for column in self._columns())
+        second = tuple(column[np.newaxis, :] for column in other._columns())
+
+        x, y, valid = _intersect(first, second)
+
+        return PointArray(np.column_stack((x.ravel(), y.ravel()))), valid.ravel()
+
+    def pairwise_intersections(self) -> Tuple[PointArray, np.ndarray]:
+        """
+        intersect every pair of distinct lines in this array
+
+        Pairs are ordered in the same way as `numpy.triu_indices(len(self), k=1)`.
+        Parallel pairs are marked `False` in the returned mask and have `nan`
+        coordinates.
+        """
+
+        n = len(self)
+        columns = self._columns()
+
+        coordinates = np.empty((n * (n - 1) // 2, 2))
+        valid = np.empty(n * (n - 1) // 2, dtype=bool)
+        position = 0
+
+        # work through blocks of rows to keep the memory use bounded for large arrays
+        rows_per_block = max(1, _BLOCK_SIZE // max(n, 1))
+
+        for start in range(0, n - 1, rows_per_block):
+            stop = min(start + rows_per_block, n - 1)
+
+            # rows `start <= i < stop` against columns `j > start`,
+            # keeping only the upper triangle `j > i`
+            first = tuple(column[start:stop, np.newaxis] for column in columns)
+            second = tuple(column[np.newaxis, start + 1:] for column in columns)
+
+            upper = np.arange(start, stop)[:, np.newaxis] < np.arange(start + 1, n)
+            x, y, block_valid = _intersect(first, second)
+
+            count = np.count_nonzero(upper)
+            coordinates[position:position + count, 0] = x[upper]
+            coordinates[position:position + count, 1] = y[upper]
+            valid[position:position + count] = block_valid[upper]
+            position += count
+
+        return PointArray(coordinates), valid
+
+    def clip(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        the part of every line inside a box, as an `(N, 2, 2)` array of the ends
+        `((x1, y1), (x2, y2))` of the segments, and a mask of the lines that
+        cross the box
+
+        Lines which miss the box, or only touch one of its corners, are marked
+        `False` and have `nan` ends. Each end is exactly on an edge of the box,
+        and where an end is on two edges (a corner), the first edge in the order
+        `min_x`, `max_x`, `min_y`, `max_y` is used. The ends of each segment are
+        in the same order.
+        """
+
+        a, b, c = self._coefficients.T
+        rows = np.arange(len(self))
+
+        # the point on each line closest to the origin, and its direction
+        norm = a * a + b * b
+        x0, y0 = -a * c / norm, -b * c / norm
+        dx, dy = -b, a
+
+        # Liang-Barsky: the line crosses each edge at `t = q / p` along its
+        # direction, entering the box through edges with `p < 0`
+        p = np.column_stack((-dx, dx, -dy, dy))
+        q = np.column_stack((x0 - min_x, max_x - x0, y0 - min_y, max_y - y0))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = q / p
+
+        entering = np.where(p < 0, t, -np.inf)
+        leaving = np.where(p > 0, t, np.inf)
+
+        # `argmax` and `argmin` take the first edge of any tie, so corners are deterministic
+        first, last = entering.argmax(axis=1), leaving.argmin(axis=1)
+
+        # lines parallel to an edge miss the box if they are outside that edge
+        visible = (entering[rows, first] < leaving[rows, last]) & ~np.any((p == 0) & (q < 0), axis=1)
+
+        first, last = np.minimum(first, last), np.maximum(first, last)
+
+        edges = np.array([min_x, max_x, min_y, max_y], dtype=float)
+        segments = np.full((len(self), 2, 2), np.nan)
+
+        for end, edge in enumerate((first, last)):
+            value = edges[edge]
+            on_x = edge < 2
+
+            # solve for the other coordinate, so the end is exactly on the edge
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x = np.where(on_x, value, -(b * value + c) / a)
+                y = np.where(on_x, -(a * value + c) / b, value)
+
+            segments[visible, end, 0] = x[visible]
+            segments[visible, end, 1] = y[visible]
+
+        # `+ 0.0` turns `-0.0` into `0.0`
+        return segments + 0.0, visible
@@ -0,0 +1,266 @@
+from contextlib import contextmanager, nullcontext
+from math import ceil
+from random import Random
+from time import perf_counter
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+# quantiles given for every summary, in snapshots and in the Prometheus text
+QUANTILES = (0.5, 0.9, 0.99)
+
+# number of values kept by each summary to estimate its quantiles
+_RESERVOIR_SIZE = 1024
+
+# label names and values of a metric, sorted by name
+Labels = Tuple[Tuple[str, str], ...]
+
+# what `timing` gives while no registry is active
+_NOTHING = nullcontext()
+
+
+class Summary(NamedTuple):
+
+    """
+    The values observed for one metric.
+
+    count: the number of values
+    total: their sum
+    quantiles: an estimate of each of `QUANTILES`, from a sample of the values
+    """
+
+    count: int
+    total: float
+    quantiles: Dict[float, float]
+
+
+class _Summary:
+
+    """ a running count and total, with a uniform sample of the values for quantiles """
+
+    __slots__ = ("count", "total", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.samples = []
+
+    def observe(self, value: float, random: Random):
+        self.count += 1
+        self.total += value
+
+        if len(self.samples) < _RESERVOIR_SIZE:
+            self.samples.append(value)
+            return
+
+        # reservoir sampling, so that every value so far is equally likely to be kept
+        index = random.randrange(self.count)
+
+        if index < _RESERVOIR_SIZE:
+            self.samples[index] = value
+
+    def summary(self) -> Summary:
+        samples = sorted(self.samples)
+
+        # the nearest rank of each quantile
+        quantiles = {q: samples[max(ceil(q * len(samples)) - 1, 0)] for q in QUANTILES}
+
+        return Summary(self.count, self.total, quantiles)
+
+
+class _Timer:
+
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: Labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *exception):
+        self.registry.observe(self.name, perf_counter() - self.start, self.labels)
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: Labels, value: float) -> str:
+    """ one line of the Prometheus text format """
+
+    if labels:
+        name += "{" + ",".join(f'{key}="{_escape(label)}"' for key, label in labels) + "}"
+
+    return f"{name} {float(value)!r}\n"
+
+
+class MetricsRegistry:
+
+    """
+    Counters and summaries of what `fold` and `reflect` do, named and labelled
+    in the same way as Prometheus metrics.
+
+    origametry_operation_seconds{operation}: wall time of each call to an axiom (or `reflect`)
+    origametry_branch_seconds{operation, branch}: the same, by the case that the axiom took,
+        which is "cached" for results found in the cache
+    origametry_roots_seconds: time spent finding the roots of the cubic in axiom 6
+    origametry_remove_duplicates_size: lengths of the lists given to `remove_duplicates`
+    origametry_cache_lookups_total{result}: hits and misses of the active cache
+    """
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Labels], int] = {}
+        self._summaries: Dict[Tuple[str, Labels], _Summary] = {}
+        self._random = Random(0)
+
+        # the case taken by the call being measured, once it is known
+        self._branch: Optional[str] = None
+
+    def count(self, name: str, labels: Labels = (), amount: int = 1):
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, labels: Labels = ()):
+        key = (name, labels)
+
+        try:
+            summary = self._summaries[key]
+        except KeyError:
+            summary = self._summaries[key] = _Summary()
+
+        summary.observe(value, self._random)
+
+    def measure(self, operation: str, function, *args):
+        """ call `function(*args)`, recording its wall time for `operation` and its branch """
+
+        previous, self._branch = self._branch, None
+        start = perf_counter()
+
+        try:
+            return function(*args)
+
+        finally:
+            elapsed = perf_counter() - start
+            branch = "cached" if self._branch is None else self._branch
+            self._branch = previous
+
+            self.observe("origametry_operation_seconds", elapsed, (("operation", operation),))
+            self.observe("origametry_branch_seconds", elapsed, (("branch", branch), ("operation", operation)))
+
+    def snapshot(self) -> Dict[str, Dict[Labels, Union[int, Summary]]]:
+        """ the value of every metric so far, by name and then by labels """
+
+        snapshot = {}
+
+        for (name, labels), value in self._counters.items():
+            snapshot.setdefault(name, {})[labels] = value
+
+        for (name, labels), summary in self._summaries.items():
+            snapshot.setdefault(name, {})[labels] = summary.summary()
+
+        return snapshot
+
+    def reset(self):
+        self._counters.clear()
+        self._summaries.clear()
+
+    def prometheus(self) -> str:
+        """ every metric in the Prometheus text exposition format """
+
+        lines = []
+        snapshot = self.snapshot()
+        summaries = {name for name, _ in self._summaries}
+
+        for name in sorted(snapshot):
+            metrics = snapshot[name]
+            kind = "summary" if name in summaries else "counter"
+
+            lines.append(f"# TYPE {name} {kind}\n")
+
+            for labels in sorted(metrics):
+                value = metrics[labels]
+
+                if kind == "counter":
+                    lines.append(_sample(name, labels, value))
+                    continue
+
+                for q, estimate in value.quantiles.items():
+                    lines.append(_sample(name, _labels({**dict(labels), "quantile": q}), estimate))
+
+                lines.append(_sample(f"{name}_sum", labels, value.total))
+                lines.append(_sample(f"{name}_count", labels, value.count))
+
+        return "".join(lines)
+
+
+# the registry recording what `fold` and `reflect` do, if any (metrics are opt-in)
+_active: Optional[MetricsRegistry] = None
+
+
+def active_registry() -> Optional[MetricsRegistry]:
+    return _active
+
+
+def enable_metrics() -> MetricsRegistry:
+    """ start recording metrics in a new registry """
+
+    global _active
+    _active = MetricsRegistry()
+
+    return _active
+
+
+def disable_metrics():
+    global _active
+    _active = None
+
+
+@contextmanager
+def measuring(registry: Optional[MetricsRegistry] = None) -> Iterator[MetricsRegistry]:
+    """
+    record metrics within a `with` block, in either the given registry or a new
+    one, and restore the previous registry (if any) on exit
+    """
+
+    global _active
+    previous = _active
+    _active = registry if registry is not None else MetricsRegistry()
+
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+# Hooks for the code being measured. Each does nothing but check for a registry
+# while none is active, so they can stay in the hot paths.
+
+def branch(name: str):
+    """ mark the case taken by the call being measured, unless one is marked already """
+
+    if _active is not None and _active._branch is None:
+        _active._branch = name
+
+
+def count(name: str, **labels):
+    if _active is not None:
+        _active.count(name, _labels(labels))
+
+
+def observe(name: str, value: float, **labels):
+    if _active is not None:
+        _active.observe(name, value, _labels(labels))
+
+
+def timing(name: str, **labels):
+    """ a context manager recording the time taken by its block, or a no-op one """
+
+    if _active is None:
+        return _NOTHING
+
+    return _Timer(_active, name, _labels(labels))
@@ -0,0 +1,114 @@
+import os
+import signal
+import threading
+from functools import partial
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence
+
+from .fold import fold
+from .helpers import default_chunksize
+
+
+class Outcome(NamedTuple):
+
+    """
+    The result of one call in `fold_parallel`.
+
+    creases: what `fold` returned, or `None` if it raised an exception
+    exception: the exception raised (a `TimeoutError` if the call ran out of time), or `None`
+    """
+
+    creases: Any
+    exception: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+def _alarm(signum, frame):
+    raise TimeoutError("The fold took longer than the timeout")
+
+
+def _solve(arguments: Sequence, timeout: Optional[float]) -> Outcome:
+    """ fold one tuple of arguments, reporting any exception rather than raising it """
+
+    try:
+        if timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+
+        try:
+            creases = fold(*arguments)
+        finally:
+            if timeout is not None:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+
+    except Exception as exception:
+        # tracebacks hold frames, which cannot be sent back from a worker
+        return Outcome(None, exception.with_traceback(None))
+
+    return Outcome(creases, None)
+
+
+def fold_parallel(
+    arguments: Iterable[Sequence],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[Outcome]:
+    """
+    call `fold(*item)` for every tuple of points and lines in `arguments`, spread
+    over a pool of `workers` processes (one per CPU by default), and return an
+    `Outcome` for each in the same order
+
+    Items are sent to the workers `chunksize` at a time, which by default gives
+    each worker a few chunks, to keep the cost of sending them small.
+
+    An exception (including `TimeoutError` for a fold that runs longer than
+    `timeout` seconds) is reported in the outcome of its item and the rest of
+    the batch carries on. With one worker, everything runs in this process
+    instead, so a timeout can then only be used from the main thread. Each
+    worker process has its own cache (see `caching`).
+    """
+
+    arguments = list(arguments)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers < 1:
+        raise ValueError("There must be at least one worker")
+
+    if chunksize is None:
+        chunksize = default_chunksize(len(arguments), workers)
+    elif chunksize < 1:
+        raise ValueError("The chunk size must be at least 1")
+
+    if timeout is not None and not timeout > 0:
+        raise ValueError("The timeout must be positive")
+
+    # timeouts interrupt a fold with an alarm signal, which only exists on Unix
+    if timeout is not None and not (hasattr(signal, "setitimer") and hasattr(signal, "SIGALRM")):
+        raise NotImplementedError("Timeouts are not supported on this platform")
+
+    # and only the main thread may set a handler for it
+    if timeout is not None and workers == 1 and threading.current_thread() is not threading.main_thread():
+        raise RuntimeError("Timeouts with one worker can only be used from the main thread")
+
+    solve = partial(_solve, timeout=timeout)
+
+    if workers == 1:
+        if timeout is None:
+            return [solve(item) for item in arguments]
+
+        previous = signal.signal(signal.SIGALRM, _alarm)
+
+        try:
+            return [solve(item) for item in arguments]
+        finally:
+            signal.signal(signal.SIGALRM, previous)
+
+    # only loaded when needed, since it imports `multiprocessing`
+    from concurrent.futures import ProcessPoolExecutor
+
+    initializer = None if timeout is None else partial(signal.signal, signal.SIGALRM, _alarm)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+        return list(executor.map(solve, arguments, chunksize=chunksize))
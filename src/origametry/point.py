@@ -1,16 +1,40 @@
-from .helpers import projection, is_close
+from .helpers import is_close, hash_cell
+from .predicates import is_on
 
 
 class Point:
 
-    """ A simple container class for Cartesian coordinates """
+    """
+    A simple container class for Cartesian coordinates
+
+    Points are immutable, so they can be shared freely and used in sets or as
+    dictionary keys. Points that compare equal have the same hash, except in the
+    rare case that their coordinates sit either side of a cell of `hash_cell`.
+    """
+
+    __slots__ = ("_x", "_y")
 
     def __init__(self, x, y):
-        self._x = x
-        self._y = y
+        object.__setattr__(self, "_x", x)
+        object.__setattr__(self, "_y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot set {name!r}: 'Point' objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete {name!r}: 'Point' objects are immutable")
 
     def __copy__(self):
-        return Point(self._x, self._y)
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self._x, self._y))
+
+    def __hash__(self):
+        return hash(hash_cell((self._x, self._y)))
 
     def __eq__(self, other):
         if not isinstance(other, Point):
@@ -30,4 +54,4 @@ class Point:
         return self._y
 
     def isOn(self, line) -> bool:
-        return self == projection(self, line)
+        return is_on(self, line)
@@ -0,0 +1,350 @@
+import numpy as np
+from itertools import product
+from typing import Iterable, Iterator, List, Union
+
+from .line import Line
+from .point import Point
+from .helpers import REL_TOL, ABS_TOL
+
+
+def is_close_array(a, b) -> np.ndarray:
+    """
+    element-wise version of `is_close`, matching `math.isclose` exactly
+    (unlike `numpy.isclose`, which is not symmetric in its arguments)
+    """
+
+    tolerance = np.maximum(REL_TOL * np.maximum(np.abs(a), np.abs(b)), ABS_TOL)
+
+    # infinities are only equal to themselves, as in `math.isclose`
+    with np.errstate(invalid="ignore"):
+        return (a == b) | ((np.abs(a - b) <= tolerance) & np.isfinite(tolerance))
+
+
+def grid_coordinates(values: np.ndarray) -> np.ndarray:
+    """ element-wise version of `grid_coordinate` for an array of finite values """
+
+    magnitude = np.abs(values)
+    threshold = ABS_TOL / REL_TOL
+
+    scaled = np.where(
+        magnitude <= threshold,
+        magnitude / ABS_TOL,
+        (1 + np.log(np.maximum(magnitude, threshold) * REL_TOL / ABS_TOL)) / REL_TOL,
+    )
+
+    return np.copysign(scaled, values)
+
+
+def _hash_cells(cells: np.ndarray) -> np.ndarray:
+    """ combine each row of cells into a single (not necessarily unique) integer """
+
+    hashes = np.zeros(len(cells), dtype=np.uint64)
+
+    for column in cells.T:
+        hashes = (hashes ^ column.astype(np.uint64)) * np.uint64(0x100000001B3)
+
+    return hashes
+
+
+def _exact_repeats(values: np.ndarray) -> np.ndarray:
+    """
+    mask of the rows that are an exact copy of an earlier row
+
+    Rows are grouped by a hash of their bits, so a few copies may be missed
+    after a hash collision, but a row is never marked by mistake.
+    """
+
+    # `+ 0.0` turns `-0.0` into `0.0`, so that both have the same bits
+    bits = np.ascontiguousarray(values + 0.0).view(np.uint64)
+    hashes = _hash_cells(bits)
+
+    order = np.argsort(hashes, kind="stable")
+    ordered = values[order]
+
+    repeats = np.zeros(len(values), dtype=bool)
+    repeats[order[1:]] = (hashes[order[1:]] == hashes[order[:-1]]) & (ordered[1:] == ordered[:-1]).all(axis=1)
+
+    return repeats
+
+
+def _candidate_pairs(scaled: np.ndarray):
+    """
+    get every pair of rows `i < j` that could be close, from rows of values
+    already scaled by `grid_coordinate`, plus some extra pairs from hash collisions
+    """
+
+    cells = np.floor(scaled / 2).astype(np.int64)
+
+    # close values are at most 1 apart after scaling, so each row only needs to look
+    # in the neighbouring cell on the nearest side; pairs that straddle a cell
+    # boundary are still found by at least one of their two rows
+    sides = np.where(scaled - 2 * cells < 1, -1, 1)
+
+    hashes = _hash_cells(cells)
+    order = np.argsort(hashes, kind="stable")
+    sorted_hashes = hashes[order]
+
+    firsts, seconds = [], []
+
+    for offset in product((0, 1), repeat=cells.shape[1]):
+        neighbours = _hash_cells(cells + sides * np.array(offset))
+
+        # searching in order is much faster than searching at random
+        query_order = np.argsort(neighbours)
+        start = np.empty(len(cells), dtype=np.int64)
+        stop = np.empty(len(cells), dtype=np.int64)
+        start[query_order] = np.searchsorted(sorted_hashes, neighbours[query_order], side="left")
+        stop[query_order] = np.searchsorted(sorted_hashes, neighbours[query_order], side="right")
+        counts = stop - start
+
+        # expand each row into one pair per row found in the neighbouring cell
+        first = np.repeat(np.arange(len(cells)), counts)
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        second = order[np.repeat(start, counts) + positions]
+
+        distinct = first != second
+        firsts.append(np.minimum(first, second)[distinct])
+        seconds.append(np.maximum(first, second)[distinct])
+
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+# iterations of vectorised propagation before finishing row by row in `unique_indices`
+_MAX_ROUNDS = 16
+
+
+def unique_indices(values: np.ndarray, symmetric: bool = False) -> np.ndarray:
+    """
+    get the indices of the first of each group of fuzzily equal rows in an `(N, D)`
+    array, i.e. the rows that `remove_duplicates` would keep
+
+    Rows are hashed into the same grid as `grid_cell`, so only rows in the same
+    or neighbouring cells are ever compared. A row is then dropped when it is
+    close to an earlier row that is kept, which is resolved for all rows at once.
+    If `symmetric`, a row is also equal to the negation of a close row, as for
+    the normal forms of lines.
+    """
+
+    values = np.asarray(values, dtype=float)
+    keep = np.zeros(len(values), dtype=bool)
+
+    finite = np.isfinite(values).all(axis=1)
+
+    # rows with infinities are rare, so they are compared one by one,
+    # while rows with `nan` never compare equal to anything
+    for row in np.flatnonzero(~finite):
+        kept = values[np.flatnonzero(keep)]
+        close = is_close_array(kept, values[row]).all(axis=1)
+
+        if symmetric:
+            close |= is_close_array(kept, -values[row]).all(axis=1)
+
+        keep[row] = not close.any()
+
+    # exact copies of an earlier row are always dropped, so remove them up front
+    rows = np.flatnonzero(finite)
+
+    if len(rows) == 0:
+        return np.flatnonzero(keep)
+
+    rows = rows[~_exact_repeats(values[rows])]
+    candidates = values[rows]
+
+    if symmetric:
+        # search the rows along with their negations, then map each pair back
+        candidates = np.concatenate((candidates, -candidates))
+
+    first, second = _candidate_pairs(grid_coordinates(candidates))
+
+    close = is_close_array(candidates[first], candidates[second]).all(axis=1)
+    first, second = first[close], second[close]
+
+    if symmetric:
+        first, second = first % len(rows), second % len(rows)
+        first, second = np.minimum(first, second), np.maximum(first, second)
+
+        distinct = first != second
+        first, second = first[distinct], second[distinct]
+
+    # status of each row: 1 for kept, -1 for dropped and 0 for undecided
+    status = np.ones(len(rows), dtype=np.int8)
+    status[second] = 0
+
+    for _ in range(_MAX_ROUNDS):
+        undecided = status[second] == 0
+
+        if not undecided.any():
+            break
+
+        earlier, later = first[undecided], second[undecided]
+
+        # a row is dropped as soon as any earlier close row is kept,
+        # and kept once every earlier close row has been dropped
+        dropped = np.zeros(len(rows), dtype=bool)
+        dropped[later[status[earlier] == 1]] = True
+
+        waiting = np.zeros(len(rows), dtype=bool)
+        waiting[later[status[earlier] == 0]] = True
+
+        pending = status == 0
+        status[pending & dropped] = -1
+        status[pending & ~dropped & ~waiting] = 1
+
+    else:
+        # long chains of close rows are resolved in turn
+        undecided = status[second] == 0
+        neighbours = {}
+
+        for i, j in zip(first[undecided].tolist(), second[undecided].tolist()):
+            neighbours.setdefault(j, []).append(i)
+
+        for j in sorted(neighbours):
+            status[j] = -1 if any(status[i] == 1 for i in neighbours[j]) else 1
+
+    keep[rows[status == 1]] = True
+
+    return np.flatnonzero(keep)
+
+
+class PointArray:
+
+    """
+    A contiguous `(N, 2)` array of Cartesian coordinates.
+
+    Operations are vectorised over every point at once, so this is the
+    preferred container for large constructions. Initialisation supports:
+
+    1. A sequence of `Point` objects
+        points: Iterable[Point]
+
+    2. Anything that NumPy can convert to an `(N, 2)` array of floats
+        coordinates: array_like
+    """
+
+    def __init__(self, points: Union[Iterable[Point], np.ndarray, "PointArray"]):
+        if isinstance(points, PointArray):
+            coordinates = points.coordinates.copy()
+
+        elif isinstance(points, np.ndarray):
+            coordinates = np.array(points, dtype=float)
+
+        else:
+            points = list(points)
+
+            if points and all(isinstance(point, Point) for point in points):
+                coordinates = np.array([(point.x, point.y) for point in points], dtype=float)
+            else:
+                coordinates = np.array(points, dtype=float)
+
+        if coordinates.size == 0:
+            coordinates = coordinates.reshape(0, 2)
+
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise ValueError(f"Expected an array of shape (N, 2), not {coordinates.shape}")
+
+        self._coordinates = np.ascontiguousarray(coordinates)
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> "PointArray":
+        return cls(list(points))
+
+    def to_points(self) -> List[Point]:
+        return [Point(x, y) for x, y in self._coordinates.tolist()]
+
+    def __repr__(self):
+        return f"PointArray({self._coordinates.tolist()})"
+
+    def __len__(self):
+        return len(self._coordinates)
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self.to_points())
+
+    def __getitem__(self, index):
+        """ integers give a single `Point`; slices, masks and index arrays give a `PointArray` """
+
+        if isinstance(index, (int, np.integer)):
+            x, y = self._coordinates[index].tolist()
+            return Point(x, y)
+
+        return PointArray(self._coordinates[index])
+
+    def __eq__(self, other) -> np.ndarray:
+        """ element-wise fuzzy comparison against a `Point` or a `PointArray` of the same length """
+
+        if isinstance(other, Point):
+            other_coordinates = np.array([other.x, other.y], dtype=float)
+        elif isinstance(other, PointArray):
+            other_coordinates = other.coordinates
+        else:
+            return NotImplemented
+
+        return is_close_array(self._coordinates, other_coordinates).all(axis=1)
+
+    def __ne__(self, other) -> np.ndarray:
+        equal = self.__eq__(other)
+
+        if equal is NotImplemented:
+            return equal
+
+        return ~equal
+
+    # arrays are mutable containers, so they cannot be hashed
+    __hash__ = None
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._coordinates[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._coordinates[:, 1]
+
+    def unique(self) -> "PointArray":
+        """ remove repeated points, keeping the first of each in the same way as `remove_duplicates` """
+
+        return self[unique_indices(self._coordinates)]
+
+    def _signed_offsets(self, line: Line) -> np.ndarray:
+        """ signed distances `n.p + e` of every point from a line, by its normal form """
+
+        nx, ny, offset = line._form
+
+        return nx * self.x + ny * self.y + offset
+
+    def projection(self, line: Line) -> "PointArray":
+        """ get the closest point on a line to each point """
+
+        offsets = self._signed_offsets(line)
+
+        return PointArray(self._coordinates - np.outer(offsets, line.normal))
+
+    def reflect(self, crease: Line) -> "PointArray":
+        """ get the reflection of every point across the given crease """
+
+        offsets = self._signed_offsets(crease)
+
+        return PointArray(self._coordinates - 2 * np.outer(offsets, crease.normal))
+
+    def isOn(self, line: Line) -> np.ndarray:
+        """ mask of the points that lie on the given line """
+
+        return self == self.projection(line)
+
+    def distance(self, other: Union[Point, Line, "PointArray"]) -> np.ndarray:
+        """ distances to a single `Point` or `Line`, or element-wise to another `PointArray` """
+
+        if isinstance(other, Point):
+            return np.hypot(self.x - other.x, self.y - other.y)
+
+        if isinstance(other, Line):
+            return np.abs(self._signed_offsets(other))
+
+        if isinstance(other, PointArray):
+            return np.hypot(self.x - other.x, self.y - other.y)
+
+        raise TypeError(f"'distance' cannot be calculated for type {type(other).__name__}")
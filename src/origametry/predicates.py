@@ -0,0 +1,205 @@
+from fractions import Fraction
+from math import isfinite
+from sys import float_info
+from typing import Optional
+
+from .helpers import ABS_TOL, REL_TOL, is_close, projection
+
+# relative error allowed for in the floating point filters, which is many times
+# the few rounding errors of each expression, since the filters only need to be
+# conservative: anything they cannot decide is worked out exactly instead
+_ERROR = 32 * float_info.epsilon
+
+# absolute error allowed for as well, in case of underflow to subnormal numbers
+_UNDERFLOW = 4 * float_info.min
+
+_INFINITY = float("inf")
+
+# the tolerances of `is_close`, as the exact values of those floats
+_REL_TOL = Fraction(REL_TOL)
+_ABS_TOL = Fraction(ABS_TOL)
+
+
+def _sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def determinant_sign(a: float, b: float, c: float, d: float) -> int:
+    """ the sign of `ad - bc`, exactly """
+
+    left, right = a * d, b * c
+    determinant = left - right
+
+    if abs(determinant) > _ERROR * (abs(left) + abs(right)) + _UNDERFLOW:
+        return _sign(determinant)
+
+    if not all(map(isfinite, (a, b, c, d))):
+        return _sign(determinant)
+
+    a, b, c, d = map(Fraction, (a, b, c, d))
+
+    return _sign(a * d - b * c)
+
+
+def orientation(p, q, r) -> int:
+    """
+    which side of the line from `p` to `q` the point `r` is on: 1 for the left
+    (anticlockwise), -1 for the right (clockwise) and 0 for exactly on the line
+    """
+
+    left = (q.x - p.x) * (r.y - p.y)
+    right = (q.y - p.y) * (r.x - p.x)
+    determinant = left - right
+
+    if abs(determinant) > _ERROR * (abs(left) + abs(right)) + _UNDERFLOW:
+        return _sign(determinant)
+
+    values = (p.x, p.y, q.x, q.y, r.x, r.y)
+
+    if not all(map(isfinite, values)):
+        return _sign(determinant)
+
+    px, py, qx, qy, rx, ry = map(Fraction, values)
+
+    return _sign((qx - px) * (ry - py) - (qy - py) * (rx - px))
+
+
+def are_parallel(line_1, line_2) -> bool:
+    """
+    whether two lines are parallel (or the same line), within the tolerance of
+    `is_close` on their unit normals
+
+    The coefficients of a line are already rounded, so lines made with the same
+    gradient are rarely exactly parallel, and an exact test would have them
+    meet far away. Equal gradients are always taken to be parallel.
+    """
+
+    if line_1.gradient == line_2.gradient:
+        return True
+
+    (nx_1, ny_1), (nx_2, ny_2) = line_1.normal, line_2.normal
+
+    # the normals may point either way, as for the equality of lines
+    return (
+        (is_close(nx_1, nx_2) and is_close(ny_1, ny_2)) or
+        (is_close(nx_1, -nx_2) and is_close(ny_1, -ny_2))
+    )
+
+
+def are_perpendicular(line_1, line_2) -> bool:
+    """
+    whether two lines are perpendicular, within the tolerance of `is_close` on
+    their unit normals, in the same way as `are_parallel`
+    """
+
+    # the dot product of the normals, as a determinant, is exactly zero
+    if determinant_sign(line_1.a, -line_1.b, line_2.b, line_2.a) == 0:
+        return True
+
+    (nx_1, ny_1), (nx_2, ny_2) = line_1.normal, line_2.normal
+
+    # one normal is the other turned by a right angle, either way
+    return (
+        (is_close(nx_1, -ny_2) and is_close(ny_1, nx_2)) or
+        (is_close(nx_1, ny_2) and is_close(ny_1, -nx_2))
+    )
+
+
+def is_on(point, line) -> bool:
+    """
+    whether a point is on a line within the tolerance of `Point.isOn`, i.e.
+    whether it is close to its exact projection onto the line
+    """
+
+    x, y, a, b, c = point.x, point.y, line.a, line.b, line.c
+
+    decision = _is_on_filtered(x, y, a, b, c)
+
+    if decision is not None:
+        return decision
+
+    if not all(map(isfinite, (x, y, a, b, c))):
+        return point == projection(point, line)
+
+    return _is_on_exact(*map(Fraction, (x, y, a, b, c)))
+
+
+def _is_on_filtered(x: float, y: float, a: float, b: float, c: float) -> Optional[bool]:
+    """ `is_on` in floating point, or `None` when rounding errors could change the answer """
+
+    residual = a * x + b * y + c
+    norm = a * a + b * b
+
+    # this also catches infinities and `nan`, which are never compared exactly
+    if not (float_info.min <= norm < _INFINITY and abs(residual) < _INFINITY):
+        return None
+
+    # the error in `residual / norm`
+    error = (_ERROR * (abs(a * x) + abs(b * y) + abs(c)) + _UNDERFLOW) / norm
+
+    for value, coefficient in ((x, a), (y, b)):
+        # the distance moved along this axis by the projection, as in `isclose`
+        shift = abs(residual * coefficient / norm)
+        shift_error = error * abs(coefficient) + _ERROR * shift + _UNDERFLOW
+
+        largest = abs(value) + shift
+        tolerance = REL_TOL * largest if REL_TOL * largest > ABS_TOL else ABS_TOL
+        tolerance_error = REL_TOL * shift_error + _ERROR * tolerance
+
+        if shift - shift_error > tolerance + tolerance_error:
+            return False
+
+        if shift + shift_error > tolerance - tolerance_error:
+            return None
+
+    return True
+
+
+def _is_on_exact(x: Fraction, y: Fraction, a: Fraction, b: Fraction, c: Fraction) -> bool:
+    residual = a * x + b * y + c
+    norm = a * a + b * b
+
+    for value, coefficient in ((x, a), (y, b)):
+        shift = residual * coefficient / norm
+        tolerance = max(_REL_TOL * max(abs(value), abs(value - shift)), _ABS_TOL)
+
+        if abs(shift) > tolerance:
+            return False
+
+    return True
+
+
+def tangency(centre, point, line) -> int:
+    """
+    compare the circle about `centre` through `point` with a line: 1 if the
+    circle crosses the line twice, 0 if it touches it and -1 if it misses it
+    """
+
+    dx, dy = point.x - centre.x, point.y - centre.y
+    a, b, c = line.a, line.b, line.c
+
+    # compare the squares of the radius and the distance to the line, both
+    # multiplied by `a^2 + b^2` so that there is no division or square root
+    residual = a * centre.x + b * centre.y + c
+    residual_error = _ERROR * (abs(a * centre.x) + abs(b * centre.y) + abs(c)) + _UNDERFLOW
+
+    left = (dx * dx + dy * dy) * (a * a + b * b)
+    right = residual * residual
+    difference = left - right
+
+    error = _ERROR * (left + right) + residual_error * (2 * abs(residual) + residual_error) + _UNDERFLOW
+
+    if abs(difference) > error:
+        return _sign(difference)
+
+    values = (centre.x, centre.y, point.x, point.y, a, b, c)
+
+    if not all(map(isfinite, values)):
+        return _sign(difference)
+
+    centre_x, centre_y, point_x, point_y, a, b, c = map(Fraction, values)
+
+    radius = (point_x - centre_x) ** 2 + (point_y - centre_y) ** 2
+    offset = a * centre_x + b * centre_y + c
+
+    return _sign(radius * (a * a + b * b) - offset * offset)
@@ -2,31 +2,44 @@ from multimethod import multimethod
 
 from .line import Line
 from .point import Point
-from .helpers import projection, points_on_line
+from .cache import active_cache
+from .metrics import active_registry, branch
+from ._kernels import reflect_line, reflect_point
+
+
+def reflect(element, crease):
+    """ get the reflection of a point or line across the given crease """
+
+    registry = active_registry()
+
+    if registry is None:
+        return _cached(element, crease)
+
+    return registry.measure("reflect", _cached, element, crease)
+
+
+def _cached(element, crease):
+    cache = active_cache()
+
+    if cache is None:
+        return _reflect(element, crease)
+
+    return cache.call(("reflect", element, crease), _reflect, element, crease)
 
 
 @multimethod
-def reflect(line: Line, crease: Line):
+def _reflect(line: Line, crease: Line):
     """ get the reflection of a line across the given crease """
 
-    # first find two distinct points on the line
-    p1, p2 = tuple(points_on_line(line, 2))
+    branch("line")
 
-    # reflect both of those points across the crease
-    reflection_1 = reflect(p1, crease)
-    reflection_2 = reflect(p2, crease)
-
-    # get the line through the reflected points
-    return Line(reflection_1, reflection_2)
+    return Line(*reflect_line(line._form, crease._form))
 
 
 @multimethod
-def reflect(point: Point, crease: Line) -> Point:
+def _reflect(point: Point, crease: Line) -> Point:
     """ get the reflection of a point across the given crease """
 
-    midpoint = projection(point, crease)
-
-    x_offset = point.x - midpoint.x
-    y_offset = point.y - midpoint.y
+    branch("point")
 
-    return Point(point.x - 2 * x_offset, point.y - 2 * y_offset)
+    return Point(*reflect_point(point.x, point.y, crease._form))
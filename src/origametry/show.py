@@ -1,51 +1,58 @@
-import matplotlib.pyplot as plt
-from typing import Union, Optional
+import os
+from functools import partial
+from io import BytesIO
+from os import PathLike
+from typing import BinaryIO, Iterable, Mapping, Optional, Sequence, Union
 
 from .line import Line
 from .point import Point
-from .helpers import projection, points_on_line, remove_duplicates
+from .helpers import default_chunksize, is_close, points_on_line
 
 
-def _find_bounding_box(points: list[Point], lines: list[Line]):
+def _find_bounding_box(points: list[Point], lines: list[Line], quantile: Optional[float] = None):
     if points == [] and lines == []:
         # default empty box
         return (-1, -1, 1, 1)
 
-    # build a list of "points of interest"
-    intersections: list[Point] = []
-    projections: list[Point] = []
+    if quantile is not None and not 0 <= quantile < 0.5:
+        raise ValueError("The quantile must be at least 0 and less than 0.5")
 
-    if lines is not None:
-        # include any intersections of lines
-        for i, line_a in enumerate(lines):
-            for line_b in lines[i + 1:]:
-                if intersection := line_a.intersection(line_b):
-                    intersections.append(intersection)
+    # only loaded when something is shown, along with matplotlib
+    from . import _bounds
+    from .line_array import LineArray
+    from .point_array import PointArray
 
-        # include at least one point on every line (so some part of each line is shown)
-        if points is not None:
-            for point in points:
-                for line in lines:
-                    projections.append(projection(point, line))
+    coordinates = PointArray(points).coordinates
+    coefficients = LineArray(lines).coefficients
 
-    points_of_interest = remove_duplicates(list(points) + intersections + projections)
+    # the extent of every "point of interest": the points themselves, the
+    # intersections of lines (without the furthest, for a quantile) and a
+    # projection of every point onto every line (so some part of each line is shown)
+    if quantile is None:
+        intersections = _bounds.intersection_extent(coefficients)
+    else:
+        intersections = _bounds.intersection_quantiles(coefficients, quantile)
+
+    extent = _bounds.combine(
+        _bounds.point_extent(coordinates), intersections, _bounds.projection_extent(coordinates, coefficients)
+    )
 
-    if len(points_of_interest) == 0:
+    if extent is None:
         # only one line or parallel lines
         random_point = next(points_on_line(lines[0], 1))
+        coordinates = PointArray([random_point]).coordinates
 
-        points_of_interest.append(random_point)
-        points_of_interest += [projection(random_point, line) for line in lines[1:]]
+        extent = _bounds.combine(
+            _bounds.point_extent(coordinates), _bounds.projection_extent(coordinates, coefficients[1:])
+        )
 
     # get a box containing all points of interest
-    min_x = min(point.x for point in points_of_interest)
-    min_y = min(point.y for point in points_of_interest)
-    max_x = max(point.x for point in points_of_interest)
-    max_y = max(point.y for point in points_of_interest)
+    min_x, min_y, max_x, max_y = extent.tolist()
 
-    # extend the bounding box by a small, non-zero margin
+    # extend the bounding box by a small, non-zero margin (where the points of
+    # interest are all the same point, up to rounding)
     margin = max(max_x - min_x, max_y - min_y) / 4
-    if margin == 0:
+    if is_close(min_x, max_x) and is_close(min_y, max_y):
         margin = 1
 
     min_x -= margin
@@ -69,45 +76,20 @@ def _find_bounding_box(points: list[Point], lines: list[Line]):
     return min_x, min_y, max_x, max_y
 
 
-def _trim_to_box(
-    line: Line, min_x: float, min_y: float, max_x: float, max_y: float
-) -> Optional[tuple[Point, Point]]:
-    # find points of intersection (if they exist) with each bounding line
-    cross_min_x = line.intersection(Line(1, 0, -min_x))
-    cross_min_y = line.intersection(Line(0, 1, -min_y))
-    cross_max_x = line.intersection(Line(1, 0, -max_x))
-    cross_max_y = line.intersection(Line(0, 1, -max_y))
+def _segments(lines: list[Line], box):
+    """ an `(N, 2, 2)` array of the ends of every line that crosses the box, trimmed to its edges """
 
-    # at least two of these will be on the edge of the box,
-    # while others may be outsde the box, None, or duplicates
-    within_box: list[Point] = []
+    # only loaded when something is shown, along with matplotlib
+    from .line_array import LineArray
 
-    for point in (cross_min_x, cross_max_x):
-        if point and min_y <= point.y <= max_y:
-            within_box.append(point)
-    for point in (cross_min_y, cross_max_y):
-        if point and min_x <= point.x <= max_x:
-            within_box.append(point)
+    segments, visible = LineArray(lines).clip(*box)
 
-    within_box = remove_duplicates(within_box)
+    return segments[visible]
 
-    if len(within_box) < 2:
-        return None
-    if len(within_box) == 2:
-        return tuple(within_box)
-    if len(within_box) > 2:  # pragma: no cover
-        # this can happen due to floating point errors at the corners of the box
-        if cross_min_x in within_box and cross_max_x in within_box:
-            return (cross_min_x, cross_max_x)
-        if cross_min_y in within_box and cross_max_y in within_box:
-            return (cross_min_y, cross_max_y)
 
+def _scene(points_and_lines, creases, bounding_box, quantile):
+    """ sort out the points, lines and creases to draw, and the box to draw them in """
 
-def show(
-    *points_and_lines: list[Union[Point, Line]],
-    creases: Optional[Union[list[Line], Line]]=None,
-    bounding_box: Optional[tuple[Union[int, float]]]=None
-):
     points = [x for x in points_and_lines if isinstance(x, Point)]
     lines = [x for x in points_and_lines if isinstance(x, Line)]
     if creases is None:
@@ -116,24 +98,128 @@ def show(
         creases = [creases]
     else:
         creases = list(creases)
-    box = bounding_box or _find_bounding_box(points, lines + creases)
+    box = bounding_box or _find_bounding_box(points, lines + creases, quantile)
+
+    return points, lines, creases, box
+
 
-    for point in points:
-        plt.plot(point.x, point.y, "ok", markerfacecolor="#d0d")
+def _draw(ax, points: list[Point], lines: list[Line], creases: list[Line], box):
+    from matplotlib.collections import LineCollection
 
-    for line in lines:
-        if (trimmed := _trim_to_box(line, *box)) is not None:
-            start, end = trimmed
-            plt.plot([start.x, end.x], [start.y, end.y], color="#d0d")
+    # one artist for each kind of element, rather than one per element, which
+    # keeps drawing quick even for very large crease patterns
+    if points:
+        ax.scatter(
+            [point.x for point in points], [point.y for point in points],
+            marker="o", facecolors="#d0d", edgecolors="k", linewidths=1
+        )
 
-    for crease in creases:
-        if (trimmed := _trim_to_box(crease, *box)) is not None:
-            start, end = trimmed
-            plt.plot([start.x, end.x], [start.y, end.y], "--", color="#abf")
+    if len(segments := _segments(lines, box)):
+        ax.add_collection(LineCollection(segments, colors="#d0d"))
+
+    if len(segments := _segments(creases, box)):
+        ax.add_collection(LineCollection(segments, colors="#abf", linestyles="--"))
 
-    ax = plt.gca()
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlim(box[0], box[2])
     ax.set_ylim(box[1], box[3])
 
+
+def _render(scene, path, format, dpi) -> Optional[bytes]:
+    # a figure of its own, away from pyplot, so nothing is shown or kept afterwards
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    _draw(figure.add_subplot(), *scene)
+
+    if path is not None:
+        figure.savefig(path, format=format, dpi=dpi)
+        return None
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format=format or "png", dpi=dpi)
+
+    return buffer.getvalue()
+
+
+def render(
+    *points_and_lines: list[Union[Point, Line]],
+    creases: Optional[Union[list[Line], Line]]=None,
+    bounding_box: Optional[tuple[Union[int, float]]]=None,
+    quantile: Optional[float]=None,
+    path: Optional[Union[str, PathLike, BinaryIO]]=None,
+    format: Optional[str]=None,
+    dpi: Optional[float]=None
+) -> Optional[bytes]:
+    """
+    draw points, lines and creases in the same way as `show`, but without a
+    window: write the image to `path` (a file name or binary file), or return
+    its contents if there is no path
+
+    The `format` is any that matplotlib can save, such as "png", "svg" or "pdf",
+    which defaults to the extension of the path, or to "png".
+    """
+
+    return _render(_scene(points_and_lines, creases, bounding_box, quantile), path, format, dpi)
+
+
+def _render_one(scene: Union[Sequence, Mapping], options: dict) -> Optional[bytes]:
+    if isinstance(scene, Mapping):
+        scene = dict(scene)
+        return render(*scene.pop("elements", ()), **{**options, **scene})
+
+    return render(*scene, **options)
+
+
+def render_many(
+    scenes: Iterable[Union[Sequence[Union[Point, Line]], Mapping]],
+    workers: Optional[int]=None,
+    **options
+) -> list[Optional[bytes]]:
+    """
+    `render` many scenes, spread over a pool of `workers` processes (one per
+    CPU by default), returning the result for each in the same order
+
+    Each scene is either a sequence of points and lines, or a dictionary of
+    arguments for `render` with the points and lines under "elements". Any
+    other keyword arguments are passed to `render` for every scene.
+    """
+
+    scenes = list(scenes)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers < 1:
+        raise ValueError("There must be at least one worker")
+
+    render_one = partial(_render_one, options=options)
+
+    if workers == 1:
+        return [render_one(scene) for scene in scenes]
+
+    # only loaded when needed, since it imports `multiprocessing`
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(render_one, scenes, chunksize=default_chunksize(len(scenes), workers)))
+
+
+def show(
+    *points_and_lines: list[Union[Point, Line]],
+    creases: Optional[Union[list[Line], Line]]=None,
+    bounding_box: Optional[tuple[Union[int, float]]]=None,
+    quantile: Optional[float]=None,
+    output: Optional[Union[str, PathLike, BinaryIO]]=None
+):
+    scene = _scene(points_and_lines, creases, bounding_box, quantile)
+
+    # write the image straight to a file, without a window
+    if output is not None:
+        _render(scene, output, None, None)
+        return
+
+    # importing pyplot is slow, so it waits until something is actually shown
+    import matplotlib.pyplot as plt
+
+    _draw(plt.gca(), *scene)
+
     plt.show()
@@ -0,0 +1,381 @@
+from bisect import bisect_left, bisect_right
+from math import atan2, cos, floor, hypot, isfinite, pi, sin
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .helpers import ABS_TOL, REL_TOL
+from .line import Line
+from .point import Point
+
+# number of buckets that the directions of lines are split into
+_ANGLE_BUCKETS = 256
+
+# the angles bounding each bucket, with their cosines and sines
+_BUCKET_EDGES = [
+    (i * pi / _ANGLE_BUCKETS, cos(i * pi / _ANGLE_BUCKETS), sin(i * pi / _ANGLE_BUCKETS))
+    for i in range(_ANGLE_BUCKETS + 1)
+]
+
+# the grid of points is refined once it holds more than this many points per cell
+_MAX_OCCUPANCY = 8
+
+# the grid of points is never refined below this cell size
+_MIN_CELL_SIZE = 1e-6
+
+
+def _margin(x: float, y: float) -> float:
+    """
+    a distance comfortably beyond the tolerance of `Point.isOn` for coordinates
+    of this size, used to gather candidates which are then checked exactly
+    """
+
+    return 4 * (ABS_TOL + REL_TOL * max(abs(x), abs(y)))
+
+
+def _is_near(normal: Tuple[float, float, float], x: float, y: float) -> bool:
+    """ a quick check of whether a point is within `_margin` of a line, before `Point.isOn` """
+
+    cosine, sine, offset = normal
+
+    return abs(x * cosine + y * sine - offset) <= _margin(x, y)
+
+
+def _normal_form(line: Line) -> Tuple[float, float]:
+    """
+    the direction `angle` in `[0, pi)` of the unit normal of a line, and its
+    signed `offset` from the origin, so that `x cos(angle) + y sin(angle) = offset`
+    """
+
+    (nx, ny), offset = line.normal, -line.offset
+
+    # `Line.normal` points along positive `x`, so the angle is in `[-pi / 2, pi / 2]`
+    angle = atan2(ny, nx)
+
+    if angle < 0:
+        angle, offset = angle + pi, -offset
+
+    return angle, offset
+
+
+def _offset_range(x: float, y: float, bucket: int) -> Tuple[float, float]:
+    """ the least and greatest offsets of lines through `(x, y)` with angles in a bucket """
+
+    start, start_cos, start_sin = _BUCKET_EDGES[bucket]
+    end, end_cos, end_sin = _BUCKET_EDGES[bucket + 1]
+
+    first = x * start_cos + y * start_sin
+    last = x * end_cos + y * end_sin
+    low, high = min(first, last), max(first, last)
+
+    # the offset is `r cos(angle - phi)`, which peaks at `phi` and dips at `phi +- pi`
+    phi = atan2(y, x)
+
+    if start <= phi <= end:
+        high = hypot(x, y)
+    if start <= phi + pi <= end or start <= phi - pi <= end:
+        low = -hypot(x, y)
+
+    return low, high
+
+
+class SpatialIndex:
+
+    """
+    An index of points and lines for fast geometric queries in large constructions.
+
+    Points are stored in a uniform grid of cells, which is refined as it fills up.
+    Lines are split into buckets by the direction of their normal, and sorted by
+    their offset from the origin within each bucket. Queries only visit nearby
+    cells and buckets, then check each candidate with the usual tolerance, so
+    `points_on` and `lines_through` agree with `Point.isOn`.
+
+    Elements can be added at any time, and every query returns them in the
+    order they were added. Points with infinite or nan coordinates can be added
+    and found with `index`, but are left out of the other queries.
+    """
+
+    def __init__(self, elements: Iterable[Union[Point, Line]] = (), cell_size: float = 1.0):
+        if not cell_size > 0:
+            raise ValueError("The cell size must be positive")
+
+        self._points: List[Point] = []
+        self._lines: List[Line] = []
+
+        # grid of points, with the occupied columns and rows for walking along lines
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._columns: Set[int] = set()
+        self._rows: Set[int] = set()
+
+        # the offsets of the lines in each angle bucket, sorted, with their indices
+        self._offsets: Dict[int, List[float]] = {}
+        self._line_indices: Dict[int, List[int]] = {}
+
+        # coordinates of the points and unit normals of the lines, for quick checks
+        self._coordinates: List[Tuple[float, float]] = []
+        self._normals: List[Tuple[float, float, float]] = []
+
+        # positions of the points and lines by hash, for finding equal elements
+        self._point_hashes: Dict[int, List[int]] = {}
+        self._line_hashes: Dict[int, List[int]] = {}
+
+        for element in elements:
+            self.add(element)
+
+    def __len__(self):
+        return len(self._points) + len(self._lines)
+
+    def __contains__(self, element) -> bool:
+        return self.index(element) is not None
+
+    @property
+    def points(self) -> List[Point]:
+        return list(self._points)
+
+    @property
+    def lines(self) -> List[Line]:
+        return list(self._lines)
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def add(self, element: Union[Point, Line]) -> int:
+        """ add a point or line, and return its position among the points or lines """
+
+        if isinstance(element, Point):
+            return self._add_point(element)
+        if isinstance(element, Line):
+            return self._add_line(element)
+
+        raise TypeError(f"Only points and lines can be indexed, not {type(element).__name__!r}")
+
+    def extend(self, elements: Iterable[Union[Point, Line]]):
+        for element in elements:
+            self.add(element)
+
+    def index(self, element: Union[Point, Line]) -> Optional[int]:
+        """
+        the position of the first point or line equal to the given one, or
+        `None`, with the same tolerance (and hashing) as a `set`
+        """
+
+        if isinstance(element, Point):
+            known, hashes = self._points, self._point_hashes
+        elif isinstance(element, Line):
+            known, hashes = self._lines, self._line_hashes
+        else:
+            return None
+
+        for position in hashes.get(hash(element), ()):
+            if known[position] == element:
+                return position
+
+        return None
+
+    def nearest(self, point: Point) -> Optional[Point]:
+        """ the indexed point closest to the given one (the first, for a tie) """
+
+        candidates = self._nearest_candidates(point)
+
+        if not candidates:
+            return None
+
+        x, y = point.x, point.y
+        coordinates = self._coordinates
+
+        _, best = min((hypot(coordinates[i][0] - x, coordinates[i][1] - y), i) for i in candidates)
+
+        return self._points[best]
+
+    def within(self, point: Point, radius: float) -> List[Point]:
+        """ every indexed point at most `radius` away from the given point """
+
+        x, y = point.x, point.y
+        coordinates = self._coordinates
+
+        indices = [
+            index
+            for index in self._box(x - radius, y - radius, x + radius, y + radius)
+            if hypot(coordinates[index][0] - x, coordinates[index][1] - y) <= radius
+        ]
+
+        return [self._points[index] for index in sorted(indices)]
+
+    def points_on(self, line: Line) -> List[Point]:
+        """ every indexed point on the given line """
+
+        angle, offset = _normal_form(line)
+        normal = (cos(angle), sin(angle), offset)
+
+        indices = [
+            index
+            for index in self._along(line)
+            if _is_near(normal, *self._coordinates[index]) and self._points[index].isOn(line)
+        ]
+
+        return [self._points[index] for index in sorted(indices)]
+
+    def lines_through(self, point: Point) -> List[Line]:
+        """ every indexed line through the given point """
+
+        if not (isfinite(point.x) and isfinite(point.y)):
+            return []
+
+        x, y = point.x, point.y
+        margin = _margin(x, y)
+
+        indices = []
+
+        for bucket, offsets in self._offsets.items():
+            low, high = _offset_range(x, y, bucket)
+
+            start = bisect_left(offsets, low - margin)
+            end = bisect_right(offsets, high + margin)
+
+            indices.extend(self._line_indices[bucket][start:end])
+
+        return [
+            self._lines[index]
+            for index in sorted(indices)
+            if _is_near(self._normals[index], x, y) and point.isOn(self._lines[index])
+        ]
+
+    def _add_point(self, point: Point) -> int:
+        position = len(self._points)
+
+        self._points.append(point)
+        self._coordinates.append((point.x, point.y))
+        self._point_hashes.setdefault(hash(point), []).append(position)
+
+        if isfinite(point.x) and isfinite(point.y):
+            self._insert_cell(position)
+
+            if len(self._points) > _MAX_OCCUPANCY * len(self._cells) and self._cell_size > _MIN_CELL_SIZE:
+                self._regrid(self._cell_size / 2)
+
+        return position
+
+    def _add_line(self, line: Line) -> int:
+        position = len(self._lines)
+
+        self._lines.append(line)
+        self._line_hashes.setdefault(hash(line), []).append(position)
+
+        angle, offset = _normal_form(line)
+        self._normals.append((cos(angle), sin(angle), offset))
+
+        bucket = min(int(angle / pi * _ANGLE_BUCKETS), _ANGLE_BUCKETS - 1)
+
+        offsets = self._offsets.setdefault(bucket, [])
+        indices = self._line_indices.setdefault(bucket, [])
+
+        at = bisect_right(offsets, offset)
+        offsets.insert(at, offset)
+        indices.insert(at, position)
+
+        return position
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return floor(x / self._cell_size), floor(y / self._cell_size)
+
+    def _insert_cell(self, index: int):
+        point = self._points[index]
+        cell = self._cell(point.x, point.y)
+
+        self._cells.setdefault(cell, []).append(index)
+        self._columns.add(cell[0])
+        self._rows.add(cell[1])
+
+    def _regrid(self, cell_size: float):
+        """ rebuild the grid of points with smaller cells """
+
+        self._cell_size = cell_size
+        self._cells, self._columns, self._rows = {}, set(), set()
+
+        for index, point in enumerate(self._points):
+            if isfinite(point.x) and isfinite(point.y):
+                self._insert_cell(index)
+
+    def _box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[int]:
+        """ the indices of points in every cell overlapping a box """
+
+        (first_x, first_y), (last_x, last_y) = self._cell(min_x, min_y), self._cell(max_x, max_y)
+
+        # a big box is quicker to check against the occupied cells than cell by cell
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(self._cells):
+            return [
+                index
+                for (x, y), indices in self._cells.items()
+                if first_x <= x <= last_x and first_y <= y <= last_y
+                for index in indices
+            ]
+
+        return [
+            index
+            for x in range(first_x, last_x + 1)
+            for y in range(first_y, last_y + 1)
+            for index in self._cells.get((x, y), ())
+        ]
+
+    def _nearest_candidates(self, point: Point) -> List[int]:
+        """ indices of points which include the nearest one, searching rings of cells outwards """
+
+        if not self._cells or not (isfinite(point.x) and isfinite(point.y)):
+            return []
+
+        centre_x, centre_y = self._cell(point.x, point.y)
+        candidates = []
+        ring = 0
+
+        while True:
+            # once a ring has as many cells as the grid, checking every point is quicker
+            if 8 * ring > len(self._cells):
+                return [index for indices in self._cells.values() for index in indices]
+
+            if ring == 0:
+                cells = [(centre_x, centre_y)]
+            else:
+                cells = [
+                    (centre_x + dx, centre_y + dy)
+                    for dx in range(-ring, ring + 1)
+                    for dy in ((-ring, ring) if abs(dx) < ring else range(-ring, ring + 1))
+                ]
+
+            for cell in cells:
+                candidates.extend(self._cells.get(cell, ()))
+
+            # points beyond this ring are at least `ring` cells away, so the
+            # nearest point found so far is only beaten by another in the next ring
+            if candidates:
+                best = min(
+                    hypot(self._coordinates[index][0] - point.x, self._coordinates[index][1] - point.y)
+                    for index in candidates
+                )
+
+                if best <= ring * self._cell_size:
+                    return candidates
+
+            ring += 1
+
+    def _along(self, line: Line) -> List[int]:
+        """ the indices of points in every cell within the tolerance of a line """
+
+        if line.b and abs(line.b) >= abs(line.a):
+            # mostly horizontal: walk along the occupied columns
+            solve, occupied, cross = (lambda x: -(line.a * x + line.c) / line.b), self._columns, False
+        else:
+            solve, occupied, cross = (lambda y: -(line.b * y + line.c) / line.a), self._rows, True
+
+        indices = []
+
+        for along in occupied:
+            start, end = along * self._cell_size, (along + 1) * self._cell_size
+            low, high = sorted((solve(start), solve(end)))
+
+            margin = max(_margin(start, low), _margin(end, high))
+            first, last = floor((low - margin) / self._cell_size), floor((high + margin) / self._cell_size)
+
+            for across in range(first, last + 1):
+                indices.extend(self._cells.get((across, along) if cross else (along, across), ()))
+
+        return indices
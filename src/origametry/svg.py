@@ -0,0 +1,99 @@
+from os import PathLike
+from typing import Iterable, Optional, TextIO, Union
+
+from .line import Line
+from .point import Point
+from .show import _scene, _segments
+
+# number of lines (or points) turned into text at once, which bounds the
+# memory used for the text however large the scene is
+_BLOCK_SIZE = 1 << 12
+
+# sizes in pixels, matching matplotlib's defaults for `show`
+_POINT_RADIUS = 3
+_LINE_WIDTH = 1.5
+_DASHES = "5.55,2.4"
+
+
+def _write_segments(file: TextIO, lines: list[Line], box, scale: float):
+    min_x, _, _, max_y = box
+
+    for start in range(0, len(lines), _BLOCK_SIZE):
+        segments = _segments(lines[start:start + _BLOCK_SIZE], box)
+
+        # from the plane to the page, where y points down
+        segments[..., 0] = (segments[..., 0] - min_x) * scale
+        segments[..., 1] = (max_y - segments[..., 1]) * scale
+
+        file.write("".join(
+            f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}"/>\n'
+            for (x1, y1), (x2, y2) in segments.tolist()
+        ))
+
+
+def _write_points(file: TextIO, points: list[Point], box, scale: float):
+    min_x, min_y, max_x, max_y = box
+
+    for start in range(0, len(points), _BLOCK_SIZE):
+        file.write("".join(
+            f'<circle cx="{(point.x - min_x) * scale:.2f}" cy="{(max_y - point.y) * scale:.2f}" r="{_POINT_RADIUS}"/>\n'
+            for point in points[start:start + _BLOCK_SIZE]
+            if min_x <= point.x <= max_x and min_y <= point.y <= max_y
+        ))
+
+
+def _write(file: TextIO, points: list[Point], lines: list[Line], creases: list[Line], box, width: float):
+    min_x, min_y, max_x, max_y = box
+
+    scale = width / (max_x - min_x)
+    height = (max_y - min_y) * scale
+
+    file.write(
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.2f}" height="{height:.2f}" '
+        f'viewBox="0 0 {width:.2f} {height:.2f}">\n'
+        '<rect width="100%" height="100%" fill="#fff"/>\n'
+    )
+
+    # in the same order as `show` draws them, so creases are on top
+    file.write('<g fill="#d0d" stroke="#000" stroke-width="1">\n')
+    _write_points(file, points, box, scale)
+    file.write("</g>\n")
+
+    file.write(f'<g stroke="#d0d" stroke-width="{_LINE_WIDTH}">\n')
+    _write_segments(file, lines, box, scale)
+    file.write("</g>\n")
+
+    file.write(f'<g stroke="#abf" stroke-width="{_LINE_WIDTH}" stroke-dasharray="{_DASHES}">\n')
+    _write_segments(file, creases, box, scale)
+    file.write("</g>\n")
+
+    file.write("</svg>\n")
+
+
+def write_svg(
+    file: Union[str, PathLike, TextIO],
+    *points_and_lines: list[Union[Point, Line]],
+    creases: Optional[Union[Iterable[Line], Line]]=None,
+    bounding_box: Optional[tuple[Union[int, float]]]=None,
+    quantile: Optional[float]=None,
+    width: float=360
+):
+    """
+    write points, lines and creases as an SVG image to `file` (a file name or
+    text file), in the same box and colours as `show`, without matplotlib
+
+    The image is written a block of elements at a time, so the text of a large
+    scene is never held in memory all at once. It is `width` pixels wide.
+    """
+
+    if not width > 0:
+        raise ValueError("The width must be positive")
+
+    scene = _scene(points_and_lines, creases, bounding_box, quantile)
+
+    if isinstance(file, (str, PathLike)):
+        with open(file, "w", encoding="utf-8") as opened:
+            _write(opened, *scene, width)
+    else:
+        _write(file, *scene, width)
@@ -0,0 +1,175 @@
+from math import cos, sin
+from typing import Sequence, Tuple
+
+from .line import Line
+from .point import Point
+from .helpers import is_close, hash_cell
+
+Matrix = Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]]
+
+
+class Transform:
+
+    """
+    An affine map of the plane, such as a fold or a sequence of folds, stored as
+    a 3x3 matrix acting on points `(x, y, 1)`.
+
+    Transforms compose with `@` in the same way as matrices, so `second @ first`
+    applies `first` and then `second`. Applying a transform to a `PointArray` or
+    `LineArray` is a single matrix product, however many folds it is made of.
+
+    Transforms are immutable, and compare equal when their matrices are close.
+    """
+
+    __slots__ = ("_matrix",)
+
+    def __init__(self, matrix: Sequence[Sequence[float]]):
+        rows = tuple(tuple(float(value) for value in row) for row in matrix)
+
+        if len(rows) != 3 or any(len(row) != 3 for row in rows):
+            raise ValueError("The matrix of a transform must be 3x3")
+
+        if rows[2] != (0, 0, 1):
+            raise ValueError("The last row of the matrix of a transform must be (0, 0, 1)")
+
+        (a, b, _), (c, d, _), _ = rows
+
+        if a * d - b * c == 0:
+            raise ValueError("The matrix of a transform must be invertible")
+
+        object.__setattr__(self, "_matrix", rows)
+
+    @classmethod
+    def _affine(cls, a: float, b: float, tx: float, c: float, d: float, ty: float) -> "Transform":
+        """ the map `(a x + b y + tx, c x + d y + ty)`, without the checks of `__init__` """
+
+        transform = cls.__new__(cls)
+        object.__setattr__(transform, "_matrix", ((a, b, tx), (c, d, ty), (0.0, 0.0, 1.0)))
+
+        return transform
+
+    @classmethod
+    def identity(cls) -> "Transform":
+        return cls._affine(1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+    @classmethod
+    def reflection(cls, crease: Line) -> "Transform":
+        """ the fold across a crease, as done to a single element by `reflect` """
+
+        nx, ny, offset = crease._form
+
+        # `p - 2 (n.p + e) n`, as in `reflect_point`
+        return cls._affine(
+            1 - 2 * nx * nx, -2 * nx * ny, -2 * offset * nx,
+            -2 * nx * ny, 1 - 2 * ny * ny, -2 * offset * ny,
+        )
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> "Transform":
+        return cls._affine(1.0, 0.0, float(dx), 0.0, 1.0, float(dy))
+
+    @classmethod
+    def rotation(cls, angle: float, centre: Point = Point(0, 0)) -> "Transform":
+        """ the anticlockwise rotation by `angle` radians about a point """
+
+        cosine, sine = cos(angle), sin(angle)
+        x, y = centre.x, centre.y
+
+        return cls._affine(
+            cosine, -sine, x - cosine * x + sine * y,
+            sine, cosine, y - sine * x - cosine * y,
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot set {name!r}: 'Transform' objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete {name!r}: 'Transform' objects are immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (self._matrix,))
+
+    def __repr__(self):
+        return f"Transform({self._matrix})"
+
+    def __hash__(self):
+        return hash(hash_cell(self._matrix[0] + self._matrix[1]))
+
+    def __eq__(self, other):
+        if not isinstance(other, Transform):
+            return False
+
+        return all(
+            is_close(value, other_value)
+            for row, other_row in zip(self._matrix, other._matrix)
+            for value, other_value in zip(row, other_row)
+        )
+
+    def __matmul__(self, other: "Transform") -> "Transform":
+        if not isinstance(other, Transform):
+            return NotImplemented
+
+        (a, b, tx), (c, d, ty), _ = self._matrix
+        (p, q, sx), (r, s, sy), _ = other._matrix
+
+        # the last rows are both `(0, 0, 1)`, and so is the last row of the product
+        return Transform._affine(
+            a * p + b * r, a * q + b * s, a * sx + b * sy + tx,
+            c * p + d * r, c * q + d * s, c * sx + d * sy + ty,
+        )
+
+    @property
+    def matrix(self) -> Matrix:
+        return self._matrix
+
+    @property
+    def inverse(self) -> "Transform":
+        (a, b, tx), (c, d, ty), _ = self._matrix
+
+        determinant = a * d - b * c
+
+        # the inverse of the linear part, then the translation undone
+        p, q, r, s = d / determinant, -b / determinant, -c / determinant, a / determinant
+
+        return Transform._affine(p, q, -(p * tx + q * ty), r, s, -(r * tx + s * ty))
+
+    def apply(self, element):
+        """
+        the image of a `Point`, `Line`, `PointArray` or `LineArray`
+
+        A line `l.p = 0` (with `p = (x, y, 1)`) is taken to `(l M^-1).p = 0`, so
+        lines use the inverse matrix, which is the same matrix for a fold.
+        """
+
+        if isinstance(element, Point):
+            (a, b, tx), (c, d, ty), _ = self._matrix
+            x, y = element.x, element.y
+
+            return Point(a * x + b * y + tx, c * x + d * y + ty)
+
+        if isinstance(element, Line):
+            nx, ny, offset = element._form
+            (a, b, tx), (c, d, ty), _ = self.inverse._matrix
+
+            return Line(nx * a + ny * c, nx * b + ny * d, nx * tx + ny * ty + offset)
+
+        # only loaded for arrays, which have loaded NumPy already
+        import numpy as np
+        from .line_array import LineArray
+        from .point_array import PointArray
+
+        if isinstance(element, PointArray):
+            matrix = np.array(self._matrix)
+
+            return PointArray(element.coordinates @ matrix[:2, :2].T + matrix[:2, 2])
+
+        if isinstance(element, LineArray):
+            return LineArray(element.coefficients @ np.array(self.inverse._matrix))
+
+        raise TypeError(f"A transform cannot be applied to {type(element).__name__!r}")
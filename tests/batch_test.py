@@ -0,0 +1,200 @@
+import pytest
+import unittest
+import numpy as np
+from math import sqrt, inf
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.fold import fold
+from src.origametry.batch import fold_many
+from src.origametry.line_array import LineArray
+from src.origametry.point_array import PointArray
+
+case = unittest.TestCase()
+
+
+def creases_for_row(result, row):
+    start = int(result.counts[:row].sum())
+    return list(result.lines[start:start + int(result.counts[row])])
+
+
+""" result shape """
+
+def test_counts_and_index():
+    result = fold_many(
+        5,
+        points1=[Point(0, 5), Point(0, 2), Point(0, 2)],
+        lines1=[Line(Point(2, 3), 1), Line(0), Line(0)],
+        points2=[Point(0, 3), Point(2, 2), Point(1, 2)],
+    )
+
+    assert result.counts.tolist() == [2, 1, 0]
+    assert result.index.tolist() == [0, 0, 1]
+    assert result.degenerate.tolist() == [False, False, False]
+    assert isinstance(result.lines, LineArray)
+
+def test_accepts_arrays():
+    result = fold_many(
+        2,
+        points1=np.array([[0, 0], [0, 0]]),
+        points2=PointArray([Point(2, 2), Point(2, 0)]),
+    )
+
+    assert list(result.lines) == [Line(1, 1, -2), Line(-1, 0, 1)]
+
+""" each axiom agrees with `fold` """
+
+def test_axiom_1():
+    result = fold_many(1, points1=[Point(0, 0), Point(0, 0)], points2=[Point(1, 2), Point(0, 2)])
+
+    assert list(result.lines) == [Line(-2, 1, 0), Line(1, 0, 0)]
+
+def test_axiom_2():
+    result = fold_many(2, points1=[Point(0, 0), Point(0, 0)], points2=[Point(2, 2), Point(0, 2)])
+
+    assert list(result.lines) == [Line(1, 1, -2), Line(0, -1, 1)]
+
+def test_axiom_3():
+    line_1 = Line(-2, 1, 0)
+    line_2 = Line(1, 2, 1)
+
+    result = fold_many(3, lines1=[line_1], lines2=[line_2])
+
+    assert list(result.lines) == list(fold(line_1, line_2))
+
+def test_axiom_3_parallel():
+    result = fold_many(3, lines1=[Line(-2, 1, 0), Line(1, 0, 0)], lines2=[Line(-1, .5, 1), Line(-.5, 0, 1)])
+
+    assert result.counts.tolist() == [1, 1]
+    assert list(result.lines) == [Line(-2, 1, 1), Line(-1, 0, 1)]
+
+def test_axiom_3_nearly_parallel():
+    line_1, line_2 = Line(1, 1e-12, 0), Line(1, -1e-12, 1)
+
+    result = fold_many(3, lines1=[line_1], lines2=[line_2])
+
+    assert list(result.lines) == [fold(line_1, line_2)] == [Line(2, 0, 1)]
+
+def test_axiom_4():
+    result = fold_many(4, points1=[Point(0, 5), Point(0, 5)], lines1=[Line(-2, 1, 0), Line(-1, 0, 2)])
+
+    assert list(result.lines) == [Line(-.1, -.2, 1), Line(0, -1, 5)]
+
+def test_axiom_5():
+    point_1 = Point(0, 5)
+    line = Line(Point(2, 3), 1)
+    point_2 = Point(0, 3)
+
+    result = fold_many(5, points1=[point_1], lines1=[line], points2=[point_2])
+
+    case.assertCountEqual(result.lines, fold(point_1, line, point_2, point_2))
+
+def test_axiom_6():
+    point_1 = Point(0, 0)
+    line_1 = Line(Point(0, 2), 0)
+    point_2 = Point(-3.5, 0.5)
+    line_2 = Line(Point(-1.5, 0), inf)
+
+    result = fold_many(6, points1=[point_1], lines1=[line_1], points2=[point_2], lines2=[line_2])
+
+    case.assertCountEqual(result.lines, fold(point_1, line_1, point_2, line_2))
+
+def test_axiom_6_repeated_and_missing_solutions():
+    result = fold_many(
+        6,
+        points1=[Point(-1, 0), Point(0, 0), Point(-1, 1)],
+        lines1=[Line(Point(0, -1), 0), Line(Point(0, -1), 0), Line(1, 1, 1)],
+        points2=[Point(1, 0), Point(0, 1), Point(1, -1)],
+        lines2=[Line(Point(0, 1), 0), Line(Point(0, 2), 0), Line(1, -1, 1)],
+    )
+
+    assert result.counts.tolist() == [1, 0, 3]
+    assert creases_for_row(result, 0) == [Line(1)]
+    case.assertCountEqual(creases_for_row(result, 2), (
+        Line(0, -2, 1),
+        Line((-1 - sqrt(7)) / 2, (3 + sqrt(7)) / 2, 1),
+        Line((-1 + sqrt(7)) / 2, (3 - sqrt(7)) / 2, 1),
+    ))
+
+def test_axiom_6_parallel_lines():
+    result = fold_many(
+        6,
+        points1=[Point(-1, 0), Point(0, 1)],
+        lines1=[Line(Point(1, 0), inf), Line(Point(1, 0), inf)],
+        points2=[Point(1, 0), Point(0, 1)],
+        lines2=[Line(Point(-1, 0), inf), Line(Point(-1, 0), inf)],
+    )
+
+    assert result.counts.tolist() == [1, 0]
+    assert list(result.lines) == [Line(inf)]
+
+def test_axiom_7():
+    result = fold_many(
+        7,
+        points1=[Point(0, 0), Point(0, 0)],
+        lines1=[Line(1, 0, -1), Line(1, 0, -1)],
+        lines2=[Line(Point(3.14, -1729), 1), Line(1, 0, 1)],
+    )
+
+    assert result.counts.tolist() == [1, 0]
+    assert list(result.lines) == [Line(1, 1, -1)]
+
+def test_axiom_7_nearly_parallel():
+    point, line_1, line_2 = Point(0, 0), Line(1, 1e-12, -1), Line(1, -1e-12, 1)
+
+    result = fold_many(7, points1=[point], lines1=[line_1], lines2=[line_2])
+
+    assert fold(point, line_1, line_2, line_2) is None
+    assert result.counts.tolist() == [0]
+
+def test_matches_fold_for_random_inputs():
+    rng = np.random.default_rng(0)
+    points_1, points_2 = rng.normal(size=(2, 50, 2))
+    lines_1, lines_2 = rng.normal(size=(2, 50, 3))
+
+    result = fold_many(6, points1=points_1, lines1=lines_1, points2=points_2, lines2=lines_2)
+
+    for row in range(50):
+        expected = fold(
+            Point(*points_1[row]), LineArray(lines_1)[row],
+            Point(*points_2[row]), LineArray(lines_2)[row],
+        )
+        case.assertCountEqual(creases_for_row(result, row), expected)
+
+""" degenerate rows """
+
+def test_degenerate_rows():
+    result = fold_many(2, points1=[Point(0, 0), Point(0, 2)], points2=[Point(2, 2), Point(0, 2)])
+
+    assert result.degenerate.tolist() == [False, True]
+    assert result.counts.tolist() == [1, 0]
+
+def test_degenerate_point_on_line():
+    result = fold_many(7, points1=[Point(1, 0)], lines1=[Line(1, 0, -1)], lines2=[Line(1)])
+
+    assert result.degenerate.tolist() == [True]
+    assert len(result.lines) == 0
+
+""" bad input """
+
+def test_unknown_axiom():
+    with pytest.raises(ValueError):
+        fold_many(8, points1=[Point(0, 0)], points2=[Point(1, 1)])
+
+def test_wrong_arguments():
+    with pytest.raises(TypeError):
+        fold_many(2, points1=[Point(0, 0)], lines1=[Line(0)])
+
+def test_mismatched_lengths():
+    with pytest.raises(ValueError):
+        fold_many(2, points1=[Point(0, 0)], points2=[Point(1, 1), Point(2, 2)])
+
+def test_fold_many_skips_creases_without_direction():
+    # nearly parallel lines, one of whose bisectors is rounded away to nothing
+    lines_1 = np.array([[0.4142135623730952, -1.0000000000000002, 1.0]])
+    lines_2 = np.array([[-0.41421356237309515, 1.0, -0.0]])
+
+    result = fold_many(3, lines1=lines_1, lines2=lines_2)
+
+    assert np.isfinite(result.lines.coefficients).all()
+    assert (result.lines.coefficients[:, :2] != 0).any(axis=1).all()
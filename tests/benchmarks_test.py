@@ -0,0 +1,80 @@
+import json
+import pytest
+from functools import partial
+
+from benchmarks import runner
+from benchmarks.__main__ import main
+from benchmarks.cases import CASES
+
+
+""" cases """
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_case_runs(name):
+    setup = CASES[name]
+
+    # cases with several sizes are only checked with a small input
+    if isinstance(setup, partial):
+        setup = partial(setup.func, 2)
+
+    setup()()
+
+def test_cases_with_sizes():
+    assert {"show.trim_to_box[1]", "show.trim_to_box[100]", "show.trim_to_box[1000]"} <= set(CASES)
+
+""" timing """
+
+def test_time_case():
+    assert runner.time_case("line.intersection", repeat=1, budget=0.001) > 0
+
+def test_run_selects_cases():
+    results = runner.run("^fold.axiom_[12]$", repeat=1, budget=0.001)
+
+    assert set(results) == {"fold.axiom_1", "fold.axiom_2"}
+
+""" comparison """
+
+def test_compare():
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+    current = {"a": 1.05, "b": 1.5, "d": 1.0}
+
+    comparisons = runner.compare(baseline, current, threshold=0.1)
+
+    assert [(c.name, c.regression) for c in comparisons] == [
+        ("a", False), ("b", True), ("c", False), ("d", False)
+    ]
+    assert comparisons[1].ratio == 1.5
+    assert comparisons[2].ratio is None
+
+def test_report():
+    comparisons = runner.compare({"slow": 2e-6, "gone": 1.0}, {"slow": 3e-3}, threshold=0.1)
+
+    lines = runner.report(comparisons).splitlines()
+
+    assert lines[0].split() == ["gone", "1", "s", "-", "-"]
+    assert lines[1].split() == ["slow", "2", "us", "3", "ms", "1500.00x", "REGRESSION"]
+
+def test_format_time():
+    assert runner._format_time(2.5e-9) == "2.5 ns"
+
+""" command line """
+
+def test_run_and_save(tmp_path, capsys):
+    path = tmp_path / "results.json"
+
+    assert main(["run", "^line.intersection$", "-o", str(path), "--repeat", "1", "--budget", "0.001"]) == 0
+
+    assert list(runner.load(str(path))) == ["line.intersection"]
+    assert "line.intersection" in capsys.readouterr().out
+
+def test_compare_command(tmp_path, capsys):
+    for name, seconds in (("old", 1.0), ("new", 2.0)):
+        with open(tmp_path / f"{name}.json", "w", encoding="utf-8") as file:
+            json.dump({"results": {"case": seconds}}, file)
+
+    old, new = str(tmp_path / "old.json"), str(tmp_path / "new.json")
+
+    assert main(["compare", old, new]) == 1
+    assert main(["compare", new, old]) == 0
+    assert main(["compare", old, new, "--threshold", "1.5"]) == 0
+    assert "REGRESSION" in capsys.readouterr().out
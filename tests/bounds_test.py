@@ -0,0 +1,179 @@
+import pytest
+import numpy as np
+from itertools import combinations
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.helpers import projection
+from src.origametry.line_array import LineArray
+from src.origametry import _bounds
+from src.origametry._bounds import (
+    combine, intersection_extent, intersection_quantiles, point_extent, projection_extent
+)
+
+
+def _extent_of(points):
+    """ the extent of a list of points, worked out one at a time """
+
+    points = [point for point in points if point is not None]
+
+    return [
+        min(point.x for point in points), min(point.y for point in points),
+        max(point.x for point in points), max(point.y for point in points),
+    ]
+
+
+def _brute_force_extent(lines):
+    """ the extent of the intersections of every pair of lines, or `None` if there are none """
+
+    points = [line_1.intersection(line_2) for line_1, line_2 in combinations(lines, 2)]
+    points = [point for point in points if point is not None]
+
+    return _extent_of(points) if points else None
+
+
+def _clustered_lines(rng, count):
+    """ lines whose slopes are clustered around a few values, some of them very tightly """
+
+    slopes = rng.normal(size=rng.integers(1, 5)) * rng.choice([1, 10, 1000])
+    spreads = [0, 1e-15, 1e-12, 1e-9, 1e-7, 1e-4]
+
+    lines = [
+        Line(-slope * (1 + rng.choice(spreads) * rng.normal()), 1, 5 * rng.normal())
+        for slope in rng.choice(slopes, size=count)
+    ]
+
+    # with vertical and nearly vertical lines among some of them
+    if rng.random() < 0.3:
+        lines.append(Line(1, 0, rng.normal()))
+    if rng.random() < 0.3:
+        lines.append(Line(1, 1e-9 * rng.normal(), rng.normal()))
+
+    return lines
+
+
+def _random_lines(rng, count):
+    lines = [Line(*row) for row in rng.normal(size=(count, 3))]
+
+    # with some vertical, horizontal and parallel lines among them
+    return lines + [Line(1, 0, 2), Line(1, 0, -3), Line(0, 1, 1), Line(0, 1, -4), Line(lines[0].a, lines[0].b, 5)]
+
+
+""" extents """
+
+def test_combine():
+    assert combine(None, np.array([0, 1, 2, 3]), np.array([-1, 2, 1, 4])).tolist() == [-1, 1, 2, 4]
+    assert combine(None, None) is None
+
+def test_point_extent():
+    assert point_extent(np.array([[0, 1], [2, -1], [np.inf, 5]])).tolist() == [0, -1, 2, 1]
+    assert point_extent(np.zeros((0, 2))) is None
+    assert point_extent(np.array([[np.nan, 0]])) is None
+
+""" intersections """
+
+@pytest.mark.parametrize("seed", range(5))
+def test_intersection_extent(seed):
+    lines = _random_lines(np.random.default_rng(seed), 30)
+
+    expected = _extent_of(line_1.intersection(line_2) for line_1, line_2 in combinations(lines, 2))
+
+    # `numpy.hypot` can differ from `math.hypot` in the last bit
+    assert intersection_extent(LineArray(lines).coefficients).tolist() == pytest.approx(expected, rel=1e-14)
+
+@pytest.mark.parametrize("seed", range(200))
+def test_intersection_extent_of_clustered_slopes(seed):
+    rng = np.random.default_rng(seed)
+    lines = _clustered_lines(rng, int(rng.integers(2, 40)))
+
+    extent = intersection_extent(LineArray(lines).coefficients)
+    expected = _brute_force_extent(lines)
+
+    # the last-bit differences between `numpy.hypot` and `math.hypot` are
+    # magnified for nearly parallel lines, but a missed crossing is far out
+    if expected is None:
+        assert extent is None
+    else:
+        assert extent.tolist() == pytest.approx(expected, rel=1e-6)
+
+def test_intersection_extent_in_blocks(monkeypatch):
+    monkeypatch.setattr(_bounds, "_BLOCK_SIZE", 3)
+    lines = _clustered_lines(np.random.default_rng(0), 30)
+
+    assert intersection_extent(LineArray(lines).coefficients).tolist() == pytest.approx(_brute_force_extent(lines))
+
+def test_intersection_extent_of_nearly_vertical_lines():
+    # the slopes are at either end of the order, but the lines are nearly parallel
+    lines = [Line(1, 1e-9, 0), Line(1, -1e-9, 1), Line(1, 1, 0), Line(1, -1, 3)]
+
+    assert intersection_extent(LineArray(lines).coefficients).tolist() == pytest.approx(_brute_force_extent(lines))
+
+def test_intersection_extent_of_a_vertical_line_parallel_to_the_rest():
+    lines = [Line(1, 0, -2), Line(1, 1e-12, 0), Line(1, -1e-12, 1)]
+
+    assert intersection_extent(LineArray(lines).coefficients) is None
+
+def test_intersection_extent_of_lines_with_a_shared_gradient():
+    # lines made with the same gradient are parallel, even once rounded
+    rng = np.random.default_rng(0)
+    lines = [Line(Point(*row), 0.7) for row in rng.uniform(-10, 10, size=(50, 2))]
+
+    assert intersection_extent(LineArray(lines).coefficients) is None
+    assert all(line_1.intersection(line_2) is None for line_1, line_2 in combinations(lines, 2))
+
+def test_intersection_extent_of_parallel_lines():
+    lines = [Line(1, 1, 0), Line(1, 1, 1), Line(1, 1, 2)]
+
+    assert intersection_extent(LineArray(lines).coefficients) is None
+
+def test_intersection_extent_with_vertical_and_horizontal_lines():
+    lines = [Line(1, 0, -2), Line(0, 1, -3)]
+
+    assert intersection_extent(LineArray(lines).coefficients).tolist() == [2, 3, 2, 3]
+
+def test_intersection_quantiles():
+    # a fan of lines through the origin, and one nearly parallel to the first,
+    # which meets the others at `y = -1` except for that one, far to the left
+    lines = [Line(float(k), 1, 0) for k in range(20)] + [Line(1e-9, 1, 1)]
+    coefficients = LineArray(lines).coefficients
+
+    assert intersection_extent(coefficients)[0] < -1e8
+    assert np.abs(intersection_quantiles(coefficients, 0.01)).max() < 1.01
+
+def test_intersection_quantiles_from_a_sample(monkeypatch):
+    monkeypatch.setattr(_bounds, "_BLOCK_SIZE", 8)
+    lines = [Line(float(k), 1, 0) for k in range(10)]
+
+    assert intersection_quantiles(LineArray(lines).coefficients, 0).tolist() == [0, 0, 0, 0]
+
+def test_intersection_quantiles_of_parallel_lines():
+    lines = [Line(0, 1, 1), Line(0, 1, 2)]
+
+    assert intersection_quantiles(LineArray(lines).coefficients, 0.1) is None
+
+""" projections """
+
+@pytest.mark.parametrize("count", [1, 2, 3, 50])
+def test_projection_extent(count):
+    rng = np.random.default_rng(count)
+    points = [Point(*row) for row in rng.normal(size=(count, 2))]
+    lines = _random_lines(rng, 10)
+
+    expected = _extent_of(projection(point, line) for point in points for line in lines)
+    extent = projection_extent(np.array([(point.x, point.y) for point in points]), LineArray(lines).coefficients)
+
+    assert extent.tolist() == pytest.approx(expected, rel=1e-12)
+
+def test_projection_extent_in_blocks(monkeypatch):
+    monkeypatch.setattr(_bounds, "_BLOCK_SIZE", 2)
+    coordinates = np.array([[0, 0], [4, 0], [0, 4], [1, 1]], dtype=float)
+
+    extent = projection_extent(coordinates, LineArray([Line(1, -1, 0), Line(0, 1, -1)]).coefficients)
+
+    assert extent.tolist() == pytest.approx([0, 0, 4, 2])
+
+def test_projection_extent_of_nothing():
+    coefficients = LineArray([Line(0, 1, 1)]).coefficients
+
+    assert projection_extent(np.array([[np.inf, 0]]), coefficients) is None
+    assert projection_extent(np.array([[0, 0]]), coefficients[:0]) is None
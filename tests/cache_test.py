@@ -0,0 +1,175 @@
+import pytest
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.fold import fold
+from src.origametry.reflect import reflect
+from src.origametry import cache
+from src.origametry.cache import (
+    FoldCache, CacheInfo, caching, cache_info, clear_cache, disable_cache, enable_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def no_active_cache():
+    # make sure that no test leaves a cache behind for the others
+    yield
+    disable_cache()
+
+
+""" FoldCache """
+
+def test_hits_and_misses():
+    store = FoldCache(maxsize=4)
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert store.call(("square", 3), square, 3) == 9
+    assert store.call(("square", 3), square, 3) == 9
+    assert store.call(("square", 4), square, 4) == 16
+
+    assert calls == [3, 4]
+    assert store.info() == CacheInfo(hits=1, misses=2, maxsize=4, currsize=2)
+
+def test_least_recently_used_is_evicted():
+    store = FoldCache(maxsize=2)
+
+    store.call("a", str, 1)
+    store.call("b", str, 2)
+    # using `a` again makes `b` the least recently used
+    store.call("a", str, 1)
+    store.call("c", str, 3)
+
+    assert len(store) == 2
+
+    store.call("a", str, 1)
+    store.call("b", str, 2)
+
+    assert store.info().misses == 4
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        FoldCache(maxsize=0)
+
+def test_exceptions_are_cached():
+    store = FoldCache()
+    calls = []
+
+    def fail():
+        calls.append(None)
+        raise ValueError("no good")
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="no good"):
+            store.call("key", fail)
+
+    assert len(calls) == 1
+    assert store.info().hits == 2
+
+def test_other_exceptions_are_not_cached():
+    store = FoldCache()
+
+    with pytest.raises(ZeroDivisionError):
+        store.call("key", lambda: 1 / 0)
+
+    assert len(store) == 0
+
+def test_cached_lists_are_copied():
+    store = FoldCache()
+
+    first = store.call("key", list, (1, 2))
+    first.append(3)
+
+    assert store.call("key", list, (1, 2)) == [1, 2]
+
+def test_clear():
+    store = FoldCache()
+    store.call("key", str, 1)
+
+    store.clear()
+
+    assert store.info() == CacheInfo(hits=0, misses=0, maxsize=1024, currsize=0)
+
+""" caching fold and reflect """
+
+def test_fold_is_not_cached_by_default():
+    assert cache.active_cache() is None
+    assert cache_info() is None
+
+    fold(Point(0, 0), Point(1, 1))
+
+    assert cache_info() is None
+
+def test_fold_with_cache():
+    with caching() as store:
+        crease = fold(Point(0, 0), Point(2, 0))
+
+        assert fold(Point(0, 0), Point(2, 0)) == crease
+        assert store.info().hits == 1
+
+    assert cache.active_cache() is None
+
+def test_fold_with_almost_equal_arguments():
+    nearly_0 = .4 - .3 - .1
+
+    with caching() as store:
+        fold(Point(0, 0), Point(2, 0))
+        fold(Point(nearly_0, 0), Point(2, nearly_0))
+
+        assert store.info().hits == 1
+
+def test_fold_with_permuted_arguments():
+    p1, p2 = Point(0, 0), Point(0, 2)
+    line = Line(1, 0, -1)
+
+    with caching() as store:
+        creases = fold(p1, line, p2, p2)
+
+        assert fold(line, p1, p2, p2) == creases
+        assert store.info() == CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+
+def test_fold_exception_is_cached():
+    point = Point(1, 1)
+
+    with caching() as store:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fold(point, point)
+
+        assert store.info().hits == 1
+
+def test_reflect_with_cache():
+    crease = Line(1, 0, -1)
+
+    with caching() as store:
+        assert reflect(Point(0, 0), crease) == Point(2, 0)
+        assert reflect(Point(0, 0), crease) == Point(2, 0)
+        assert reflect(Line(1, 0, 0), crease) == Line(1, 0, -2)
+
+        assert store.info() == CacheInfo(hits=1, misses=2, maxsize=1024, currsize=2)
+
+def test_nested_caching_restores_previous_cache():
+    outer = enable_cache(maxsize=8)
+
+    with caching(cache=FoldCache(maxsize=2)) as inner:
+        assert cache.active_cache() is inner
+
+    assert cache.active_cache() is outer
+
+def test_global_cache_functions():
+    enable_cache(maxsize=8)
+    fold(Point(0, 0), Point(1, 1))
+
+    assert cache_info() == CacheInfo(hits=0, misses=1, maxsize=8, currsize=1)
+
+    clear_cache()
+
+    assert cache_info().currsize == 0
+
+    disable_cache()
+    clear_cache()
+
+    assert cache_info() is None
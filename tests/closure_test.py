@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+
+from src.origametry import closure
+from src.origametry.batch import fold_many
+from src.origametry.closure import Closure, Origin
+from src.origametry.fold import fold
+from src.origametry.line import Line
+from src.origametry.point import Point
+
+
+def _square():
+    return Closure(
+        [Point(0, 0), Point(1, 0), Point(1, 1), Point(0, 1)],
+        [Line(0, 1, 0), Line(1, 0, 0), Line(0, 1, -1), Line(1, 0, -1)],
+    )
+
+
+""" seeds """
+
+def test_seeds_are_deduplicated():
+    result = Closure([Point(0, 0), Point(1e-12, 0), Point(1, 0)], [Line(1, 0, 0), Line(1 + 1e-12, 0, 0)])
+
+    assert list(result.points) == [Point(0, 0), Point(1, 0)]
+    assert list(result.lines) == [Line(1, 0, 0)]
+    assert result.level == 0
+
+def test_seed_origin():
+    result = _square()
+
+    assert result.origin("point", 0) == Origin(0, None, (), ())
+    assert result.origin("line", 0) == Origin(0, None, (), ())
+
+def test_origin_of_unknown_kind():
+    with pytest.raises(ValueError):
+        _square().origin("circle", 0)
+
+""" expand """
+
+def test_expand_empty():
+    level = Closure().expand()
+
+    assert (len(level.points), len(level.lines), level.truncated) == (0, 0, False)
+
+def test_expand_two_points():
+    result = Closure([Point(0, 0), Point(2, 0)])
+    level = result.expand()
+
+    assert level.number == 1
+    assert not level.truncated
+    assert set(result.lines) == {Line(0, 1, 0), Line(1, 0, -1)}
+    assert list(result.points) == [Point(0, 0), Point(2, 0), Point(1, 0)]
+    assert list(level.points) == [2]
+
+def test_expand_finds_every_fold():
+    points = [Point(0, 0), Point(1, 0), Point(0, 1)]
+    lines = [Line(0, 1, 0), Line(1, 0, 0)]
+
+    result = Closure(points, lines)
+    level = result.expand()
+
+    expected = set()
+    for p1 in points:
+        for p2 in points:
+            if p1 != p2:
+                expected.update([fold(p1, p1, p2, p2), fold(p1, p2)])
+        for l1 in lines:
+            expected.update(fold(p1, p1, l1, l1) and [fold(p1, p1, l1, l1)])
+
+    found = {result.lines[int(i)] for i in level.lines}
+
+    assert expected <= found | set(lines)
+
+def test_new_elements_are_unique():
+    result = _square()
+    result.run(2, fold_budget=2000, intersection_budget=2000)
+
+    assert len(result.points.unique()) == len(result.points)
+    assert len(result.lines.unique()) == len(result.lines)
+
+def test_near_origin_duplicates_are_dropped():
+    # the seed is within the tolerance of the crease between the points, though
+    # scaling it to `c = 1` gives it very different coefficients
+    result = Closure([Point(1, 1), Point(-1, -1)], [Line(1, 1, 1e-12)])
+    level = result.expand()
+
+    assert Line(1, 1, 0) not in {result.lines[int(i)] for i in level.lines}
+    assert len(result.lines.unique()) == len(result.lines)
+
+def test_square_first_level():
+    result = _square()
+    level = result.expand()
+
+    assert (len(level.lines), len(level.points)) == (32, 333)
+    assert Line(1, 1, -1) in set(result.lines)
+    assert Point(0.5, 0.5) in set(result.points)
+
+def test_square_points_stay_near_the_square():
+    # parallel creases are dropped, rather than meeting around 1e16 away
+    result = _square()
+    result.expand()
+
+    assert np.abs(result.points.coordinates).max() < 10
+
+def test_blocks_cover_combinations_with_new_elements():
+    # 2 old and 3 new points, 1 old and 1 new line
+    blocks = closure._blocks(("point", "line", "point"), {"point": 2, "line": 1}, {"point": 5, "line": 2})
+
+    found = [
+        tuple(row)
+        for combinations in closure._combinations(blocks, None)
+        for row in combinations
+    ]
+    expected = [
+        (p1, l1, p2)
+        for p1 in range(5) for l1 in range(2) for p2 in range(5)
+        if p1 >= 2 or l1 >= 1 or p2 >= 2
+    ]
+
+    assert sorted(found) == expected
+
+def test_budget_truncates_level():
+    result = _square()
+    levels = result.run(2, fold_budget=50, intersection_budget=10)
+
+    assert [level.number for level in levels] == [1, 2]
+    assert all(level.truncated for level in levels)
+    assert len(levels[0].points) <= 10
+
+def test_small_chunks(monkeypatch):
+    monkeypatch.setattr(closure, "_CHUNK_SIZE", 7)
+
+    result = _square()
+    level = result.expand()
+
+    assert (len(level.lines), len(level.points)) == (32, 333)
+
+""" provenance """
+
+def test_line_origin_reproduces_line():
+    result = _square()
+    level = result.expand()
+
+    for index in level.lines:
+        origin = result.origin("line", int(index))
+        points = [result.points[i] for i in origin.points]
+        lines = [result.lines[i] for i in origin.lines]
+
+        arguments = {f"points{n}": [p] for n, p in enumerate(points, 1)}
+        arguments.update({f"lines{n}": [l] for n, l in enumerate(lines, 1)})
+
+        assert origin.level == 1
+        assert result.lines[int(index)] in list(fold_many(origin.axiom, **arguments).lines)
+
+def test_point_origin_reproduces_point():
+    result = _square()
+    level = result.expand()
+
+    for index in level.points[:50]:
+        origin = result.origin("point", int(index))
+        line_1, line_2 = (result.lines[i] for i in origin.lines)
+
+        assert origin.axiom is None
+        assert line_1.intersection(line_2) == result.points[int(index)]
+
+def test_history_orders_dependencies_first():
+    result = _square()
+    result.run(2, fold_budget=2000, intersection_budget=2000)
+
+    index = len(result.points) - 1
+    steps = result.history("point", index)
+
+    assert steps[-1][:2] == ("point", index)
+
+    seen = set()
+    for kind, i, origin in steps:
+        assert all(("point", p) in seen for p in origin.points)
+        assert all(("line", l) in seen for l in origin.lines)
+        seen.add((kind, i))
+
+""" invalid creases """
+
+def test_nearly_parallel_lines_give_no_invalid_elements():
+    result = Closure([], [Line(1, 0, 0), Line(1, 1e-17, -1), Line(0, 1, 0)])
+    result.expand()
+
+    assert np.isfinite(result.points.coordinates).all()
+    assert np.isfinite(result.lines.coefficients).all()
@@ -0,0 +1,136 @@
+import pytest
+
+from src.origametry.construction import Construction
+from src.origametry.fold import fold
+from src.origametry.line import Line
+from src.origametry.point import Point
+
+
+@pytest.fixture
+def construction():
+    construction = Construction()
+
+    construction.input("p1", Point(0, 0))
+    construction.input("p2", Point(2, 0))
+    construction.input("p3", Point(0, 4))
+    construction.fold("crease_1", "p1", "p2")
+    construction.fold("crease_2", "p1", "p3")
+    construction.intersection("centre", "crease_1", "crease_2")
+    construction.reflect("image", "p3", "crease_1")
+
+    return construction
+
+
+""" building """
+
+def test_steps_are_evaluated(construction):
+    assert construction["crease_1"] == Line(1, 0, -1)
+    assert construction["crease_2"] == Line(0, 1, -2)
+    assert construction["centre"] == Point(1, 2)
+    assert construction["image"] == Point(2, 4)
+
+def test_names(construction):
+    assert len(construction) == 7
+    assert list(construction)[:3] == ["p1", "p2", "p3"]
+    assert "centre" in construction
+    assert "other" not in construction
+
+def test_constant_arguments(construction):
+    construction.fold("crease_3", "p1", Point(0, 2))
+
+    assert construction["crease_3"] == Line(0, 1, -1)
+
+def test_custom_step(construction):
+    construction.step("midpoint", lambda a, b: Point((a.x + b.x) / 2, (a.y + b.y) / 2), "p2", "p3")
+
+    assert construction["midpoint"] == Point(1, 2)
+
+def test_repeated_name(construction):
+    with pytest.raises(ValueError):
+        construction.input("p1", Point(1, 1))
+    with pytest.raises(ValueError):
+        construction.fold("crease_1", "p2", "p3")
+
+def test_unknown_name(construction):
+    with pytest.raises(KeyError):
+        construction.fold("crease_3", "p1", "p4")
+
+    assert "crease_3" not in construction
+
+def test_item(construction):
+    construction.fold("creases", "p1", Line(0, 1, -1), "p2", "p2")
+    construction.item("second", "creases", 1)
+
+    assert construction["second"] == construction["creases"][1]
+
+""" failures """
+
+def test_value_error_is_stored(construction):
+    construction.fold("nothing", "p1", "p1")
+
+    with pytest.raises(ValueError):
+        construction["nothing"]
+
+    assert isinstance(construction.values()["nothing"], ValueError)
+
+def test_failure_is_passed_downstream(construction):
+    construction.fold("nothing", "p1", "p1")
+    construction.reflect("image_2", "p2", "nothing")
+
+    with pytest.raises(ValueError):
+        construction["image_2"]
+
+def test_missing_item_is_stored(construction):
+    construction.item("first", "crease_1", 0)
+
+    with pytest.raises(ValueError):
+        construction["first"]
+
+""" updating """
+
+def test_update_evaluates_downstream_steps(construction):
+    evaluated = construction.update(p3=Point(0, 6))
+
+    assert evaluated == ["crease_2", "centre", "image"]
+    assert construction["centre"] == Point(1, 3)
+    assert construction["image"] == Point(2, 6)
+
+def test_update_within_tolerance_evaluates_nothing(construction):
+    assert construction.update(p2=Point(2 + 1e-12, 0)) == []
+    assert construction["p2"] == Point(2, 0)
+
+def test_update_stops_where_values_do_not_move(construction):
+    construction.step("distance", lambda p: abs(p.x), "p2")
+    construction.step("marker", lambda d: Point(d, 0), "distance")
+
+    # `distance` is evaluated again but does not change, so `marker` is left alone
+    evaluated = construction.update(p2=Point(-2, 0))
+
+    assert evaluated == ["crease_1", "centre", "image", "distance"]
+    assert construction["centre"] == Point(-1, 2)
+
+def test_update_changing_outcome(construction):
+    construction.update(p2=Point(0, 0))
+
+    with pytest.raises(ValueError):
+        construction["crease_1"]
+    with pytest.raises(ValueError):
+        construction["centre"]
+
+    construction.update(p2=Point(2, 0))
+
+    assert construction["centre"] == Point(1, 2)
+
+def test_update_step(construction):
+    with pytest.raises(ValueError):
+        construction.update(centre=Point(0, 0))
+
+def test_update_matches_rebuilding(construction):
+    construction.fold("creases", "p2", "crease_2", "centre", "centre")
+    construction.update(p1=Point(1, -1), p3=Point(-1, 3))
+
+    p1, p2, p3 = Point(1, -1), Point(2, 0), Point(-1, 3)
+    crease_2 = fold(p1, p3)
+    centre = fold(p1, p2).intersection(crease_2)
+
+    assert construction["creases"] == fold(p2, crease_2, centre, centre)
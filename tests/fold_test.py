@@ -209,6 +209,14 @@ def test_perpendicular_to_horizontal_line_and_through_point():
 
     assert crease == Line(-1, 0, 5)
 
+def test_point_onto_point_nearly_perpendicular_to_line():
+    # the crease between the points is perpendicular to the line within the tolerance
+    line = Line(0, 1, 0)
+
+    crease = fold(Point(0, 0), Point(2, 1e-12), line, line)
+
+    assert crease == Line(1, 0, -1)
+
 """ axiom 5: fold point onto line and through point """
 
 def test_point_onto_line_through_point():
@@ -793,3 +801,28 @@ def test_unsupported_perpendicular_to_two_lines():
 
     with pytest.raises(TypeError):
         fold(line_1, line_1, line_2, line_2)
+
+""" dispatch """
+
+def test_subclasses_of_point_and_line():
+    class MarkedPoint(Point):
+        pass
+
+    class MarkedLine(Line):
+        pass
+
+    point = MarkedPoint(0, 0)
+    line = MarkedLine(0, 1, -2)
+
+    # a fold through the point, perpendicular to the line
+    assert fold(line, line, point, point) == Line(1, 0, 0)
+
+    # the second call uses the signature remembered from the first
+    assert fold(line, line, point, point) == Line(1, 0, 0)
+
+def test_unsupported_subclass_signature():
+    class MarkedPoint(Point):
+        pass
+
+    with pytest.raises(TypeError, match="MarkedPoint"):
+        fold(MarkedPoint(0, 0))
@@ -1,9 +1,13 @@
+import numpy as np
 import pytest
-from math import sqrt
+from math import sqrt, inf, nan
 
 from src.origametry.line import Line
 from src.origametry.point import Point
-from src.origametry.helpers import distance
+from src.origametry import helpers
+from src.origametry.helpers import (
+    default_chunksize, distance, grid_coordinate, grid_cell, real_roots, remove_duplicates, _remove_duplicates_by_comparison
+)
 
 
 """ distance """
@@ -18,13 +22,13 @@ def test_distance_point_to_line():
     point = Point(0, 0)
     line = Line(1, -1, 2)
 
-    assert distance(point, line) == sqrt(2)
+    assert distance(point, line) == pytest.approx(sqrt(2), rel=1e-15)
 
 def test_distance_line_to_point():
     line = Line(1, -1, 2)
     point = Point(0, 0)
 
-    assert distance(line, point) == sqrt(2)
+    assert distance(line, point) == pytest.approx(sqrt(2), rel=1e-15)
 
 def test_distance_line_to_line():
     line_1 = Line(1, -1, 2)
@@ -32,3 +36,115 @@ def test_distance_line_to_line():
 
     with pytest.raises(TypeError):
         distance(line_1, line_2)
+
+""" tolerance grid """
+
+def test_grid_coordinate_is_linear_near_zero():
+    assert grid_coordinate(0) == 0
+    assert grid_coordinate(5e-10) == pytest.approx(5)
+    assert grid_coordinate(-5e-10) == pytest.approx(-5)
+
+def test_grid_coordinate_is_logarithmic_far_from_zero():
+    # values one relative tolerance apart are one unit apart
+    assert grid_coordinate(1e6 * (1 + 1e-9)) - grid_coordinate(1e6) == pytest.approx(1, rel=1e-3)
+
+def test_grid_cell():
+    assert grid_cell((0, 3e-10, -1e-10)) == (0, 1, -1)
+    assert grid_cell((inf, nan))[0] == inf
+
+""" real roots """
+
+def test_real_roots_drop_complex_conjugate_pairs():
+    # x^3 - x^2 + x - 1 = (x - 1)(x^2 + 1)
+    assert real_roots([1 + 0j, 1j, -1j]) == [1]
+    assert real_roots(np.roots([1, -1, 1, -1])) == [pytest.approx(1)]
+
+def test_real_roots_keep_near_zero_imaginary_parts():
+    assert real_roots([2 + 1e-9j, -3 - 1e-9j]) == [-3, 2]
+
+    # the tolerance is relative to the size of the root
+    assert real_roots([1e6 + 0.5j]) == [1e6]
+    assert real_roots([1 + 1e-3j]) == []
+
+def test_real_roots_merge_repeated_roots():
+    # floating-point error splits a repeated root into a complex-conjugate pair
+    assert real_roots([1 + 1e-8j, 1 - 1e-8j, 2]) == [1, 2]
+    assert real_roots([1 - 1e-8, 1 + 1e-8]) == [pytest.approx(1, abs=1e-15)]
+
+    # (x - 1)^2 (x + 2)
+    assert real_roots(np.roots([1, 0, -3, 2])) == [pytest.approx(-2), pytest.approx(1)]
+
+    # x^3, a triple root
+    assert real_roots(np.roots([1, 0, 0, 0])) == [0]
+
+def test_real_roots_keep_distinct_roots_apart():
+    assert real_roots([1, 1 + 1e-4, 0]) == [0, 1, 1 + 1e-4]
+
+def test_real_roots_of_nothing():
+    assert real_roots([]) == []
+
+""" remove duplicates """
+
+def test_remove_duplicates_of_points():
+    points = [Point(0, 0), Point(1, 0), Point(1e-12, 0), Point(1, 1e-11), Point(0, 1)]
+
+    assert remove_duplicates(points) == [Point(0, 0), Point(1, 0), Point(0, 1)]
+
+def test_remove_duplicates_keeps_first_element():
+    points = [Point(1e-11, 0), Point(0, 0)]
+
+    assert remove_duplicates(points)[0] is points[0]
+
+def test_remove_duplicates_across_cell_boundaries():
+    # both values are close, but fall in different cells of the grid
+    points = [Point(1.95e-10, 0), Point(2.05e-10, 0)]
+
+    assert grid_cell((points[0].x,)) != grid_cell((points[1].x,))
+    assert remove_duplicates(points) == [Point(1.95e-10, 0)]
+
+def test_remove_duplicates_of_lines():
+    lines = [Line(1, 1, 1), Line(1 + 1e-12, 1, 1), Line(1, 0, 0)]
+
+    assert remove_duplicates(lines) == [Line(1, 1, 1), Line(1, 0, 0)]
+
+@pytest.mark.parametrize("threshold", [0, 10 ** 9])
+def test_remove_duplicates_of_lines_with_normals_either_side_of_vertical(monkeypatch, threshold):
+    monkeypatch.setattr(helpers, "_ARRAY_THRESHOLD", threshold)
+
+    lines = [Line(1e-12, 1, 1), Line(1, 1, 1), Line(-1e-12, 1, 1), Line(0, 1, 1)]
+
+    assert remove_duplicates(lines) == [Line(1e-12, 1, 1), Line(1, 1, 1)]
+    assert remove_duplicates(lines)[0] is lines[0]
+
+def test_remove_duplicates_of_other_types():
+    elements = [[1], [2], [1], Point(0, 0)]
+
+    assert remove_duplicates(elements) == [[1], [2], Point(0, 0)]
+
+def test_remove_duplicates_of_nothing():
+    assert remove_duplicates([]) == []
+
+@pytest.mark.parametrize("threshold", [0, 10 ** 9])
+def test_remove_duplicates_matches_comparison(monkeypatch, threshold):
+    # small and large inputs take different routes, which should give the same result
+    monkeypatch.setattr(helpers, "_ARRAY_THRESHOLD", threshold)
+
+    points = [
+        Point(x * scale + noise, y)
+        for scale in (1e-11, 1, 1e7)
+        for x in range(5)
+        for y in (0, 1e-10, 2e-10, 1 + 1e-9)
+        for noise in (0, scale * 3e-10, -scale * 3e-10)
+    ]
+    points += [Point(inf, 0), Point(inf, 0), Point(-inf, 0), Point(nan, 0), Point(nan, 0)]
+
+    expected = _remove_duplicates_by_comparison(points)
+    result = remove_duplicates(points)
+
+    assert [(p.x, p.y) for p in result] == [(p.x, p.y) for p in expected]
+
+""" chunk size """
+
+@pytest.mark.parametrize("items, workers, chunksize", [(0, 2, 1), (7, 2, 1), (8, 2, 1), (100, 2, 12), (100, 1, 25)])
+def test_default_chunksize(items, workers, chunksize):
+    assert default_chunksize(items, workers) == chunksize
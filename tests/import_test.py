@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import pytest
+
+import src.origametry as origametry
+from src.origametry.point_array import PointArray
+
+# dependencies which should only be loaded when they are first needed
+HEAVY_MODULES = ["numpy", "sympy", "matplotlib"]
+
+
+def _run(code):
+    """ run code in a fresh interpreter, so that nothing is imported already """
+
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+""" heavy dependencies """
+
+def test_import_does_not_load_heavy_modules():
+    result = _run(
+        "import sys, src.origametry; "
+        f"print([name for name in {HEAVY_MODULES} if name in sys.modules])"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+def test_lazy_names_are_loaded_on_first_access():
+    result = _run(
+        "import sys, src.origametry as origametry; "
+        "from src.origametry import PointArray, LineArray, fold_many; "
+        "print(origametry.PointArray is PointArray, 'numpy' in sys.modules)"
+    )
+
+    assert result.stdout.strip() == "True True"
+
+def test_lazy_name_is_cached(monkeypatch):
+    monkeypatch.delitem(vars(origametry), "PointArray", raising=False)
+
+    assert origametry.PointArray is PointArray
+    assert vars(origametry)["PointArray"] is PointArray
+
+def test_lazy_names_are_listed():
+    assert {"fold_many", "LineArray", "PointArray"} <= set(dir(origametry))
+
+def test_unknown_name():
+    with pytest.raises(AttributeError, match="not_a_name"):
+        origametry.not_a_name
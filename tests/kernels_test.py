@@ -0,0 +1,55 @@
+import pytest
+from math import sqrt
+
+from src.origametry._kernels import (
+    intersect, line_distance, normal_form, perpendicular, point_distance, project, reflect_line, reflect_point
+)
+
+# the line x + y = 2, with its unit normal pointing along positive `x`
+DIAGONAL = (1 / sqrt(2), 1 / sqrt(2), -sqrt(2))
+
+
+""" normal form """
+
+@pytest.mark.parametrize("coefficients, form", [
+    ((3, 4, 10), (0.6, 0.8, 2)),
+    ((-3, -4, 10), (0.6, 0.8, -2)),
+    ((0, -2, 1), (0, 1, -0.5)),
+    ((-0.0, 1, 0), (0, 1, 0)),
+])
+def test_normal_form(coefficients, form):
+    assert normal_form(*coefficients) == pytest.approx(form)
+
+def test_normal_form_has_no_negative_zero():
+    assert str(normal_form(-0.0, -1, 0)) == "(0.0, 1.0, 0.0)"
+
+""" points and lines """
+
+def test_project():
+    assert project(0, 0, DIAGONAL) == pytest.approx((1, 1))
+    assert project(2, 0, DIAGONAL) == pytest.approx((2, 0))
+
+def test_reflect_point():
+    assert reflect_point(0, 0, DIAGONAL) == pytest.approx((2, 2))
+    assert reflect_point(3, 1, (1, 0, -1)) == pytest.approx((-1, 1))
+
+def test_reflect_line():
+    # the x-axis reflected across x + y = 2 is the line x = 2
+    nx, ny, offset = reflect_line((0, 1, 0), DIAGONAL)
+
+    assert normal_form(nx, ny, offset) == pytest.approx((1, 0, -2))
+    assert nx ** 2 + ny ** 2 == pytest.approx(1)
+
+def test_intersect():
+    assert intersect((1, 0, -3), DIAGONAL) == pytest.approx((3, -1))
+
+def test_intersect_parallel():
+    assert intersect((1, 0, -3), (1, 0, 5)) is None
+
+def test_perpendicular():
+    assert normal_form(*perpendicular(DIAGONAL, 1, 0)) == pytest.approx(normal_form(-1, 1, 1))
+
+def test_distances():
+    assert point_distance(0, 0, 3, 4) == 5
+    assert line_distance(0, 0, DIAGONAL) == pytest.approx(sqrt(2))
+    assert line_distance(1, 1, DIAGONAL) == pytest.approx(0)
@@ -0,0 +1,253 @@
+import pytest
+import numpy as np
+from math import inf
+from random import Random
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.line_array import LineArray
+
+
+""" create from lines or coefficients """
+
+def test_create_from_lines():
+    lines = LineArray([Line(1, 2, 4), Line(1, 2)])
+
+    assert lines.coefficients.tolist() == [[.25, .5, 1], [.5, 1, 0]]
+
+def test_create_from_coefficients():
+    lines = LineArray(np.array([[1, 2, 4], [1, 2, 0], [2, 0, 0]]))
+
+    # coefficients are scaled in the same way as `Line`
+    assert lines.a.tolist() == [.25, .5, 1]
+    assert lines.b.tolist() == [.5, 1, 0]
+    assert lines.c.tolist() == [1, 0, 0]
+
+def test_create_from_line_array():
+    original = LineArray([Line(1, 2)])
+
+    lines = LineArray(original)
+
+    assert lines.coefficients.tolist() == [[.5, 1, 0]]
+    assert lines.coefficients is not original.coefficients
+
+def test_create_empty():
+    lines = LineArray([])
+
+    assert len(lines) == 0
+    assert lines.coefficients.shape == (0, 3)
+
+def test_invalid_coefficients():
+    with pytest.raises(ValueError):
+        LineArray(np.array([[1, 0, 0], [0, 0, 1]]))
+
+def test_round_trip_to_lines():
+    original = [Line(3, 2, 1), Line(inf), Line(Point(0, 1), 0)]
+
+    lines = LineArray.from_lines(original).to_lines()
+
+    assert lines == original
+
+def test_repr():
+    lines = LineArray([Line(1, 2)])
+
+    assert repr(lines) == "LineArray([[0.5, 1.0, 0.0]])"
+
+""" indexing """
+
+def test_index_single_line():
+    lines = LineArray([Line(0), Line(1)])
+
+    assert lines[1] == Line(1)
+
+def test_index_with_slice():
+    lines = LineArray([Line(0), Line(1), Line(2)])
+
+    assert list(lines[1:]) == [Line(1), Line(2)]
+
+""" fuzzy equality """
+
+def test_compare_with_line():
+    lines = LineArray([Line(1, 0, .1 + .2), Line(1, 0, .4)])
+
+    assert (lines == Line(1, 0, .3)).tolist() == [True, False]
+    assert (lines != Line(1, 0, .3)).tolist() == [False, True]
+
+def test_compare_with_line_array():
+    lines_1 = LineArray([Line(0), Line(1)])
+    lines_2 = LineArray([Line(0), Line(2)])
+
+    assert (lines_1 == lines_2).tolist() == [True, False]
+
+def test_compare_with_normals_either_side_of_vertical():
+    lines = LineArray([Line(1e-12, 1, 1), Line(1, 1, 1)])
+
+    assert (lines == Line(-1e-12, 1, 1)).tolist() == [True, False]
+    assert (lines == LineArray([Line(-1e-12, 1, 1), Line(1, 1, 1)])).tolist() == [True, True]
+
+def test_compare_with_other_type():
+    lines = LineArray([Line(0)])
+
+    assert (lines == 0) is False
+    assert (lines != 0) is True
+
+""" unique """
+
+def test_unique():
+    lines = LineArray([Line(1, 1, 1), Line(1 + 1e-12, 1, 1), Line(1, 0, 0), Line(1, 1, 1)])
+
+    assert list(lines.unique()) == [Line(1, 1, 1), Line(1, 0, 0)]
+
+def test_unique_with_normals_either_side_of_vertical():
+    lines = LineArray([Line(1e-12, 1, 1), Line(-1e-12, 1, 1), Line(0, 1, 1)])
+
+    assert list(lines.unique()) == [Line(0, 1, 1)]
+    assert len(lines.unique()) == 1
+
+""" gradients """
+
+def test_gradient():
+    lines = LineArray([Line(1, 2, 3), Line(inf), Line(0)])
+
+    assert lines.gradient.tolist() == [-.5, inf, 0]
+
+""" intersections """
+
+def test_intersections_with_line():
+    lines = LineArray([Line(1, -1, 0), Line(1, -1, 5), Line(inf)])
+
+    points, valid = lines.intersections(Line(0, 1, -2))
+
+    assert valid.tolist() == [True, True, True]
+    assert list(points) == [Point(2, 2), Point(-3, 2), Point(0, 2)]
+
+def test_intersections_with_parallel_line():
+    lines = LineArray([Line(1, -1, 0), Line(0, 1, -3)])
+
+    points, valid = lines.intersections(Line(0, 1, -2))
+
+    assert valid.tolist() == [True, False]
+    assert np.isnan(points.coordinates[1]).all()
+
+def test_intersections_with_nearly_parallel_line():
+    # parallel within the tolerance of `are_parallel`, though they would meet far away
+    lines = LineArray([Line(1, 1e-12, 0), Line(-1e-12, 1, 1)])
+
+    points, valid = lines.intersections(Line(1, -1e-12, 1))
+
+    assert valid.tolist() == [False, True]
+    assert np.isnan(points.coordinates[0]).all()
+
+@pytest.mark.parametrize("seed", range(5))
+def test_intersections_with_a_shared_gradient(seed):
+    # lines made with the same gradient have coefficients rounded differently
+    random = Random(seed)
+
+    for _ in range(200):
+        gradient = random.uniform(-5, 5)
+        line_1, line_2 = (Line(Point(random.uniform(-9, 9), random.uniform(-9, 9)), gradient) for _ in range(2))
+
+        _, valid = LineArray([line_1]).intersections(line_2)
+
+        assert not valid[0]
+        assert line_1.intersection(line_2) is None
+
+def test_intersections_with_line_array():
+    lines_1 = LineArray([Line(0), Line(inf)])
+    lines_2 = LineArray([Line(1, 0, -1), Line(0, 1, -2), Line(0, 1, -3)])
+
+    points, valid = lines_1.intersections(lines_2)
+
+    assert valid.tolist() == [True, False, False, False, True, True]
+    assert points[0] == Point(1, 0)
+    assert points[4] == Point(0, 2)
+    assert points[5] == Point(0, 3)
+
+def test_pairwise_intersections():
+    lines = LineArray([Line(0), Line(inf), Line(1, 1, -2), Line(0, 1, -1)])
+
+    points, valid = lines.pairwise_intersections()
+
+    assert valid.tolist() == [True, True, False, True, True, True]
+    assert [points[k] for k in np.flatnonzero(valid)] == [
+        Point(0, 0), Point(2, 0), Point(0, 2), Point(0, 1), Point(1, 1),
+    ]
+
+def test_pairwise_intersections_match_single_lines():
+    rng = np.random.default_rng(0)
+    lines = LineArray(rng.normal(size=(20, 3)))
+
+    points, valid = lines.pairwise_intersections()
+
+    i, j = np.triu_indices(len(lines), k=1)
+    expected = [lines[int(x)].intersection(lines[int(y)]) for x, y in zip(i, j)]
+
+    assert valid.all()
+    assert list(points) == expected
+
+def test_pairwise_intersections_in_blocks(monkeypatch):
+    monkeypatch.setattr("src.origametry.line_array._BLOCK_SIZE", 8)
+    rng = np.random.default_rng(1)
+    lines = LineArray(rng.normal(size=(9, 3)))
+
+    points, valid = lines.pairwise_intersections()
+
+    i, j = np.triu_indices(len(lines), k=1)
+    expected = [lines[int(x)].intersection(lines[int(y)]) for x, y in zip(i, j)]
+
+    assert len(points) == 36
+    assert list(points) == expected
+
+def test_pairwise_intersections_of_single_line():
+    lines = LineArray([Line(0)])
+
+    points, valid = lines.pairwise_intersections()
+
+    assert len(points) == 0
+    assert len(valid) == 0
+
+""" clipping """
+
+def test_clip():
+    lines = LineArray([Line(1, -1, 2), Line(1, 2, 1), Line(0, 1, -5)])
+
+    segments, visible = lines.clip(-1, -1, 1, 3)
+
+    assert visible.tolist() == [True, True, False]
+    assert segments[:2].tolist() == [[[-1, 1], [1, 3]], [[-1, 0], [1, -1]]]
+    assert np.isnan(segments[2]).all()
+
+def test_clip_ends_are_on_the_box():
+    rng = np.random.default_rng(2)
+    lines = LineArray(rng.normal(size=(100, 3)))
+
+    segments, visible = lines.clip(-2, -1, 3, 2)
+    x, y = segments[visible, :, 0], segments[visible, :, 1]
+
+    on_x_edge = (x == -2) | (x == 3)
+    on_y_edge = (y == -1) | (y == 2)
+
+    assert visible.any()
+    assert (on_x_edge | on_y_edge).all()
+    assert ((x >= -2) & (x <= 3) & (y >= -1) & (y <= 2)).all()
+
+def test_clip_corners():
+    # through two opposite corners, touching only one corner, and along an edge
+    lines = LineArray([Line(1, -1, 0), Line(1, 1, -2), Line(1, 0, -1)])
+
+    segments, visible = lines.clip(-1, -1, 1, 1)
+
+    assert visible.tolist() == [True, False, True]
+    assert segments[0].tolist() == [[-1, -1], [1, 1]]
+    assert segments[2].tolist() == [[1, -1], [1, 1]]
+
+def test_clip_has_no_negative_zero():
+    segments, _ = LineArray([Line(1, 1, 0)]).clip(-2, 0, 0, 2)
+
+    assert str(segments.tolist()) == "[[[-2.0, 2.0], [0.0, 0.0]]]"
+
+def test_clip_empty():
+    segments, visible = LineArray([]).clip(-1, -1, 1, 1)
+
+    assert segments.shape == (0, 2, 2)
+    assert len(visible) == 0
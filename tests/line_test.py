@@ -1,6 +1,7 @@
+import pickle
 import pytest
 from math import inf
-from copy import copy
+from copy import copy, deepcopy
 
 from src.origametry.line import Line
 from src.origametry.point import Point
@@ -179,8 +180,11 @@ def test_compare_lines_almost_eq():
     point_2 = Point(1, 2)
     line_2 = Line(point_1, point_2)
 
-    # lines don't benefit from fuzzy matching
-    assert line_1 != line_2
+    # `line_2` just misses the origin, so its scaled coefficients are huge,
+    # but its normal form is still close to that of `line_1`
+    assert abs(line_2.a) > 1e15
+    assert line_1 == line_2
+    assert hash(line_1) == hash(line_2)
 
 def test_compare_lines_neq():
     line_1 = Line(1, 0)
@@ -203,6 +207,64 @@ def test_compare_non_line_with_line():
 
     assert other != line
 
+def test_compare_lines_with_normals_either_side_of_vertical():
+    # nearly horizontal lines whose normals point just either side of vertical,
+    # which are flipped to opposite directions by the sign convention
+    line_1 = Line(1e-12, 1, 1)
+    line_2 = Line(-1e-12, 1, 1)
+
+    assert line_1.normal[1] == -line_2.normal[1]
+    assert line_1 == line_2
+    assert hash(line_1) == hash(line_2)
+
+def test_compare_lines_far_from_origin():
+    line_1 = Line(Point(1e6, 0), Point(1e6, 1))
+    line_2 = Line(Point(1e6 + 1e-5, 0), Point(1e6, 1))
+
+    assert line_1 != line_2
+
+""" normal form """
+
+@pytest.mark.parametrize("line, normal, offset", [
+    (Line(3, 4, 10), (0.6, 0.8), 2),
+    (Line(-3, -4, 10), (0.6, 0.8), -2),
+    (Line(0, -2, 1), (0, 1), -0.5),
+    (Line(Point(2, 0), inf), (1, 0), -2),
+])
+def test_normal_form(line, normal, offset):
+    assert line.normal == pytest.approx(normal)
+    assert line.offset == pytest.approx(offset)
+
+def test_normal_form_near_origin():
+    # the scaled coefficients are huge, but the normal form is not
+    line = Line(Point(1e-14, 0), 1)
+
+    assert abs(line.a) > 1e13
+    assert line.normal == pytest.approx((2 ** -0.5, -(2 ** -0.5)))
+    assert line.offset == pytest.approx(-1e-14 * 2 ** -0.5, abs=1e-24)
+
+@pytest.mark.parametrize("line, direction, anchor", [
+    (Line(3, 4, 10), (-0.8, 0.6), Point(-1.2, -1.6)),
+    (Line(0, 1, -2), (-1, 0), Point(0, 2)),
+    (Line(Point(2, 0), inf), (0, 1), Point(2, 0)),
+    (Line(1), (2 ** -0.5, 2 ** -0.5), Point(0, 0)),
+])
+def test_direction_and_anchor(line, direction, anchor):
+    assert line.direction == pytest.approx(direction)
+    assert line.anchor == anchor
+    assert line.anchor.isOn(line)
+
+def test_derived_values_are_cached():
+    line = Line(1, 2, 3)
+
+    assert line.anchor is line.anchor
+    assert hash(line) == hash(line)
+
+    restored = pickle.loads(pickle.dumps(line))
+
+    assert restored.gradient == line.gradient
+    assert restored.anchor == line.anchor
+
 """ clone a Line """
 
 def test_copy_line():
@@ -211,6 +273,43 @@ def test_copy_line():
 
     assert line_1 == line_2
 
+def test_copy_line_returns_itself():
+    line = Line(1, 2)
+
+    assert copy(line) is line
+    assert deepcopy(line) is line
+
+def test_pickle_line():
+    for line in (Line(1, 2, 3), Line(2, -1), Line(Point(0, 0), inf)):
+        restored = pickle.loads(pickle.dumps(line))
+
+        assert (restored.a, restored.b, restored.c) == (line.a, line.b, line.c)
+
+""" immutability and hashing """
+
+def test_line_is_immutable():
+    line = Line(1, 2, 3)
+
+    with pytest.raises(AttributeError):
+        line._a = 3
+    with pytest.raises(AttributeError):
+        del line._c
+
+    assert line.a == 1 / 3
+
+def test_line_has_no_dict():
+    assert not hasattr(Line(1, 2, 3), "__dict__")
+
+def test_hash_almost_equal_lines():
+    assert hash(Line(1, 2, 3)) == hash(Line(1 + 1e-12, 2, 3))
+    assert hash(Line(1, 1, 0)) == hash(Line(1 - 1e-12, 1, 0))
+
+def test_lines_in_dict():
+    lines = {Line(1, 2, 3): "first", Line(0, 1): "second"}
+
+    assert lines[Line(1 + 1e-12, 2, 3)] == "first"
+    assert Line(1, 0) not in lines
+
 """ calculate the gradient """
 
 def test_positive_slope():
@@ -284,6 +383,15 @@ def test_this_line_vertical():
 
     assert intersection == point_1
 
+def test_intersection_near_origin():
+    line_1 = Line(Point(1e-13, 0), Point(1e-13, 1))
+    line_2 = Line(Point(0, -2e-13), Point(1, -2e-13))
+
+    intersection = line_1.intersection(line_2)
+
+    assert intersection.x == pytest.approx(1e-13, rel=1e-9)
+    assert intersection.y == pytest.approx(-2e-13, rel=1e-9)
+
 def test_other_line_vertical():
     point_1 = Point(0, 0)
     point_2 = Point(1, 0)
@@ -0,0 +1,240 @@
+import pytest
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.fold import fold
+from src.origametry.reflect import reflect
+from src.origametry.cache import caching
+from src.origametry import metrics
+from src.origametry.metrics import (
+    MetricsRegistry, Summary, active_registry, branch, count, disable_metrics, enable_metrics,
+    measuring, observe, timing
+)
+
+# arguments for each case of each axiom, with the name of the case
+BRANCHES = [
+    ((Point(0, 0), Point(0, 0), Point(0, 0), Point(0, 0)), "axiom_1", "infinite"),
+    ((Point(0, 0), Point(0, 0), Point(1, 1), Point(1, 1)), "axiom_1", "expected"),
+    ((Point(0, 0), Point(0, 0), Point(1, 0), Point(-1, 0)), "axiom_1", "through_point"),
+    ((Point(1, 0), Point(-1, 0), Point(0, 0), Point(0, 0)), "axiom_1", "through_point"),
+    ((Point(1, 0), Point(-1, 0), Point(2, 0), Point(-2, 0)), "axiom_1", "two_pairs"),
+    ((Point(0, 0), Point(0, 0)), "axiom_2", "infinite"),
+    ((Point(0, 0), Point(2, 0)), "axiom_2", "expected"),
+    ((Line(0, 1, 0), Line(0, 1, 0)), "axiom_3", "infinite"),
+    ((Line(0, 1, 0), Line(0, 1, -2)), "axiom_3", "parallel"),
+    ((Line(1, 0, 0), Line(0, 1, 0)), "axiom_3", "expected"),
+    ((Point(0, 0), Point(0, 0), Line(0, 1, 0), Line(0, 1, 0)), "axiom_4", "expected"),
+    ((Point(1, 0), Point(-1, 0), Line(0, 1, 0), Line(0, 1, 0)), "axiom_4", "points_perpendicular"),
+    ((Point(0, 0), Point(0, 0), Line(1, 0, 0), Line(0, 1, 0)), "axiom_4", "lines_through_point"),
+    ((Point(1, 0), Point(-1, 0), Line(1, 0, -1), Line(1, 0, 1)), "axiom_4", "points_and_lines"),
+    ((Point(0, 0), Line(0, 1, 0), Point(1, 1), Point(1, 1)), "axiom_5", "infinite"),
+    ((Point(1, 1), Line(0, 1, 0), Point(1, 1), Point(1, 1)), "axiom_5", "single_point"),
+    ((Point(0, 1), Line(0, 1, 0), Point(0, 10), Point(0, 10)), "axiom_5", "too_far"),
+    ((Point(0, 4), Line(0, 1, 0), Point(0, 2), Point(0, 2)), "axiom_5", "tangent"),
+    ((Point(0, 1), Line(0, 1, 0), Point(3, 1), Point(3, 1)), "axiom_5", "expected"),
+    ((Point(0, 1), Line(0, 1, 0), Point(1, 0), Point(-1, 0)), "axiom_5", "point_onto_point"),
+    ((Point(0, 0), Line(0, 1, 0), Point(1, 1), Line(1, 0, 0)), "axiom_6", "infinite"),
+    ((Point(0, 1), Line(0, 1, 0), Point(1, 0), Line(1, 0, 0)), "axiom_6", "expected"),
+    ((Point(0, 0), Line(0, 1, 0), Line(1, 0, 0), Line(1, 0, 0)), "axiom_7", "infinite"),
+    ((Point(0, 1), Line(0, 1, -5), Line(0, 1, 0), Line(0, 1, 0)), "axiom_7", "parallel"),
+    ((Point(0, 1), Line(1, 0, -2), Line(0, 1, 0), Line(0, 1, 0)), "axiom_7", "expected"),
+    ((Point(0, 1), Line(1, 0, -2), Line(0, 1, 0), Line(1, 0, 0)), "axiom_7", "line_onto_line"),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_active_registry():
+    # make sure that no test leaves a registry behind for the others
+    yield
+    disable_metrics()
+
+
+def _fold(*args):
+    try:
+        return fold(*args)
+    except ValueError:
+        return None
+
+
+""" recording folds """
+
+@pytest.mark.parametrize("args, operation, case", BRANCHES)
+def test_branches(args, operation, case):
+    with measuring() as registry:
+        _fold(*args)
+
+    snapshot = registry.snapshot()
+
+    assert list(snapshot["origametry_operation_seconds"]) == [(("operation", operation),)]
+    assert list(snapshot["origametry_branch_seconds"]) == [(("branch", case), ("operation", operation))]
+
+def test_counts_and_times():
+    with measuring() as registry:
+        for _ in range(3):
+            fold(Point(0, 0), Point(2, 0))
+
+    summary = registry.snapshot()["origametry_operation_seconds"][(("operation", "axiom_2"),)]
+
+    assert summary.count == 3
+    assert summary.total > 0
+    assert set(summary.quantiles) == set(metrics.QUANTILES)
+
+def test_reflect():
+    with measuring() as registry:
+        reflect(Point(1, 1), Line(1, 0, 0))
+        reflect(Line(1, 1, 0), Line(1, 0, 0))
+
+    assert set(registry.snapshot()["origametry_branch_seconds"]) == {
+        (("branch", "point"), ("operation", "reflect")),
+        (("branch", "line"), ("operation", "reflect")),
+    }
+
+def test_roots_and_duplicates():
+    with measuring() as registry:
+        fold(Point(0, 1), Line(0, 1, 0), Point(1, 0), Line(1, 0, 0))
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["origametry_roots_seconds"][()].count == 1
+    assert snapshot["origametry_remove_duplicates_size"][()].count == 1
+
+def test_cache_lookups():
+    with caching(), measuring() as registry:
+        for _ in range(3):
+            fold(Point(0, 0), Point(2, 0))
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["origametry_cache_lookups_total"] == {(("result", "hit"),): 2, (("result", "miss"),): 1}
+    assert snapshot["origametry_branch_seconds"][(("branch", "cached"), ("operation", "axiom_2"))].count == 2
+
+""" registry """
+
+def test_summary_quantiles():
+    registry = MetricsRegistry()
+
+    for value in range(1, 101):
+        registry.observe("value", value)
+
+    assert registry.snapshot()["value"][()] == Summary(100, 5050, {0.5: 50, 0.9: 90, 0.99: 99})
+
+def test_summary_keeps_a_sample(monkeypatch):
+    monkeypatch.setattr(metrics, "_RESERVOIR_SIZE", 10)
+    registry = MetricsRegistry()
+
+    for value in range(1000):
+        registry.observe("value", value)
+
+    summary = registry.snapshot()["value"][()]
+
+    assert (summary.count, summary.total) == (1000, 499500)
+    assert len(registry._summaries[("value", ())].samples) == 10
+
+    # most of the sample is from later values, so the median is not from the first ten
+    assert summary.quantiles[0.5] >= 10
+
+def test_nested_measurements():
+    registry = MetricsRegistry()
+
+    def outer():
+        branch("outer")
+        registry.measure("inner", branch, "inner")
+        branch("too late")
+
+    with measuring(registry):
+        registry.measure("outer", outer)
+
+    assert set(registry.snapshot()["origametry_branch_seconds"]) == {
+        (("branch", "outer"), ("operation", "outer")),
+        (("branch", "inner"), ("operation", "inner")),
+    }
+
+def test_measured_exceptions():
+    with measuring() as registry:
+        with pytest.raises(ValueError):
+            fold(Point(0, 0), Point(0, 0))
+
+    assert registry.snapshot()["origametry_operation_seconds"][(("operation", "axiom_2"),)].count == 1
+
+def test_reset():
+    with measuring() as registry:
+        fold(Point(0, 0), Point(2, 0))
+        registry.reset()
+
+    assert registry.snapshot() == {}
+
+""" Prometheus text """
+
+def test_prometheus():
+    registry = MetricsRegistry()
+    registry.count("calls_total", (("kind", 'a "b"\\c\n'),), 2)
+    registry.observe("size", 4)
+
+    assert registry.prometheus() == (
+        "# TYPE calls_total counter\n"
+        'calls_total{kind="a \\"b\\"\\\\c\\n"} 2.0\n'
+        "# TYPE size summary\n"
+        'size{quantile="0.5"} 4.0\n'
+        'size{quantile="0.9"} 4.0\n'
+        'size{quantile="0.99"} 4.0\n'
+        "size_sum 4.0\n"
+        "size_count 1.0\n"
+    )
+
+def test_prometheus_labels():
+    with measuring() as registry:
+        fold(Point(0, 0), Point(2, 0))
+
+    text = registry.prometheus()
+
+    assert 'origametry_branch_seconds{branch="expected",operation="axiom_2",quantile="0.5"} ' in text
+    assert 'origametry_branch_seconds_count{branch="expected",operation="axiom_2"} 1.0\n' in text
+
+""" enabling and disabling """
+
+def test_disabled_by_default():
+    assert active_registry() is None
+
+    # the hooks do nothing at all
+    branch("case")
+    count("calls_total")
+    observe("size", 1)
+
+    with timing("time"):
+        pass
+
+    assert fold(Point(0, 0), Point(2, 0)) == Line(1, 0, -1)
+
+def test_enable_and_disable():
+    registry = enable_metrics()
+
+    fold(Point(0, 0), Point(2, 0))
+    disable_metrics()
+    fold(Point(0, 0), Point(2, 0))
+
+    assert active_registry() is None
+    assert registry.snapshot()["origametry_operation_seconds"][(("operation", "axiom_2"),)].count == 1
+
+def test_measuring_restores_previous_registry():
+    outer = enable_metrics()
+    inner = MetricsRegistry()
+
+    with measuring(inner) as registry:
+        assert registry is inner
+        assert active_registry() is inner
+
+    assert active_registry() is outer
+
+def test_hooks():
+    with measuring() as registry:
+        count("calls_total", kind="a")
+        observe("size", 3)
+
+        with timing("time", kind="b"):
+            pass
+
+    snapshot = registry.snapshot()
+
+    assert snapshot["calls_total"] == {(("kind", "a"),): 1}
+    assert snapshot["size"][()].total == 3
+    assert snapshot["time"][(("kind", "b"),)].count == 1
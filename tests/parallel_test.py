@@ -0,0 +1,110 @@
+import pytest
+import signal
+import threading
+import time
+
+from src.origametry import parallel
+from src.origametry.fold import fold
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.parallel import Outcome, fold_parallel
+
+ARGUMENTS = [
+    (Point(0, 0), Point(2, 0)),
+    (Line(0), Line(1)),
+    (Point(0, 0), Point(0, 0)),
+    (Point(0, 1), Line(0), Point(1, 0), Line(float("inf"))),
+    (Point(0, 0),),
+]
+
+
+def _slow_fold(*arguments):
+    time.sleep(arguments[0])
+    return arguments[0]
+
+
+""" results """
+
+@pytest.mark.parametrize("workers, chunksize", [(1, 1), (2, 1), (2, 3)])
+def test_results_in_order(workers, chunksize):
+    outcomes = fold_parallel(ARGUMENTS, workers=workers, chunksize=chunksize)
+
+    assert [outcome.ok for outcome in outcomes] == [True, True, False, True, False]
+
+    for arguments, outcome in zip(ARGUMENTS, outcomes):
+        if outcome.ok:
+            assert outcome == Outcome(fold(*arguments), None)
+
+def test_exceptions_are_reported():
+    _, _, infinite, _, wrong = fold_parallel(ARGUMENTS, workers=2)
+
+    assert infinite.creases is None
+    assert isinstance(infinite.exception, ValueError)
+    assert isinstance(wrong.exception, TypeError)
+
+def test_empty():
+    assert fold_parallel([], workers=2) == []
+
+def test_default_workers():
+    assert fold_parallel(ARGUMENTS[:2]) == fold_parallel(ARGUMENTS[:2], workers=1)
+
+""" timeouts """
+
+def test_timeout(monkeypatch):
+    monkeypatch.setattr(parallel, "fold", _slow_fold)
+
+    quick, slow = fold_parallel([(0,), (10,)], workers=1, timeout=0.05)
+
+    assert quick == Outcome(0, None)
+    assert isinstance(slow.exception, TimeoutError)
+
+def test_timeout_restores_signal_handler():
+    previous = signal.getsignal(signal.SIGALRM)
+
+    fold_parallel(ARGUMENTS, workers=1, timeout=10)
+
+    assert signal.getsignal(signal.SIGALRM) is previous
+
+def test_timeout_in_workers():
+    outcomes = fold_parallel(ARGUMENTS, workers=2, timeout=10)
+
+    assert [outcome.ok for outcome in outcomes] == [True, True, False, True, False]
+    assert outcomes[0] == Outcome(fold(*ARGUMENTS[0]), None)
+
+@pytest.mark.parametrize("name", ["setitimer", "SIGALRM"])
+def test_timeout_needs_signals(monkeypatch, name):
+    monkeypatch.delattr(signal, name)
+
+    with pytest.raises(NotImplementedError):
+        fold_parallel(ARGUMENTS, workers=1, timeout=1)
+
+def test_timeout_outside_the_main_thread():
+    errors = []
+
+    def run():
+        try:
+            fold_parallel(ARGUMENTS, workers=1, timeout=1)
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert len(errors) == 1
+
+def test_timeout_in_workers_outside_the_main_thread():
+    outcomes = []
+
+    thread = threading.Thread(target=lambda: outcomes.extend(fold_parallel(ARGUMENTS[:2], workers=2, timeout=10)))
+    thread.start()
+    thread.join()
+
+    assert outcomes == fold_parallel(ARGUMENTS[:2], workers=1)
+
+""" invalid options """
+
+@pytest.mark.parametrize("options", [{"workers": 0}, {"chunksize": 0}, {"timeout": 0}])
+def test_invalid_options(options):
+    with pytest.raises(ValueError):
+        fold_parallel(ARGUMENTS, **options)
@@ -0,0 +1,189 @@
+import pytest
+import numpy as np
+from math import sqrt
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry import point_array
+from src.origametry.point_array import PointArray, unique_indices
+from src.origametry.reflect import reflect
+
+
+""" create from points or coordinates """
+
+def test_create_from_points():
+    points = PointArray([Point(0, 1), Point(2, 3)])
+
+    assert points.coordinates.tolist() == [[0, 1], [2, 3]]
+    assert points.coordinates.dtype == np.float64
+
+def test_create_from_coordinates():
+    points = PointArray(np.array([[0, 1], [2, 3]]))
+
+    assert points.x.tolist() == [0, 2]
+    assert points.y.tolist() == [1, 3]
+
+def test_create_from_point_array():
+    original = PointArray([Point(0, 1)])
+
+    points = PointArray(original)
+
+    assert points.coordinates.tolist() == [[0, 1]]
+    assert points.coordinates is not original.coordinates
+
+def test_create_empty():
+    points = PointArray([])
+
+    assert len(points) == 0
+    assert points.coordinates.shape == (0, 2)
+
+def test_create_with_bad_shape():
+    with pytest.raises(ValueError):
+        PointArray(np.zeros((3, 3)))
+
+def test_round_trip_to_points():
+    original = [Point(0, 1), Point(2, 3), Point(-1, .5)]
+
+    points = PointArray.from_points(original).to_points()
+
+    assert points == original
+
+def test_repr():
+    points = PointArray([Point(0, 1)])
+
+    assert repr(points) == "PointArray([[0.0, 1.0]])"
+
+""" indexing """
+
+def test_index_single_point():
+    points = PointArray([Point(0, 1), Point(2, 3)])
+
+    assert points[1] == Point(2, 3)
+
+def test_index_with_mask():
+    points = PointArray([Point(0, 1), Point(2, 3), Point(4, 5)])
+
+    selected = points[np.array([True, False, True])]
+
+    assert list(selected) == [Point(0, 1), Point(4, 5)]
+
+""" fuzzy equality """
+
+def test_compare_with_point():
+    nearly_0 = .4 - .3 - .1
+    points = PointArray([Point(nearly_0, 0), Point(1, 0)])
+
+    assert (points == Point(0, 0)).tolist() == [True, False]
+    assert (points != Point(0, 0)).tolist() == [False, True]
+
+def test_compare_with_point_array():
+    points_1 = PointArray([Point(0, 0), Point(1, 1)])
+    points_2 = PointArray([Point(0, 0), Point(1, 2)])
+
+    assert (points_1 == points_2).tolist() == [True, False]
+
+def test_compare_with_other_type():
+    points = PointArray([Point(0, 0)])
+
+    assert (points == 0) is False
+    assert (points != 0) is True
+
+""" unique """
+
+def test_unique():
+    points = PointArray([Point(0, 0), Point(1, 0), Point(1e-12, 0), Point(0, 0), Point(1, 1e-11)])
+
+    assert list(points.unique()) == [Point(0, 0), Point(1, 0)]
+
+def test_unique_keeps_first_of_chain():
+    # each point is close to the next, but the first and third are not close
+    points = PointArray(np.array([[0, 0], [0.9e-10, 0], [1.8e-10, 0]]))
+
+    assert points.unique().coordinates.tolist() == [[0, 0], [1.8e-10, 0]]
+
+def test_unique_of_non_finite_points():
+    points = PointArray(np.array([[np.inf, 0], [np.inf, 0], [-np.inf, 0], [np.nan, 0], [np.nan, 0]]))
+
+    assert len(points.unique()) == 4
+
+def test_unique_indices_symmetric():
+    values = np.array([[1e-12, 1, 0.5], [-1e-12, -1, -0.5], [0, 1, -0.5], [np.inf, 0, 0], [-np.inf, 0, 0]])
+
+    assert unique_indices(values).tolist() == [0, 1, 2, 3, 4]
+    assert unique_indices(values, symmetric=True).tolist() == [0, 2, 3]
+
+def test_unique_of_nothing():
+    assert len(PointArray([]).unique()) == 0
+
+def test_unique_in_rounds(monkeypatch):
+    # long chains of close points are finished one by one
+    monkeypatch.setattr(point_array, "_MAX_ROUNDS", 1)
+
+    points = PointArray(np.column_stack((np.arange(10) * 0.9e-10, np.zeros(10))))
+
+    assert points.unique().x.tolist() == pytest.approx(np.arange(0, 10, 2) * 0.9e-10, abs=0)
+
+""" geometry """
+
+def test_projection():
+    points = PointArray([Point(0, 0), Point(2, 0)])
+    line = Line(1, 1, -2)
+
+    projections = points.projection(line)
+
+    assert list(projections) == [Point(1, 1), Point(2, 0)]
+
+def test_reflect():
+    points = PointArray([Point(0, 0), Point(2, 2), Point(1, 0)])
+    crease = Line(1, 1, -1)
+
+    reflections = points.reflect(crease)
+
+    assert list(reflections) == [reflect(point, crease) for point in points]
+
+def test_reflect_across_vertical_line():
+    points = PointArray([Point(0, 0), Point(0, 5)])
+    crease = Line(1, 0, -1)
+
+    reflections = points.reflect(crease)
+
+    assert list(reflections) == [Point(2, 0), Point(2, 5)]
+
+def test_geometry_near_the_origin():
+    # scaling this line to `c = 1` gives coefficients whose squares overflow
+    points = PointArray([Point(1, 1), Point(1, -1)])
+    line = Line(1, 1, 1e-300)
+
+    assert list(points.projection(line)) == [Point(0, 0), Point(1, -1)]
+    assert list(points.reflect(line)) == [Point(-1, -1), Point(1, -1)]
+    assert points.isOn(line).tolist() == [False, True]
+    assert np.allclose(points.distance(line), [sqrt(2), 0])
+
+def test_is_on():
+    points = PointArray([Point(1, 2), Point(2, 1), Point(-1, -2)])
+    line = Line(-2, 1, 0)
+
+    assert points.isOn(line).tolist() == [True, False, True]
+
+def test_distance_to_point():
+    points = PointArray([Point(3, 4), Point(0, 0)])
+
+    assert points.distance(Point(0, 0)).tolist() == [5, 0]
+
+def test_distance_to_line():
+    points = PointArray([Point(0, 0), Point(0, 2)])
+    line = Line(1, -1, 2)
+
+    assert np.allclose(points.distance(line), [sqrt(2), 0])
+
+def test_distance_to_point_array():
+    points_1 = PointArray([Point(0, 0), Point(1, 1)])
+    points_2 = PointArray([Point(3, 4), Point(1, 1)])
+
+    assert points_1.distance(points_2).tolist() == [5, 0]
+
+def test_distance_to_other_type():
+    points = PointArray([Point(0, 0)])
+
+    with pytest.raises(TypeError):
+        points.distance(0)
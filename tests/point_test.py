@@ -1,4 +1,6 @@
-from copy import copy
+import pickle
+import pytest
+from copy import copy, deepcopy
 
 from src.origametry.line import Line
 from src.origametry.point import Point
@@ -58,6 +60,47 @@ def test_copy_point():
 
     assert point_1 == point_2
 
+def test_copy_point_returns_itself():
+    point = Point(1, 2)
+
+    assert copy(point) is point
+    assert deepcopy(point) is point
+
+def test_pickle_point():
+    point = Point(1, 2.5)
+
+    assert pickle.loads(pickle.dumps(point)) == point
+
+""" immutability and hashing """
+
+def test_point_is_immutable():
+    point = Point(1, 2)
+
+    with pytest.raises(AttributeError):
+        point._x = 3
+    with pytest.raises(AttributeError):
+        point.z = 3
+    with pytest.raises(AttributeError):
+        del point._y
+
+    assert point.x == 1
+
+def test_point_has_no_dict():
+    assert not hasattr(Point(1, 2), "__dict__")
+
+def test_hash_almost_equal_points():
+    nearly_0 = .4 - .3 - .1
+
+    assert hash(Point(0, 0)) == hash(Point(nearly_0, -nearly_0))
+    assert hash(Point(.3, 1e6)) == hash(Point(.1 + .2, 1e6 + 1e-4))
+
+def test_points_in_set():
+    points = {Point(0, 0), Point(.1 + .2, 1), Point(.3, 1)}
+
+    assert len(points) == 2
+    assert Point(1e-12, 0) in points
+    assert Point(1, 0) not in points
+
 """ check whether a Point lies on a given Line """
 
 def test_point_on_line():
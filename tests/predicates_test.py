@@ -0,0 +1,136 @@
+import pytest
+from math import inf, nan, nextafter
+from random import Random
+
+from src.origametry.point import Point
+from src.origametry.line import Line
+from src.origametry.helpers import projection
+from src.origametry.predicates import (
+    are_parallel, are_perpendicular, determinant_sign, is_on, orientation, tangency
+)
+
+EPSILON = 2 ** -52
+
+
+""" determinants """
+
+@pytest.mark.parametrize("values, sign", [
+    ((1, 2, 3, 4), -1),
+    ((4, 1, 3, 2), 1),
+    ((1, 2, 3, 6), 0),
+    # `(1 + e)(1 - e)` rounds to 1, but is really just below it
+    ((1 + EPSILON, 1, 1, 1 - EPSILON), -1),
+])
+def test_determinant_sign(values, sign):
+    assert determinant_sign(*values) == sign
+
+def test_determinant_sign_of_non_finite_values():
+    assert determinant_sign(inf, 0, 0, 1) == 1
+    assert determinant_sign(nan, 0, 0, 1) == 0
+
+""" orientation """
+
+def test_orientation():
+    assert orientation(Point(0, 0), Point(1, 0), Point(0, 1)) == 1
+    assert orientation(Point(0, 0), Point(0, 1), Point(1, 0)) == -1
+    assert orientation(Point(0, 0), Point(1, 1), Point(3, 3)) == 0
+
+def test_orientation_is_exact():
+    # both points are rounded from the line y = x / 3, so are not quite in line
+    # with the origin, even though the determinant rounds to zero
+    p, q, r = Point(0, 0), Point(0.1, 0.1 / 3), Point(0.3, 0.3 / 3)
+
+    assert (q.x - p.x) * (r.y - p.y) - (q.y - p.y) * (r.x - p.x) == 0
+    assert orientation(p, q, r) == 1
+    assert orientation(p, r, q) == -1
+
+def test_orientation_of_non_finite_values():
+    assert orientation(Point(0, 0), Point(inf, 0), Point(0, 1)) == 1
+    assert orientation(Point(0, 0), Point(nan, 0), Point(0, 1)) == 0
+
+""" parallel and perpendicular lines """
+
+def test_are_parallel():
+    assert are_parallel(Line(1, 2, 3), Line(2, 4, 1))
+    assert are_parallel(Line(1, 0, 0), Line(1, 0, 5))
+    assert not are_parallel(Line(1, 2, 3), Line(2, 1, 3))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_are_parallel_with_a_shared_gradient(seed):
+    # rounding makes lines through different points with the same gradient
+    # slightly out of parallel, but they must never be made to meet
+    rng = Random(seed)
+
+    for _ in range(200):
+        gradient = rng.uniform(-10, 10)
+        line_1, line_2 = (Line(Point(rng.uniform(-10, 10), rng.uniform(-10, 10)), gradient) for _ in range(2))
+
+        assert are_parallel(line_1, line_2)
+        assert line_1.intersection(line_2) is None
+
+def test_are_parallel_within_tolerance():
+    # the normals differ by less than the tolerance, pointing either way
+    assert are_parallel(Line(1, 1e-12, 0), Line(1, -1e-12, 1))
+    assert are_parallel(Line(-1e-12, 1, 0), Line(1e-12, 1, 1))
+    assert not are_parallel(Line(1e-9, 1, 1), Line(0, 1, 0))
+
+def test_are_perpendicular():
+    assert are_perpendicular(Line(1, 2, 3), Line(2, -1, 3))
+    assert are_perpendicular(Line(1, 0, 0), Line(0, 1, 5))
+    assert not are_perpendicular(Line(1, 2, 3), Line(2, 1, 3))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_are_perpendicular_with_perpendicular_gradients(seed):
+    random = Random(seed)
+
+    for _ in range(200):
+        gradient = random.uniform(-5, 5)
+        line_1 = Line(Point(random.uniform(-9, 9), random.uniform(-9, 9)), gradient)
+        line_2 = Line(Point(random.uniform(-9, 9), random.uniform(-9, 9)), -1 / gradient)
+
+        assert are_perpendicular(line_1, line_2)
+
+def test_are_perpendicular_within_tolerance():
+    assert are_perpendicular(Line(1, 1e-12, 0), Line(1e-12, 1, 1))
+    assert are_perpendicular(Line(1, 1e-12, 0), Line(-1e-12, -1, 1))
+    assert not are_perpendicular(Line(1e-9, 1, 1), Line(0, 1, 0))
+    assert not are_perpendicular(Line(1, 1e-9, 0), Line(1, 0, 1))
+
+""" incidence """
+
+@pytest.mark.parametrize("point, on", [
+    (Point(0, 0), True),
+    (Point(0, 7), True),
+    (Point(1e-11, 2), True),
+    (Point(1e-9, 2), False),
+    (Point(1e12, 0), False),
+])
+def test_is_on(point, on):
+    assert is_on(point, Line(1, 0, 0)) is on
+
+def test_is_on_at_the_tolerance():
+    # exactly the absolute tolerance away, which rounding alone cannot decide
+    assert is_on(Point(1e-10, 0), Line(1, 0, 0))
+    assert not is_on(Point(nextafter(1e-10, 1), 0), Line(1, 0, 0))
+
+@pytest.mark.parametrize("point, line", [
+    (Point(inf, 0), Line(0, 1, 0)),
+    (Point(nan, 0), Line(1, 0, 0)),
+    (Point(0, 0), Line(inf, 1, 0)),
+])
+def test_is_on_non_finite(point, line):
+    assert is_on(point, line) == (point == projection(point, line))
+
+""" tangency """
+
+@pytest.mark.parametrize("line, position", [
+    (Line(0, 1, 0.5), 1),
+    (Line(0, 1, 1), 0),
+    (Line(0, 1, 2), -1),
+])
+def test_tangency(line, position):
+    # the unit circle about the origin, compared with horizontal lines below it
+    assert tangency(Point(0, 0), Point(0, 1), line) == position
+
+def test_tangency_non_finite():
+    assert tangency(Point(inf, 0), Point(0, 1), Line(0, 1, 1)) == 0
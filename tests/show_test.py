@@ -1,18 +1,22 @@
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, patch
 
 from src.origametry.line import Line
 from src.origametry.point import Point
 from src.origametry.fold import fold
-from src.origametry.show import show
+from src.origametry.show import render, render_many, show
 
+# the arguments for drawing every point, and every crease
+POINT_STYLE = {"marker": "o", "facecolors": "#d0d", "edgecolors": "k", "linewidths": 1}
+LINE_STYLE = {"colors": "#d0d"}
+CREASE_STYLE = {"colors": "#abf", "linestyles": "--"}
 
 """ fixtures """
 
 @pytest.fixture
-def mock_plot():
-    with patch("matplotlib.pyplot.plot") as mockplot:
-        yield mockplot
+def mock_collection():
+    with patch("matplotlib.collections.LineCollection") as mockcollection:
+        yield mockcollection
 
 
 @pytest.fixture
@@ -29,6 +33,12 @@ def mock_show():
         yield mockshow
 
 
+def _drawn(mock_collection):
+    """ the segments and style of every collection of lines drawn """
+
+    return [(args[0].tolist(), kwargs) for args, kwargs in mock_collection.call_args_list]
+
+
 """ tests """
 
 def test_show_plot(mock_show):
@@ -43,150 +53,141 @@ def test_set_equal_aspect_ratio(mock_axes):
     mock_axes.set_aspect.assert_called_once_with("equal", adjustable="box")
 
 
-def test_single_point(mock_plot, mock_axes):
+def test_single_point(mock_collection, mock_axes):
     point = Point(10, 13)
 
     show(point)
 
-    mock_plot.assert_called_once_with(10, 13, "ok", markerfacecolor="#d0d")
+    mock_axes.scatter.assert_called_once_with([10], [13], **POINT_STYLE)
+    mock_collection.assert_not_called()
     mock_axes.set_xlim.assert_called_once_with(9, 11)
     mock_axes.set_ylim.assert_called_once_with(12, 14)
 
 
-def test_single_line(mock_plot, mock_axes):
+def test_single_line(mock_collection, mock_axes):
     line = Line(1, -1, 2)
 
     show(line)
 
-    mock_plot.assert_called_once_with([-1, 1], [1, 3], color="#d0d")
+    assert _drawn(mock_collection) == [([[[-1, 1], [1, 3]]], LINE_STYLE)]
+    mock_axes.add_collection.assert_called_once_with(mock_collection.return_value)
+    mock_axes.scatter.assert_not_called()
     mock_axes.set_xlim.assert_called_once_with(-1, 1)
     mock_axes.set_ylim.assert_called_once_with(1, 3)
 
 
-def test_single_crease(mock_plot, mock_axes):
+def test_single_crease(mock_collection, mock_axes):
     crease = Line(1, 2, 1)
 
     show(creases=crease)
 
-    mock_plot.assert_called_once_with([-1, 1], [0, -1], "--", color="#abf")
+    assert _drawn(mock_collection) == [([[[-1, 0], [1, -1]]], CREASE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(-1, 1)
     mock_axes.set_ylim.assert_called_once_with(-1.5, .5)
 
 
-def test_single_crease_as_list(mock_plot, mock_axes):
+def test_single_crease_as_list(mock_collection, mock_axes):
     crease = Line(1, 0, 0)
 
     show(creases=[crease])
 
-    mock_plot.assert_called_once_with([0, 0], [-1, 1], "--", color="#abf")
+    assert _drawn(mock_collection) == [([[[0, -1], [0, 1]]], CREASE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(-1, 1)
     mock_axes.set_ylim.assert_called_once_with(-1, 1)
 
 
-def test_none_as_creases(mock_plot, mock_axes):
+def test_none_as_creases(mock_collection, mock_axes):
     show(creases=None)
 
-    mock_plot.assert_not_called()
+    mock_collection.assert_not_called()
+    mock_axes.scatter.assert_not_called()
     mock_axes.set_xlim.assert_called_once_with(-1, 1)
     mock_axes.set_ylim.assert_called_once_with(-1, 1)
 
 
-def test_two_points(mock_plot, mock_axes):
+def test_two_points(mock_collection, mock_axes):
     p1 = Point(1, 2)
     p2 = Point(8, 3)
 
     show(p1, p2)
 
-    mock_plot.assert_has_calls([
-        call(1, 2, "ok", markerfacecolor="#d0d"),
-        call(8, 3, "ok", markerfacecolor="#d0d"),
-    ])
+    mock_axes.scatter.assert_called_once_with([1, 8], [2, 3], **POINT_STYLE)
     mock_axes.set_xlim.assert_called_once_with(-.75, 9.75)
     mock_axes.set_ylim.assert_called_once_with(-2.75, 7.75)
 
 
-def test_point_and_line(mock_plot, mock_axes):
+def test_point_and_line(mock_collection, mock_axes):
     point = Point(1, 2)
     line = Line(0, 1, -1)
 
     show(point, line)
 
-    mock_plot.assert_has_calls([
-        call(1, 2, "ok", markerfacecolor="#d0d"),
-        call([.25, 1.75], [1, 1], color="#d0d"),
-    ])
+    mock_axes.scatter.assert_called_once_with([1], [2], **POINT_STYLE)
+    assert _drawn(mock_collection) == [([[[.25, 1], [1.75, 1]]], LINE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(.25, 1.75)
     mock_axes.set_ylim.assert_called_once_with(.75, 2.25)
 
 
-def test_point_and_crease(mock_plot, mock_axes):
+def test_point_and_crease(mock_collection, mock_axes):
     point = Point(1, 2)
     crease = Line(0, 1, -1)
 
     show(point, creases=[crease])
 
-    mock_plot.assert_has_calls([
-        call(1, 2, "ok", markerfacecolor="#d0d"),
-        call([.25, 1.75], [1, 1], "--", color="#abf"),
-    ])
+    mock_axes.scatter.assert_called_once_with([1], [2], **POINT_STYLE)
+    assert _drawn(mock_collection) == [([[[.25, 1], [1.75, 1]]], CREASE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(.25, 1.75)
     mock_axes.set_ylim.assert_called_once_with(.75, 2.25)
 
 
-def test_two_lines(mock_plot, mock_axes):
+def test_two_lines(mock_collection, mock_axes):
     line_1 = Line(1, 1, 0)
     line_2 = Line(0, 1, -1)
 
     show(line_1, line_2)
 
-    mock_plot.assert_has_calls([
-        call([-2, 0], [2, 0], color="#d0d"),
-        call([-2, 0], [1, 1], color="#d0d"),
-    ])
+    assert _drawn(mock_collection) == [([[[-2, 2], [0, 0]], [[-2, 1], [0, 1]]], LINE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(-2, 0)
     mock_axes.set_ylim.assert_called_once_with(0, 2)
 
 
-def test_line_and_crease(mock_plot, mock_axes):
+def test_line_and_crease(mock_collection, mock_axes):
     line = Line(1, 1, 0)
     crease = Line(0, 1, -1)
 
     show(line, creases=crease)
 
-    mock_plot.assert_has_calls([
-        call([-2, 0], [2, 0], color="#d0d"),
-        call([-2, 0], [1, 1], "--", color="#abf"),
-    ])
+    assert _drawn(mock_collection) == [
+        ([[[-2, 2], [0, 0]]], LINE_STYLE),
+        ([[[-2, 1], [0, 1]]], CREASE_STYLE),
+    ]
+    assert mock_axes.add_collection.call_count == 2
     mock_axes.set_xlim.assert_called_once_with(-2, 0)
     mock_axes.set_ylim.assert_called_once_with(0, 2)
 
 
-def test_two_creases(mock_plot, mock_axes):
+def test_two_creases(mock_collection, mock_axes):
     crease_1 = Line(1, 1, 0)
     crease_2 = Line(0, 1, -1)
 
     show(creases=[crease_1, crease_2])
 
-    mock_plot.assert_has_calls([
-        call([-2, 0], [2, 0], "--", color="#abf"),
-        call([-2, 0], [1, 1], "--", color="#abf"),
-    ])
+    assert _drawn(mock_collection) == [([[[-2, 2], [0, 0]], [[-2, 1], [0, 1]]], CREASE_STYLE)]
     mock_axes.set_xlim.assert_called_once_with(-2, 0)
     mock_axes.set_ylim.assert_called_once_with(0, 2)
 
 
-def test_parallel_lines_and_creases(mock_plot, mock_axes):
+def test_parallel_lines_and_creases(mock_collection, mock_axes):
     line_1 = Line(0, 1, -1)
     line_2 = Line(0, 1, -3)
     crease = fold(line_1, line_2)
 
     show(line_1, line_2, creases=crease)
 
-    mock_plot.assert_has_calls([
-        call([-1.5, 1.5], [1, 1], color="#d0d"),
-        call([-1.5, 1.5], [3, 3], color="#d0d"),
-        call([-1.5, 1.5], [2, 2], "--", color="#abf"),
-    ])
+    assert _drawn(mock_collection) == [
+        ([[[-1.5, 1], [1.5, 1]], [[-1.5, 3], [1.5, 3]]], LINE_STYLE),
+        ([[[-1.5, 2], [1.5, 2]]], CREASE_STYLE),
+    ]
     mock_axes.set_xlim.assert_called_once_with(-1.5, 1.5)
     mock_axes.set_ylim.assert_called_once_with(.5, 3.5)
 
@@ -200,11 +201,105 @@ def test_custom_bounding_box(mock_axes):
     mock_axes.set_ylim.assert_called_once_with(-10, 10)
 
 
-def test_line_outside_custom_bounding_box(mock_plot, mock_axes):
+def test_line_outside_custom_bounding_box(mock_collection, mock_axes):
     line = Line(0, 1, -1)
 
     show(line, bounding_box=(-50, -50, 0, 0))
 
-    mock_plot.assert_not_called()
+    mock_collection.assert_not_called()
+    mock_axes.add_collection.assert_not_called()
     mock_axes.set_xlim.assert_called_once_with(-50, 0)
     mock_axes.set_ylim.assert_called_once_with(-50, 0)
+
+
+def test_one_artist_for_each_kind():
+    import matplotlib.pyplot as plt
+
+    points = [Point(i, i) for i in range(100)]
+    lines = [Line(1, 0, -i) for i in range(100)]
+    creases = [Line(0, 1, -i) for i in range(100)]
+
+    show(*points, *lines, creases=creases, bounding_box=(-1, -1, 100, 100))
+
+    ax = plt.gca()
+
+    assert len(ax.lines) == 0
+    assert [len(collection.get_offsets()) for collection in ax.collections[:1]] == [100]
+    assert [len(collection.get_segments()) for collection in ax.collections[1:]] == [100, 100]
+
+    plt.close("all")
+
+
+def test_quantile_ignores_far_intersections(mock_axes):
+    # a fan of lines through (0, 0), with one nearly parallel to the first
+    lines = [Line(float(k), 1, 0) for k in range(20)] + [Line(1e-9, 1, 1)]
+
+    show(*lines, quantile=0.01)
+
+    (min_x, max_x), _ = mock_axes.set_xlim.call_args
+    assert -2 < min_x < max_x < 2
+
+
+def test_invalid_quantile():
+    with pytest.raises(ValueError):
+        show(Line(1, 0, 0), Line(0, 1, 0), quantile=0.5)
+
+
+""" rendering without a window """
+
+@pytest.mark.parametrize("format, start", [("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF")])
+def test_render_to_bytes(format, start, mock_show):
+    image = render(Point(1, 2), Line(0, 1, -1), creases=Line(1, 0, -1), format=format)
+
+    assert image.startswith(start)
+    mock_show.assert_not_called()
+
+def test_render_to_file(tmp_path):
+    path = tmp_path / "scene.svg"
+
+    assert render(Point(1, 2), Line(0, 1, -1), path=path) is None
+    assert path.read_bytes().startswith(b"<?xml")
+
+def test_render_leaves_pyplot_alone():
+    import matplotlib.pyplot as plt
+
+    figures = plt.get_fignums()
+
+    render(Point(1, 2), Line(0, 1, -1))
+
+    assert plt.get_fignums() == figures
+
+def test_show_output(tmp_path, mock_show):
+    path = tmp_path / "scene.png"
+
+    show(Point(1, 2), Line(0, 1, -1), output=path)
+
+    assert path.read_bytes().startswith(b"\x89PNG")
+    mock_show.assert_not_called()
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_many(workers, tmp_path):
+    scenes = [
+        [Point(1, 2), Line(0, 1, -1)],
+        {"elements": [Line(1, 1, 0)], "creases": Line(1, -1, 0), "format": "pdf"},
+        {"elements": [Point(0, 0)], "path": tmp_path / "point.png", "format": "png"},
+    ]
+
+    images = render_many(scenes, workers=workers, format="svg")
+
+    # SVG ids are random, so only the plain options are compared exactly
+    assert images[0].startswith(b"<?xml")
+    assert images[1].startswith(b"%PDF")
+    assert images[2] is None
+    assert (tmp_path / "point.png").read_bytes().startswith(b"\x89PNG")
+
+def test_render_many_matches_render():
+    scene = [Point(1, 2), Line(0, 1, -1)]
+
+    assert render_many([scene], workers=2) == [render(*scene)]
+
+def test_render_many_workers():
+    assert render_many([]) == []
+
+    with pytest.raises(ValueError):
+        render_many([[Point(0, 0)]], workers=0)
@@ -0,0 +1,150 @@
+import random
+import pytest
+from math import inf, nan
+
+from src.origametry import spatial
+from src.origametry.helpers import distance
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.spatial import SpatialIndex
+
+
+def _random_points(n, scale=1.0, seed=0):
+    generator = random.Random(seed)
+    return [Point(generator.uniform(-scale, scale), generator.uniform(-scale, scale)) for _ in range(n)]
+
+
+def _random_lines(n, seed=0):
+    points = _random_points(2 * n, seed=seed)
+    return [Line(points[i], points[i + 1]) for i in range(0, 2 * n, 2)]
+
+
+""" adding elements """
+
+def test_add_returns_positions():
+    index = SpatialIndex()
+
+    assert index.add(Point(0, 0)) == 0
+    assert index.add(Line(1, 0, 0)) == 0
+    assert index.add(Point(1, 0)) == 1
+    assert len(index) == 3
+    assert index.points == [Point(0, 0), Point(1, 0)]
+    assert index.lines == [Line(1, 0, 0)]
+
+def test_add_other_types():
+    with pytest.raises(TypeError):
+        SpatialIndex().add((0, 0))
+
+def test_invalid_cell_size():
+    with pytest.raises(ValueError):
+        SpatialIndex(cell_size=0)
+
+def test_grid_is_refined_as_it_fills():
+    index = SpatialIndex(cell_size=1)
+    index.extend(_random_points(1000, scale=0.5))
+
+    assert index.cell_size < 1
+    assert index.within(Point(0, 0), 0.1) == [p for p in index.points if distance(p, Point(0, 0)) <= 0.1]
+
+def test_grid_is_not_refined_below_minimum(monkeypatch):
+    monkeypatch.setattr(spatial, "_MIN_CELL_SIZE", 0.25)
+
+    index = SpatialIndex([Point(0, 0)] * 100, cell_size=1)
+
+    assert index.cell_size == 0.25
+
+""" finding elements """
+
+def test_index_of_points_and_lines():
+    index = SpatialIndex([Point(0, 0), Point(1, 1), Line(1, 1, 1), Point(1, 1e-12)])
+
+    assert index.index(Point(1, 1 + 1e-12)) == 1
+    assert index.index(Line(1, 1 + 1e-12, 1)) == 0
+    assert index.index(Point(2, 2)) is None
+    assert index.index("point") is None
+
+    assert Point(1e-12, 0) in index
+    assert Line(1, 0, 0) not in index
+
+def test_non_finite_points():
+    index = SpatialIndex([Point(inf, 0), Point(nan, 0), Point(0, 0)])
+
+    assert Point(inf, 0) in index
+    assert index.nearest(Point(10, 0)) == Point(0, 0)
+    assert index.nearest(Point(inf, 0)) is None
+    assert index.points_on(Line(0, 1, 0)) == [Point(0, 0)]
+    assert index.lines_through(Point(inf, 0)) == []
+
+""" nearest and radius queries """
+
+def test_nearest_of_nothing():
+    assert SpatialIndex().nearest(Point(0, 0)) is None
+
+def test_nearest_prefers_first_of_a_tie():
+    index = SpatialIndex([Point(1, 0), Point(-1, 0)])
+
+    assert index.nearest(Point(0, 0)) is index.points[0]
+
+@pytest.mark.parametrize("query", [Point(0.1, 0.2), Point(-0.7, 0.9), Point(50, -3), Point(1e6, 1e6)])
+def test_nearest_matches_brute_force(query):
+    points = _random_points(1000)
+    index = SpatialIndex(points)
+
+    assert distance(index.nearest(query), query) == min(distance(p, query) for p in points)
+
+@pytest.mark.parametrize("radius", [0, 0.05, 0.3, 100])
+def test_within_matches_brute_force(radius):
+    points = _random_points(1000)
+    index = SpatialIndex(points)
+    query = Point(0.1, -0.2)
+
+    assert index.within(query, radius) == [p for p in points if distance(p, query) <= radius]
+
+""" points on lines """
+
+@pytest.mark.parametrize("line", [
+    Line(0, 1, 0),                       # horizontal
+    Line(1, 0, -0.5),                    # vertical
+    Line(Point(0, 0), 0.3),              # shallow
+    Line(Point(0.1, 0), -7),             # steep
+])
+def test_points_on_matches_is_on(line):
+    points = _random_points(500)
+    # points exactly and nearly on the line, beyond the first cell
+    points += [Point(x, -(line.a * x + line.c) / line.b) for x in (-0.8, 0.25, 3)] if line.b else []
+    points += [Point(-(line.b * y + line.c) / line.a, y + 1e-12) for y in (-0.6, 0.9)] if line.a else []
+
+    index = SpatialIndex(points)
+    expected = [p for p in points if p.isOn(line)]
+
+    assert len(expected) >= 2
+    assert index.points_on(line) == expected
+
+def test_points_on_with_large_coordinates():
+    points = [Point(x * 1e6, 2 * x * 1e6 + 1) for x in range(-3, 4)] + [Point(0, 0)]
+    index = SpatialIndex(points)
+
+    assert index.points_on(Line(Point(0, 1), 2)) == points[:-1]
+
+""" lines through points """
+
+def test_lines_through_matches_is_on():
+    lines = _random_lines(300)
+    points = [lines[i].intersection(lines[i + 1]) for i in range(0, 16, 2)]
+    points += [Point(0, 0), Point(0.5, 0.5)]
+
+    index = SpatialIndex(lines)
+
+    for point in points:
+        assert index.lines_through(point) == [line for line in lines if point.isOn(line)]
+
+@pytest.mark.parametrize("point", [Point(1, 0), Point(-1, 0), Point(0, 1), Point(0, -1), Point(-3, -3)])
+def test_lines_through_at_bucket_edges(point):
+    # lines whose normals sit exactly on the edges of angle buckets, and on either side of zero
+    lines = [Line(point, gradient) for gradient in (0, inf, 1, -1, 1e-9, -1e-9, 1e9, -1e9)]
+    index = SpatialIndex(lines)
+
+    assert index.lines_through(point) == lines
+    assert index.lines_through(Point(point.x + 1e-3, point.y)) == [
+        line for line in lines if Point(point.x + 1e-3, point.y).isOn(line)
+    ]
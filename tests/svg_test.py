@@ -0,0 +1,99 @@
+import io
+import re
+import pytest
+import xml.etree.ElementTree as ElementTree
+
+from src.origametry import svg
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.svg import write_svg
+
+NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+def _parse(*points_and_lines, **options):
+    file = io.StringIO()
+    write_svg(file, *points_and_lines, **options)
+
+    return ElementTree.fromstring(file.getvalue())
+
+
+def _groups(root):
+    """ the points, lines and creases groups """
+
+    return root.findall(f"{NAMESPACE}g")
+
+
+def _coordinates(group, tag, names):
+    return [[float(element.get(name)) for name in names] for element in group.iter(f"{NAMESPACE}{tag}")]
+
+
+""" the image """
+
+def test_image():
+    root = _parse(Point(1, 2), Line(0, 1, -1), creases=Line(1, 0, -1), bounding_box=(-1, 0, 3, 4))
+    points, lines, creases = _groups(root)
+
+    assert root.get("width") == "360.00" and root.get("height") == "360.00"
+
+    # the page is upside down, with the top of the box at `y = 0`
+    assert _coordinates(points, "circle", ["cx", "cy"]) == [[180, 180]]
+    assert _coordinates(lines, "line", ["x1", "y1", "x2", "y2"]) == [[0, 270, 360, 270]]
+    assert _coordinates(creases, "line", ["x1", "y1", "x2", "y2"]) == [[180, 360, 180, 0]]
+
+def test_colours():
+    points, lines, creases = _groups(_parse(Point(0, 0), Line(0, 1, 0), creases=[Line(1, 0, 0)]))
+
+    assert (points.get("fill"), points.get("stroke")) == ("#d0d", "#000")
+    assert lines.get("stroke") == "#d0d"
+    assert creases.get("stroke") == "#abf"
+    assert creases.get("stroke-dasharray") is not None
+
+def test_same_box_as_show():
+    # a line from the bottom left to the top right of the square box `show` picks
+    root = _parse(Point(0, 0), Point(2, 2), Line(1, -1, 0))
+    _, lines, _ = _groups(root)
+
+    assert _coordinates(lines, "line", ["x1", "y1", "x2", "y2"]) == [[0, 360, 360, 0]]
+
+def test_width():
+    root = _parse(Line(1, 1, 0), bounding_box=(0, 0, 2, 1), width=100)
+
+    assert (root.get("width"), root.get("height")) == ("100.00", "50.00")
+
+def test_leaves_out_what_is_outside_the_box():
+    points, lines, creases = _groups(_parse(Point(5, 5), Line(1, 0, -5), creases=Line(0, 1, 0), bounding_box=(-1, -1, 1, 1)))
+
+    assert len(points) == 0
+    assert len(lines) == 0
+    assert len(creases) == 1
+
+def test_empty():
+    assert all(len(group) == 0 for group in _groups(_parse()))
+
+""" writing """
+
+def test_write_to_path(tmp_path):
+    path = tmp_path / "scene.svg"
+    write_svg(path, Point(0, 0), Line(1, 1, 0))
+
+    assert ElementTree.parse(path).getroot().tag == f"{NAMESPACE}svg"
+
+def test_written_in_blocks(monkeypatch):
+    monkeypatch.setattr(svg, "_BLOCK_SIZE", 2)
+    writes = []
+
+    class File:
+        def write(self, text):
+            writes.append(text)
+
+    lines = [Line(1, 0, k / 10) for k in range(5)]
+    write_svg(File(), *lines, *[Point(k / 10, 0) for k in range(5)], creases=lines)
+
+    # no single write holds more than a block of elements
+    assert max(len(re.findall("<(line|circle) ", text)) for text in writes) == 2
+    assert sum(len(re.findall("<line ", text)) for text in writes) == 10
+
+def test_invalid_width():
+    with pytest.raises(ValueError):
+        write_svg(io.StringIO(), Point(0, 0), width=0)
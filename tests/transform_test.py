@@ -0,0 +1,146 @@
+import copy
+import pickle
+import pytest
+import numpy as np
+from math import pi
+
+from src.origametry.line import Line
+from src.origametry.point import Point
+from src.origametry.reflect import reflect
+from src.origametry.line_array import LineArray
+from src.origametry.point_array import PointArray
+from src.origametry.transform import Transform
+
+CREASES = [Line(1, 0, -1), Line(1, 1, 0), Line(0.3, -2, 5)]
+POINTS = [Point(0, 0), Point(2, -3), Point(-1.5, 4)]
+LINES = [Line(0, 1, -2), Line(1, -1, 3), Line(2, 5, 0)]
+
+
+def _folded(element):
+    """ an element reflected across every crease in turn """
+
+    for crease in CREASES:
+        element = reflect(element, crease)
+
+    return element
+
+
+def _transform():
+    transform = Transform.identity()
+
+    for crease in CREASES:
+        transform = Transform.reflection(crease) @ transform
+
+    return transform
+
+
+""" construction """
+
+def test_reflection():
+    assert Transform.reflection(Line(1, 0, -1)).matrix == ((-1, 0, 2), (0, 1, 0), (0, 0, 1))
+
+def test_translation_and_rotation():
+    assert Transform.translation(1, 2).apply(Point(3, 4)) == Point(4, 6)
+    assert Transform.rotation(pi / 2).apply(Point(1, 0)) == Point(0, 1)
+    assert Transform.rotation(pi, Point(1, 1)).apply(Point(0, 0)) == Point(2, 2)
+
+@pytest.mark.parametrize("matrix", [
+    ((1, 0), (0, 1)),
+    ((1, 0, 0), (0, 1, 0), (1, 0, 1)),
+    ((1, 2, 0), (2, 4, 0), (0, 0, 1)),
+])
+def test_invalid_matrix(matrix):
+    with pytest.raises(ValueError):
+        Transform(matrix)
+
+""" composition """
+
+def test_composition_order():
+    # translate, then rotate about the origin
+    transform = Transform.rotation(pi / 2) @ Transform.translation(1, 0)
+
+    assert transform.apply(Point(0, 0)) == Point(0, 1)
+
+def test_fold_twice_is_identity():
+    fold = Transform.reflection(Line(1, 2, 3))
+
+    assert fold @ fold == Transform.identity()
+    assert fold.inverse == fold
+
+def test_inverse():
+    transform = Transform(((2, 1, 3), (0, 0.5, -1), (0, 0, 1)))
+
+    assert transform @ transform.inverse == Transform.identity()
+    assert transform.inverse @ transform == Transform.identity()
+
+def test_matmul_with_other_types():
+    with pytest.raises(TypeError):
+        Transform.identity() @ 2
+
+""" application """
+
+@pytest.mark.parametrize("point", POINTS)
+def test_point_matches_reflect(point):
+    assert _transform().apply(point) == _folded(point)
+
+@pytest.mark.parametrize("line", LINES)
+def test_line_matches_reflect(line):
+    assert _transform().apply(line) == _folded(line)
+
+def test_line_under_affine_map():
+    # a shear keeps points on lines, though not angles or distances
+    transform = Transform(((1, 2, 0), (0, 1, 1), (0, 0, 1)))
+    line = Line(Point(0, 0), Point(1, 1))
+
+    image = transform.apply(line)
+
+    assert transform.apply(Point(0, 0)).isOn(image)
+    assert transform.apply(Point(1, 1)).isOn(image)
+
+def test_point_array():
+    result = _transform().apply(PointArray(POINTS))
+
+    assert isinstance(result, PointArray)
+    assert result.to_points() == [_folded(point) for point in POINTS]
+
+def test_line_array():
+    result = _transform().apply(LineArray(LINES))
+
+    assert isinstance(result, LineArray)
+    assert result.to_lines() == [_folded(line) for line in LINES]
+
+def test_empty_arrays():
+    assert len(_transform().apply(PointArray([]))) == 0
+    assert len(_transform().apply(LineArray(np.zeros((0, 3))))) == 0
+
+def test_unsupported_element():
+    with pytest.raises(TypeError):
+        Transform.identity().apply((0, 0))
+
+""" immutability and equality """
+
+def test_immutable():
+    transform = Transform.identity()
+
+    with pytest.raises(AttributeError):
+        transform._matrix = None
+
+    with pytest.raises(AttributeError):
+        del transform._matrix
+
+def test_copies():
+    transform = _transform()
+
+    assert copy.copy(transform) is transform
+    assert copy.deepcopy(transform) is transform
+    assert pickle.loads(pickle.dumps(transform)) == transform
+
+def test_equality_and_hash():
+    transform = Transform.translation(1, 2)
+    close = Transform.translation(1 + 1e-12, 2)
+
+    assert transform == close
+    assert hash(transform) == hash(close)
+    assert transform != Transform.translation(2, 1)
+    assert transform != "transform"
+    assert repr(transform) == "Transform(((1.0, 0.0, 1.0), (0.0, 1.0, 2.0), (0.0, 0.0, 1.0)))"